@@ -420,11 +420,15 @@ def analysis_tab():
                 
                 # Scrape pages
                 scraper = WebScraper(config)
-                scraping_results = scraper.scrape_pages(pages_to_scrape)
-                
-                # Store scraping results in session state
-                st.session_state.scraping_results = scraping_results
-                st.session_state.scraping_summary = scraper.get_scraping_summary()
+                try:
+                    scraping_results = scraper.scrape_pages(pages_to_scrape)
+                    
+                    # Store scraping results in session state
+                    st.session_state.scraping_results = scraping_results
+                    st.session_state.scraping_summary = scraper.get_scraping_summary()
+                finally:
+                    # Shut down the parse pool and release connections and cache handles on every rerun
+                    scraper.close()
             else:
                 # Set empty results if Phase 2 is skipped
                 st.session_state.scraping_results = {}
@@ -462,6 +466,7 @@ def analysis_tab():
             if phase2_enabled or phase3_enabled:  # Only run if we have scraped content
                 status_text.text(f'💰 Specialized Analysis: Analyzing pricing strategy...')
                 
+                pricing_analyzer = None
                 try:
                     # Initialize pricing analyzer
                     pricing_analyzer = PricingAnalyzer(
@@ -503,6 +508,10 @@ def analysis_tab():
                     logger.error(f"Error during pricing analysis: {str(e)}")
                     st.warning(f"Pricing analysis failed: {str(e)} - continuing with available analysis")
                     st.session_state.pricing_analysis = None
+                finally:
+                    # Shut down the extraction pool's worker processes on every rerun
+                    if pricing_analyzer is not None:
+                        pricing_analyzer.close()
             else:
                 # Set empty results if prerequisite phases are skipped
                 st.session_state.pricing_analysis = None
@@ -564,12 +573,15 @@ def analysis_tab():
             if phase2_enabled or phase3_enabled:  # Only run if we have scraped content
                 status_text.text(f'🔮 Specialized Analysis: Analyzing competitor vision & roadmap...')
                 
+                vision_analyzer = None
                 try:
                     # Initialize vision analyzer
                     vision_analyzer = VisionAnalyzer(
                         api_key=config.openai_api_key,
                         model_name=config.model_name,
-                        logger=logger
+                        logger=logger,
+                        cache_path=config.vision_cache_path,
+                        cache_duration=config.get('cache_duration', 3600)
                     )
                     
                     # Get scraped content for vision analysis
@@ -606,6 +618,10 @@ def analysis_tab():
                     logger.error(f"Error during vision analysis: {str(e)}")
                     st.warning(f"Vision analysis failed: {str(e)} - continuing with available analysis")
                     st.session_state.vision_analysis = None
+                finally:
+                    # Release the insights cache connection on every rerun
+                    if vision_analyzer is not None:
+                        vision_analyzer.close()
             else:
                 # Set empty results if prerequisite phases are skipped
                 st.session_state.vision_analysis = None
@@ -658,6 +674,7 @@ def analysis_tab():
                 status_text.text(f'📱 Phase 5: Scraping social media content... ({current_phase}/{total_phases})')
                 progress_bar.progress(progress_percent)
                 
+                social_scraper = None
                 try:
                     # Initialize social media scraper
                     social_scraper = SocialMediaScraper(config)
@@ -697,6 +714,10 @@ def analysis_tab():
                     st.warning(f"Social media scraping failed: {str(e)} - continuing with available analysis")
                     st.session_state.social_media_results = {}
                     st.session_state.social_media_analysis = {}
+                finally:
+                    # Quit its drivers and shut down its parse pool and its web scraper's
+                    if social_scraper is not None:
+                        social_scraper.cleanup()
             else:
                 # Set empty results if Phase 5 is skipped
                 st.session_state.social_media_results = {}
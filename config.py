@@ -1,6 +1,6 @@
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 class Config:
     """Configuration management for the Competitive Analysis Tool"""
@@ -32,8 +32,14 @@ class Config:
             "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "max_pages_per_site": 10,
             "scraping_delay": 2.0,
+            "rate_limit_burst": 1,
             "bypass_robots_txt": False,  # Allow bypassing robots.txt for competitive analysis
             "respect_robots_txt": True,  # Deprecated - use bypass_robots_txt instead
+            "max_concurrent_requests": 10,
+            "max_connections_per_host": 4,
+            "scraper_cache_path": None,  # e.g. "data/scraper_cache.db" to keep scraped pages on disk (never pruned)
+            "scraper_redis_url": None,  # e.g. "redis://localhost:6379/0" to share the scraper cache
+            "keep_raw_html": False,  # Keep page HTML on extracted scrape results
             
             # Social Media Settings
             "social_platforms": [
@@ -56,6 +62,7 @@ class Config:
             "max_tokens": 8000,
             "temperature": 0.3,
             "analysis_chunks": 5,
+            "vision_cache_path": None,  # e.g. "data/vision_cache.db" to reuse AI vision insights across runs
             
             # Report Settings
             "report_formats": ["pdf", "json", "excel"],
@@ -142,6 +149,10 @@ class Config:
     def model_name(self) -> str:
         return self.config.get("model_name", "gpt-4")
     
+    @property
+    def vision_cache_path(self) -> Optional[str]:
+        return self.config.get("vision_cache_path")
+    
     @property
     def max_tokens(self) -> int:
         return self.config.get("max_tokens", 8000)
@@ -178,6 +189,30 @@ class Config:
     def scraping_delay(self) -> float:
         return self.config.get("scraping_delay", 2.0)
     
+    @property
+    def rate_limit_burst(self) -> int:
+        return self.config.get("rate_limit_burst", 1)
+    
+    @property
+    def max_concurrent_requests(self) -> int:
+        return self.config.get("max_concurrent_requests", 10)
+    
+    @property
+    def max_connections_per_host(self) -> int:
+        return self.config.get("max_connections_per_host", 4)
+    
+    @property
+    def scraper_cache_path(self) -> Optional[str]:
+        return self.config.get("scraper_cache_path")
+    
+    @property
+    def scraper_redis_url(self) -> Optional[str]:
+        return self.config.get("scraper_redis_url")
+    
+    @property
+    def keep_raw_html(self) -> bool:
+        return self.config.get("keep_raw_html", False)
+    
     def create_directories(self) -> None:
         """Create necessary directories if they don't exist"""
         directories = [self.output_directory, self.data_directory]
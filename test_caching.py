@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Test script for the scraper's page caches
+"""
+
+import sys
+import os
+import tempfile
+import time
+import types
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from requests.structures import CaseInsensitiveDict
+from utils import scraper as scraper_module
+from utils.scraper import WebScraper
+
+
+class _PageResponse:
+    """Streamed response stub for a 200 HTML page"""
+    status_code = 200
+    encoding = 'utf-8'
+
+    def __init__(self, html: str):
+        self.body = html.encode('utf-8')
+        self.headers = CaseInsensitiveDict({'Content-Type': 'text/html; charset=utf-8'})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        yield self.body
+
+
+class _NotModifiedResponse:
+    """Streamed response stub for a 304 Not Modified reply"""
+    status_code = 304
+    headers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+
+def _make_scraper(**settings) -> WebScraper:
+    """Scraper with no request delay and robots.txt checks disabled"""
+    config = types.SimpleNamespace(scraping_delay=0, **settings)
+    scraper = WebScraper(config)
+    scraper._can_fetch = lambda url: True
+    return scraper
+
+
+def _store(scraper: WebScraper, url: str) -> str:
+    """Cache a page for url and return its cache key"""
+    cache_key = scraper._get_cache_key(url)
+    scraper._store_in_cache(cache_key, {'url': url}, {'ETag': f'"{url}"'})
+    return cache_key
+
+
+def test_cache_lru_eviction():
+    """The in-memory cache keeps the max_cache_entries most recently used pages"""
+    print("🧪 Testing LRU eviction")
+    scraper = _make_scraper(max_cache_entries=2)
+
+    first = _store(scraper, 'https://example.com/1')
+    second = _store(scraper, 'https://example.com/2')
+
+    # Touching the first page makes the second the least recently used
+    assert scraper._lookup_cache_entry(first) is not None
+    third = _store(scraper, 'https://example.com/3')
+
+    assert list(scraper.cache) == [first, third]
+    assert scraper._lookup_cache_entry(second) is None
+    scraper.close()
+    print("✅ LRU eviction keeps the most recently used pages")
+
+
+def test_cache_expiry_and_revalidation():
+    """Expired entries are revalidated with their validators and renewed on a 304"""
+    print("🧪 Testing expiry and 304 revalidation")
+    scraper = _make_scraper(cache_duration=60)
+    url = 'https://example.com/pricing'
+    cache_key = _store(scraper, url)
+
+    entry = scraper.cache[cache_key]
+    assert scraper._is_cache_valid(entry)
+
+    entry['timestamp'] = time.time() - 120
+    assert not scraper._is_cache_valid(entry)
+
+    sent_headers = {}
+
+    def get(request_url, headers=None, **kwargs):
+        sent_headers.update(headers or {})
+        return _NotModifiedResponse()
+
+    scraper.session.get = get
+
+    assert scraper.scrape_page(url) == {'url': url}
+    assert sent_headers == {'If-None-Match': f'"{url}"'}
+    assert scraper._is_cache_valid(scraper.cache[cache_key])
+    scraper.close()
+    print("✅ 304 responses renew the cached page")
+
+
+def test_invalidate_prefix_across_tiers():
+    """invalidate() evicts every page under a URL prefix from memory, disk and Redis"""
+    print("🧪 Testing invalidate prefix semantics")
+    try:
+        import fakeredis
+    except ImportError:
+        fakeredis = None
+        print("⚠️  fakeredis not installed, checking memory and disk tiers only")
+
+    settings = {}
+    if fakeredis is not None and scraper_module.REDIS_AVAILABLE:
+        server = fakeredis.FakeServer()
+        from_url = scraper_module.redis.Redis.from_url
+        scraper_module.redis.Redis.from_url = staticmethod(
+            lambda url, **kwargs: fakeredis.FakeRedis(server=server)
+        )
+        settings['scraper_redis_url'] = 'redis://test'
+
+    try:
+        _check_invalidate_prefix(settings)
+    finally:
+        if 'scraper_redis_url' in settings:
+            scraper_module.redis.Redis.from_url = from_url
+    print("✅ invalidate() evicts the prefix from every tier")
+
+
+def _check_invalidate_prefix(settings):
+    """Cache pages under and beside a prefix, invalidate it and check every tier"""
+    with tempfile.TemporaryDirectory() as directory:
+        settings['scraper_cache_path'] = os.path.join(directory, 'scraper_cache.db')
+        scraper = _make_scraper(**settings)
+
+        evicted_urls = ['https://example.com/a', 'https://example.com/a/b', 'https://example.com/ab']
+        kept_urls = ['https://example.com/b', 'https://example.org/a']
+        for url in evicted_urls + kept_urls:
+            _store(scraper, url)
+
+        # Each evicted page leaves both the memory and the disk tier
+        assert scraper.invalidate('https://example.com/a') == 2 * len(evicted_urls)
+        assert sorted(entry['data']['url'] for entry in scraper.cache.values()) == sorted(kept_urls)
+
+        # A fresh scraper only finds the kept pages in the shared and persistent tiers
+        other = _make_scraper(**settings)
+        for url in evicted_urls:
+            assert other._lookup_cache_entry(other._get_cache_key(url)) is None
+        for url in kept_urls:
+            assert other._lookup_cache_entry(other._get_cache_key(url))['data'] == {'url': url}
+
+        if 'scraper_redis_url' in settings:
+            shared = scraper._get_shared_cache()
+            indexed_urls = sorted(
+                member.rsplit(b'\0', 1)[0].decode('utf-8')
+                for member in shared.zrange(scraper_module._REDIS_URL_INDEX, 0, -1)
+            )
+            assert indexed_urls == sorted(kept_urls)
+
+        other.close()
+        scraper.close()
+
+
+def test_raw_and_extracted_pages_cached_apart():
+    """Raw (extract_content=False) scrapes always get raw_html, whatever was cached or fetched first"""
+    print("🧪 Testing raw and extracted cache entries")
+    url = 'https://example.com/pricing'
+    html = '<html><body><p>' + 'Plans start at $49 per month. ' * 50 + '</p></body></html>'
+    requested = []
+
+    def get(request_url, **kwargs):
+        requested.append(request_url)
+        return _PageResponse(html)
+
+    scraper = _make_scraper()
+    scraper.session.get = get
+
+    extracted = scraper.scrape_page(url)
+    assert 'raw_html' not in extracted
+    assert scraper.scrape_page(url, extract_content=False)['raw_html'] == html
+    assert len(requested) == 2
+
+    # Both entries are now served from the cache
+    assert scraper.scrape_page(url) is extracted
+    assert scraper.scrape_page(url, extract_content=False)['raw_html'] == html
+    assert len(requested) == 2
+    scraper.close()
+
+    # Pages fetched by the fallback methods keep the mode they were requested in
+    scraper = _make_scraper()
+    scraper._can_fetch = lambda url: False
+    scraper._get_fallback_session = lambda headers: types.SimpleNamespace(get=get)
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    try:
+        assert scraper.scrape_page(url, extract_content=False)['raw_html'] == html
+        assert scraper._lookup_cache_entry(scraper._get_cache_key(url)) is None
+        assert 'raw_html' not in scraper.scrape_page(url)
+        assert scraper.scrape_page(url, extract_content=False)['raw_html'] == html
+    finally:
+        time.sleep = sleep
+    scraper.close()
+    print("✅ Raw and extracted pages are cached apart")
+
+
+if __name__ == "__main__":
+    test_cache_lru_eviction()
+    test_cache_expiry_and_revalidation()
+    test_invalidate_prefix_across_tiers()
+    test_raw_and_extracted_pages_cached_apart()
+    print("\n🎉 Caching tests completed!")
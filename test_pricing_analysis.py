@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test script for the AI pricing insights
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.pricing_analysis import PricingAnalyzer
+
+
+def test_pricing_insights_shape():
+    """AI pricing insights are mapped into strategy, positioning and recommendations"""
+    print("🧪 Testing pricing insight shape")
+    analyzer = PricingAnalyzer(api_key='')
+    analyzer.ai_engine.analyze_with_prompt = lambda **kwargs: {
+        'content': 'Premium pricing', 'key_insights': ['insight'], 'recommendations': ['recommendation']
+    }
+
+    insights = analyzer._generate_pricing_insights(
+        'Test Competitor', {'prices_found': [], 'billing_models': set(), 'pricing_pages': []},
+        {}, {}, {'fees_detected': [], 'categories': {}}
+    )
+    assert insights == {
+        'pricing_strategy': {'summary': 'Premium pricing', 'key_insights': ['insight']},
+        'competitive_positioning': {},
+        'recommendations': ['recommendation']
+    }
+    analyzer.close()
+    print("✅ Pricing insights are mapped")
+
+
+if __name__ == "__main__":
+    test_pricing_insights_shape()
+    print("\n🎉 Pricing analysis tests completed!")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the web scraper's content extraction and robots.txt handling
+"""
+
+import sys
+import os
+from urllib.robotparser import RobotFileParser
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from utils.scraper import WebScraper
+
+
+def test_link_and_image_columns():
+    """Links and images are extracted as parallel columns"""
+    print("🧪 Testing link and image columns")
+    scraper = WebScraper()
+    soup = BeautifulSoup(
+        '<a href="/pricing" title="Plans">Pricing</a><a name="anchor">No href</a>'
+        '<img src="/logo.png" alt="Logo"><img src="/hero.jpg" title="Hero">',
+        'html.parser'
+    )
+
+    assert scraper._extract_links(soup.find_all('a')) == {
+        'text': ['Pricing'], 'href': ['/pricing'], 'title': ['Plans']
+    }
+    assert scraper._extract_images(soup.find_all('img')) == {
+        'src': ['/logo.png', '/hero.jpg'], 'alt': ['Logo', ''], 'title': ['', 'Hero']
+    }
+    scraper.close()
+    print("✅ Links and images use text/href/title and src/alt/title columns")
+
+
+def test_robots_status_handling():
+    """robots.txt statuses are handled as RobotFileParser.read() handles them"""
+    print("🧪 Testing robots.txt status handling")
+    url = 'https://example.com/pricing'
+    # An empty robots.txt allows everything, so only the status can disallow
+    expected = {200: True, 401: False, 403: False, 404: True, 500: False, 503: False}
+
+    for status_code, allowed in expected.items():
+        rp = RobotFileParser()
+        WebScraper._parse_robots(rp, status_code, '')
+        assert rp.can_fetch('*', url) == allowed, status_code
+    print("✅ Server errors disallow fetching, like an unread robots.txt")
+
+
+if __name__ == "__main__":
+    test_link_and_image_columns()
+    test_robots_status_handling()
+    print("\n🎉 Scraper tests completed!")
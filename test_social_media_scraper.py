@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for the social media scraper's selector chains
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from utils.social_media_scraper import _SelectorChain, _REVIEW_SITE_REVIEWS, _TWITTER_POSTS
+
+
+def _first_matching_selector(selectors, soup, min_length):
+    """The selector-by-selector loop _SelectorChain replaces"""
+    for selector in selectors:
+        hits = []
+        for element in soup.select(selector):
+            text = element.get_text(strip=True)
+            if text and len(text) > min_length:
+                hits.append((element, text))
+        if hits:
+            return hits
+    return []
+
+
+def test_selector_chain_earliest_selector():
+    """_SelectorChain returns what trying its selectors one after another returns"""
+    print("🧪 Testing selector chain semantics")
+    pages = [
+        # Elements matching several selectors are credited to the earliest one
+        '<div class="review-content review-text">A long shared review</div>'
+        '<div class="review-text">Another long review</div>'
+        '<div class="review-content">Content-only review</div>',
+        # Too-short matches of an earlier selector fall through to a later one
+        '<div class="review-text">ok</div><div class="review-body">A review body long enough</div>',
+        # Nested matches keep document order
+        '<div class="review-content"><p class="review-text">Nested review text here</p></div>',
+        '<div data-testid="tweet">A tweet that is long enough</div><p class="tweet-text">Legacy tweet</p>',
+        '<p>No reviews on this page</p>'
+    ]
+    chains = {**_REVIEW_SITE_REVIEWS, 'twitter': _TWITTER_POSTS}
+    selectors = {
+        'g2': ['div[data-testid="review-text"]', '.review-text', '.review-content'],
+        'capterra': ['.review-text', '.review-content', '.review-body'],
+        'trustpilot': ['.review-content', '.review-text', '[data-service-review-text-typography]'],
+        'getapp': ['.review-text', '.review-content', '.review-body'],
+        'twitter': ['[data-testid="tweet"]', '.tweet-text', '.TweetTextSize', '.tweet-content']
+    }
+
+    for html in pages:
+        soup = BeautifulSoup(html, 'html.parser')
+        for name, chain in chains.items():
+            for min_length in (0, 10):
+                expected = _first_matching_selector(selectors[name], soup, min_length)
+                assert chain.matches(soup, min_length) == expected, (name, html)
+
+    ad_hoc = _SelectorChain(['.missing', '.review-text'])
+    soup = BeautifulSoup(pages[0], 'html.parser')
+    assert [text for _, text in ad_hoc.matches(soup, 0)] == ['A long shared review', 'Another long review']
+    print("✅ Selector chains match the selector-by-selector loop")
+
+
+if __name__ == "__main__":
+    test_selector_chain_earliest_selector()
+    print("\n🎉 Social media scraper tests completed!")
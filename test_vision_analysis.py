@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for the AI vision insights and their cache
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.vision_analysis import VisionAnalyzer
+
+# AI response sections the insights are mapped from
+SAMPLE_CONTENT = (
+    "7. THREAT ASSESSMENT:\n"
+    "   - Direct pricing pressure\n"
+    "   • AI-driven disruption\n"
+    "8. PREDICTIVE TIMELINE:\n"
+    "   - Q1: mobile app launch\n"
+)
+
+EXPECTED_INSIGHTS = {
+    'vision_insights': {'summary': SAMPLE_CONTENT, 'key_insights': ['insight']},
+    'strategic_predictions': {'predictive_timeline': ['Q1: mobile app launch']},
+    'competitive_threats': ['Direct pricing pressure', 'AI-driven disruption'],
+    'recommendations': ['recommendation']
+}
+
+
+def _stub_ai_engine(analyzer: VisionAnalyzer) -> list:
+    """Answer the analyzer's AI requests with SAMPLE_CONTENT and return the list of calls made"""
+    calls = []
+
+    def analyze_with_prompt(**kwargs):
+        calls.append(kwargs)
+        return {'content': SAMPLE_CONTENT, 'key_insights': ['insight'], 'recommendations': ['recommendation']}
+
+    analyzer.ai_engine.analyze_with_prompt = analyze_with_prompt
+    return calls
+
+
+def test_vision_insights_shape():
+    """AI vision insights are mapped into the report sections"""
+    print("🧪 Testing vision insight shape")
+    analyzer = VisionAnalyzer(api_key='')
+    _stub_ai_engine(analyzer)
+
+    insights = analyzer._generate_vision_insights('Test Competitor', {}, {}, {}, {}, {}, {})
+    assert insights == EXPECTED_INSIGHTS
+    analyzer.close()
+    print("✅ Vision insights are mapped")
+
+
+def test_vision_insights_cached_mapped():
+    """A repeated analysis is served the mapped insights from the cache"""
+    print("🧪 Testing vision insights cache")
+    with tempfile.TemporaryDirectory() as directory:
+        analyzer = VisionAnalyzer(api_key='', cache_path=os.path.join(directory, 'vision_cache.db'))
+        calls = _stub_ai_engine(analyzer)
+
+        for _ in range(2):
+            insights = analyzer._generate_vision_insights('Test Competitor', {}, {}, {}, {}, {}, {})
+            assert insights == EXPECTED_INSIGHTS
+
+        # The second run is served from the cache
+        assert len(calls) == 1
+        analyzer.close()
+    print("✅ Vision insights are cached after mapping")
+
+
+if __name__ == "__main__":
+    test_vision_insights_shape()
+    test_vision_insights_cached_mapped()
+    print("\n🎉 Vision analysis tests completed!")
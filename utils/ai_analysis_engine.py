@@ -138,8 +138,23 @@ class AIAnalysisEngine:
         
         return recommendations[:10]
     
-    def _make_openai_request(self, prompt: str, max_tokens: int = 4000) -> Dict[str, Any]:
-        """Make a request to OpenAI API with error handling"""
+    def _make_openai_request(
+        self,
+        prompt: str,
+        max_tokens: int = 4000,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.3
+    ) -> Dict[str, Any]:
+        """
+        Make a request to OpenAI API with error handling
+        
+        Args:
+            prompt: User message content
+            max_tokens: Maximum tokens in the completion
+            system_prompt: Optional system message; keep it byte-identical across
+                calls so OpenAI's automatic prompt caching can reuse the prefix
+            temperature: Sampling temperature
+        """
         try:
             self._rate_limit()
             
@@ -151,11 +166,11 @@ class AIAnalysisEngine:
             response = client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are a senior business analyst and competitive intelligence expert."},
+                    {"role": "system", "content": system_prompt or "You are a senior business analyst and competitive intelligence expert."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=max_tokens,
-                temperature=0.3,
+                temperature=temperature,
                 top_p=1.0,
                 frequency_penalty=0.0,
                 presence_penalty=0.0
@@ -193,6 +208,53 @@ class AIAnalysisEngine:
                 'raw_response': None
             }
     
+    def analyze_with_prompt(
+        self,
+        prompt: str,
+        context: Dict[str, Any],
+        analysis_type: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 4000
+    ) -> Dict[str, Any]:
+        """
+        Run an analysis from a pre-built prompt
+        
+        Args:
+            prompt: Prompt (or per-competitor payload when system_prompt is given)
+            context: Analysis context the prompt was built from
+            analysis_type: Label for the analysis being performed
+            system_prompt: Optional shared prefix sent as the system message
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in the completion
+            
+        Returns:
+            Dictionary with the analysis content, insights and recommendations
+        """
+        self.logger.info(f"Starting {analysis_type} analysis for {context.get('competitor_name', 'unknown')}")
+        
+        response = self._make_openai_request(
+            prompt,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            temperature=temperature
+        )
+        
+        if not response['success']:
+            raise Exception(f"{analysis_type} analysis failed: {response['error']}")
+        
+        content = response['content']
+        
+        return {
+            'analysis_type': analysis_type,
+            'content': content,
+            'key_insights': self._extract_key_insights(content),
+            'recommendations': self._extract_recommendations(content),
+            'processing_time': response['processing_time'],
+            'tokens_used': response['tokens_used'],
+            'cost_estimate': response['cost_estimate']
+        }
+    
     def analyze_pricing(self, context: AnalysisContext) -> AnalysisResult:
         """Perform comprehensive pricing analysis"""
         self.logger.info(f"Starting pricing analysis for {context.competitor_name}")
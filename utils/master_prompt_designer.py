@@ -7,7 +7,7 @@ and competitive positioning prompts.
 """
 
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import logging
@@ -169,17 +169,21 @@ ANALYSIS PRINCIPLES:
 Your analysis should be thorough, data-driven, and actionable for C-level decision making.
 """
     
-    def create_pricing_analysis_prompt(self, context: AnalysisContext) -> str:
-        """Create comprehensive pricing analysis prompt"""
+    def create_pricing_analysis_prefix(self) -> str:
+        """
+        Create the static part of the pricing analysis prompt.
         
+        The prefix contains no competitor-specific data so it stays byte-identical
+        across competitors, which lets the provider's prompt cache reuse it.
+        """
         base_prompt = self.create_base_system_prompt()
         
-        pricing_prompt = f"""
+        return f"""
 {base_prompt}
 
 PRICING ANALYSIS TASK:
-Analyze the pricing structure of {context.competitor_name} and provide a comprehensive breakdown 
-with strategic implications for StoreHub.
+Analyze the pricing structure of the competitor described in COMPETITOR DATA and provide a 
+comprehensive breakdown with strategic implications for StoreHub.
 
 ANALYSIS FRAMEWORK:
 {chr(10).join(f"• {component}" for component in self.analysis_frameworks['pricing_analysis']['components'])}
@@ -187,15 +191,6 @@ ANALYSIS FRAMEWORK:
 EVALUATION CRITERIA:
 {chr(10).join(f"• {criteria}" for criteria in self.analysis_frameworks['pricing_analysis']['evaluation_criteria'])}
 
-COMPETITOR DATA:
-Competitor: {context.competitor_name}
-Website: {context.competitor_url}
-Target Country: {context.target_country}
-Analysis Date: {context.analysis_date}
-
-DISCOVERED PAGES:
-{json.dumps(context.discovered_pages, indent=2)}
-
 REQUIRED ANALYSIS OUTPUT:
 1. HARDWARE ANALYSIS:
    - Hardware model identification (proprietary vs. commodity)
@@ -238,7 +233,23 @@ FORMAT: Provide a structured analysis with clear sections, specific data points,
 and actionable recommendations. Use bullet points for clarity and include 
 confidence levels for your assessments.
 """
-        return pricing_prompt
+    
+    def create_pricing_analysis_payload(self, context: AnalysisContext) -> str:
+        """Create the competitor-specific part of the pricing analysis prompt"""
+        return f"""
+COMPETITOR DATA:
+Competitor: {context.competitor_name}
+Website: {context.competitor_url}
+Target Country: {context.target_country}
+Analysis Date: {context.analysis_date}
+
+DISCOVERED PAGES:
+{json.dumps(context.discovered_pages, indent=2)}
+"""
+    
+    def create_pricing_analysis_prompt(self, context: AnalysisContext) -> str:
+        """Create comprehensive pricing analysis prompt"""
+        return self.create_pricing_analysis_prefix() + self.create_pricing_analysis_payload(context)
     
     def create_monetization_strategy_prompt(self, context: AnalysisContext) -> str:
         """Create monetization strategy analysis prompt"""
@@ -319,17 +330,21 @@ strategic insights, and specific recommendations for StoreHub's competitive resp
 """
         return monetization_prompt
     
-    def create_vision_roadmap_prompt(self, context: AnalysisContext) -> str:
-        """Create vision and roadmap inference prompt"""
+    def create_vision_roadmap_prefix(self) -> str:
+        """
+        Create the static part of the vision and roadmap inference prompt.
         
+        Like the pricing prefix, it holds no competitor-specific data so the
+        provider's prompt cache can reuse it across competitors.
+        """
         base_prompt = self.create_base_system_prompt()
         
-        vision_prompt = f"""
+        return f"""
 {base_prompt}
 
 VISION & ROADMAP INFERENCE TASK:
-Analyze {context.competitor_name}'s strategic direction and predict future moves 
-based on available signals, with implications for StoreHub's strategic planning.
+Analyze the strategic direction of the competitor described in COMPETITOR DATA and predict 
+future moves based on available signals, with implications for StoreHub's strategic planning.
 
 ANALYSIS FRAMEWORK:
 Data Sources for Inference:
@@ -338,17 +353,6 @@ Data Sources for Inference:
 Prediction Areas:
 {chr(10).join(f"• {area}" for area in self.analysis_frameworks['vision_analysis']['prediction_areas'])}
 
-COMPETITOR DATA:
-Competitor: {context.competitor_name}
-Website: {context.competitor_url}
-Target Country: {context.target_country}
-Analysis Date: {context.analysis_date}
-
-DISCOVERED CONTENT:
-Blog/News Pages: {len(context.discovered_pages.get('blog', []))} pages
-Careers Pages: {len(context.discovered_pages.get('careers', []))} pages
-About Pages: {len(context.discovered_pages.get('about', []))} pages
-
 REQUIRED ANALYSIS OUTPUT:
 1. STRATEGIC VISION ANALYSIS:
    - Company mission and vision statements
@@ -407,7 +411,25 @@ REQUIRED ANALYSIS OUTPUT:
 FORMAT: Provide evidence-based predictions with confidence levels, 
 strategic implications, and specific recommendations for StoreHub's response strategy.
 """
-        return vision_prompt
+    
+    def create_vision_roadmap_payload(self, context: AnalysisContext) -> str:
+        """Create the competitor-specific part of the vision and roadmap prompt"""
+        return f"""
+COMPETITOR DATA:
+Competitor: {context.competitor_name}
+Website: {context.competitor_url}
+Target Country: {context.target_country}
+Analysis Date: {context.analysis_date}
+
+DISCOVERED CONTENT:
+Blog/News Pages: {len(context.discovered_pages.get('blog', []))} pages
+Careers Pages: {len(context.discovered_pages.get('careers', []))} pages
+About Pages: {len(context.discovered_pages.get('about', []))} pages
+"""
+    
+    def create_vision_roadmap_prompt(self, context: AnalysisContext) -> str:
+        """Create vision and roadmap inference prompt"""
+        return self.create_vision_roadmap_prefix() + self.create_vision_roadmap_payload(context)
     
     def create_competitive_positioning_prompt(self, context: AnalysisContext) -> str:
         """Create competitive positioning analysis prompt"""
@@ -810,8 +832,12 @@ data-driven insights, and specific actionable recommendations for each departmen
         
         return self.create_monetization_strategy_prompt(mock_context)
     
-    def get_vision_analysis_prompt(self, competitor_name: str, analysis_context: Dict[str, Any]) -> str:
-        """Get vision analysis prompt for the VisionAnalyzer"""
+    def get_pricing_analysis_prompt_parts(self, competitor_name: str, analysis_context: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Get the pricing analysis prompt for the PricingAnalyzer as (prefix, payload).
+        
+        The prefix is shared by every competitor; only the payload varies.
+        """
         # Create a mock AnalysisContext from the provided data
         mock_context = AnalysisContext(
             competitor_name=competitor_name,
@@ -824,7 +850,50 @@ data-driven insights, and specific actionable recommendations for each departmen
             categorized_complaints=analysis_context.get('categorized_complaints', [])
         )
         
-        return self.create_vision_roadmap_prompt(mock_context)
+        payload = self.create_pricing_analysis_payload(mock_context)
+        payload += f"""
+EXTRACTED PRICING SIGNALS:
+{json.dumps(analysis_context, indent=2, default=str)}
+"""
+        return self.create_pricing_analysis_prefix(), payload
+    
+    def get_pricing_analysis_prompt(self, competitor_name: str, analysis_context: Dict[str, Any]) -> str:
+        """Get pricing analysis prompt for the PricingAnalyzer"""
+        prefix, payload = self.get_pricing_analysis_prompt_parts(competitor_name, analysis_context)
+        return prefix + payload
+    
+    def get_vision_analysis_prompt_parts(self, competitor_name: str, analysis_context: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Get the vision analysis prompt for the VisionAnalyzer as (prefix, payload).
+        
+        The payload carries every analysis section, so one request covers them all.
+        """
+        # Create a mock AnalysisContext from the provided data
+        mock_context = AnalysisContext(
+            competitor_name=competitor_name,
+            competitor_url=analysis_context.get('competitor_url', ''),
+            target_country=analysis_context.get('country_context', {}).get('country', 'US'),
+            analysis_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            discovered_pages=analysis_context.get('discovered_pages', {}),
+            scraped_content=analysis_context.get('scraped_content', []),
+            complaint_analysis=analysis_context.get('complaint_analysis', {}),
+            categorized_complaints=analysis_context.get('categorized_complaints', [])
+        )
+        
+        payload = self.create_vision_roadmap_payload(mock_context)
+        for section in ('roadmap_analysis', 'technology_analysis', 'market_analysis',
+                        'hiring_analysis', 'partnership_analysis'):
+            if analysis_context.get(section):
+                payload += f"""
+{section.replace('_', ' ').upper()}:
+{json.dumps(analysis_context[section], indent=2, default=str)}
+"""
+        return self.create_vision_roadmap_prefix(), payload
+    
+    def get_vision_analysis_prompt(self, competitor_name: str, analysis_context: Dict[str, Any]) -> str:
+        """Get vision analysis prompt for the VisionAnalyzer"""
+        prefix, payload = self.get_vision_analysis_prompt_parts(competitor_name, analysis_context)
+        return prefix + payload
     
     def validate_context(self, context: AnalysisContext) -> bool:
         """Validate analysis context for completeness"""
@@ -9,14 +9,188 @@ This module provides comprehensive pricing analysis functionality including:
 - Comparative pricing insights
 """
 
+import io
 import json
+import os
+import pickle
 import re
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from datetime import datetime
 from utils.ai_analysis_engine import AIAnalysisEngine
 from utils.master_prompt_designer import MasterPromptDesigner
 
+class PriceHit(NamedTuple):
+    """A price found on a page"""
+    value: str
+    currency: str
+    context: str
+
+
+class KeywordMention(NamedTuple):
+    """A hardware or software keyword found on a page"""
+    keyword: str
+    context: str
+
+
+class FeeMention(NamedTuple):
+    """A possible hidden fee indicator found on a page"""
+    type: str
+    context: str
+
+
+# Minimum number of pages before per-page extraction is spread across processes
+PARALLEL_PAGE_THRESHOLD = 8
+
+
+class _PricingPageExtractor:
+    """
+    Per-page pricing extraction, built from plain pattern tables so process
+    pool workers can rebuild it without the analyzer's AI components.
+    """
+    
+    def __init__(self, currency_patterns: Dict[str, str], pricing_keywords: List[str],
+                 billing_patterns: Dict[str, str], hidden_fee_indicators: List[str]):
+        self.currency_patterns = currency_patterns
+        self.pricing_keywords = pricing_keywords
+        self.billing_patterns = billing_patterns
+        self.hidden_fee_indicators = hidden_fee_indicators
+        
+        # Fused alternation: each price is matched once and tagged by its group name
+        self._currency_re = re.compile(
+            '|'.join(f'(?P<{currency}>{pattern})' for currency, pattern in self.currency_patterns.items()),
+            re.IGNORECASE
+        )
+        
+        # Relevance gate: one case-insensitive scan that stops at the first keyword
+        self._pricing_keyword_re = re.compile(
+            '|'.join(re.escape(keyword) for keyword in self.pricing_keywords),
+            re.IGNORECASE
+        )
+        
+        # Fused alternation: the name of the group that matched is the billing model
+        self._billing_model_re = re.compile(
+            '|'.join(f'(?P<{model}>{pattern})' for model, pattern in self.billing_patterns.items()),
+            re.IGNORECASE
+        )
+    
+    def extract_page(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract pricing data from a single page, or None if it is not pricing-related."""
+        # Skip if not a pricing-related page (before paying for the lowercase copy)
+        if not self._pricing_keyword_re.search(page['content']):
+            return None
+        
+        content = page['content'].lower()
+        
+        page_data = {
+            'prices_found': [],
+            'pricing_pages': [{
+                'url': page.get('url', ''),
+                'title': page.get('title', ''),
+                'category': page.get('category', 'unknown')
+            }],
+            'billing_models': set(),
+            'hardware_mentions': [],
+            'software_mentions': [],
+            'fee_mentions': []
+        }
+        
+        # Extract currency and prices
+        self._extract_prices_from_content(content, page_data)
+        
+        # Extract pricing models and tiers
+        self._extract_pricing_models(content, page_data)
+        
+        # Extract hardware/software mentions
+        self._extract_hardware_software_mentions(content, page_data)
+        
+        # Extract fee mentions
+        self._extract_fee_mentions(content, page_data)
+        
+        return page_data
+    
+    def _extract_prices_from_content(self, content: str, pricing_data: Dict[str, Any]) -> None:
+        """Extract price values from content."""
+        for match in self._currency_re.finditer(content):
+            context = self._extract_price_context(content, match.start(), match.end())
+            pricing_data['prices_found'].append(PriceHit(match.group(), match.lastgroup, context))
+    
+    def _extract_price_context(self, content: str, start: int, end: int) -> str:
+        """Extract context around a price mention at content[start:end]."""
+        # Get surrounding context (50 characters before and after)
+        start = max(0, start - 50)
+        end = min(len(content), end + 50)
+        
+        return content[start:end].strip()
+    
+    def _extract_pricing_models(self, content: str, pricing_data: Dict[str, Any]) -> None:
+        """Extract pricing models and billing patterns."""
+        billing_models = pricing_data['billing_models']
+        
+        # One scan over the page; stop once every model has been confirmed
+        for match in self._billing_model_re.finditer(content):
+            billing_models.add(match.lastgroup)
+            if len(billing_models) == len(self.billing_patterns):
+                break
+    
+    def _extract_hardware_software_mentions(self, content: str, pricing_data: Dict[str, Any]) -> None:
+        """Extract hardware and software pricing mentions."""
+        hardware_keywords = [
+            'terminal', 'ipad', 'tablet', 'hardware', 'device', 'pos system',
+            'card reader', 'cash drawer', 'receipt printer', 'barcode scanner'
+        ]
+        
+        software_keywords = [
+            'software', 'app', 'application', 'subscription', 'saas',
+            'license', 'plan', 'tier', 'package', 'feature'
+        ]
+        
+        for keyword in hardware_keywords:
+            if keyword in content:
+                context = self._extract_keyword_context(content, keyword)
+                pricing_data['hardware_mentions'].append(KeywordMention(keyword, context))
+        
+        for keyword in software_keywords:
+            if keyword in content:
+                context = self._extract_keyword_context(content, keyword)
+                pricing_data['software_mentions'].append(KeywordMention(keyword, context))
+    
+    def _extract_keyword_context(self, content: str, keyword: str) -> str:
+        """Extract context around a keyword mention (content and keyword are already lowercase)."""
+        keyword_index = content.find(keyword)
+        if keyword_index == -1:
+            return ""
+        
+        start = max(0, keyword_index - 30)
+        end = min(len(content), keyword_index + len(keyword) + 30)
+        
+        return content[start:end].strip()
+    
+    def _extract_fee_mentions(self, content: str, pricing_data: Dict[str, Any]) -> None:
+        """Extract mentions of additional fees."""
+        for indicator in self.hidden_fee_indicators:
+            if indicator in content:
+                context = self._extract_keyword_context(content, indicator)
+                pricing_data['fee_mentions'].append(FeeMention(indicator, context))
+
+
+# Extractor used by process pool workers, set once per worker by the initializer
+_worker_extractor: Optional[_PricingPageExtractor] = None
+
+
+def _init_pricing_worker(pattern_tables: Tuple[Any, ...]) -> None:
+    """Process pool initializer: build one page extractor per worker from the parent's pattern tables."""
+    global _worker_extractor
+    _worker_extractor = _PricingPageExtractor(*pattern_tables)
+
+
+def _analyze_page(page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Process pool task: extract pricing data from one page."""
+    return _worker_extractor.extract_page(page)
+
+
 class PricingAnalyzer:
     """
     Advanced pricing analysis engine that extracts and analyzes competitor pricing
@@ -41,13 +215,13 @@ class PricingAnalyzer:
         self.prompt_designer = MasterPromptDesigner()
         
         # Pricing pattern recognition
+        # Ordered so that prefixed forms (S$, US$) win over the bare $ form
         self.currency_patterns = {
-            'USD': r'\$[\d,]+(?:\.\d{2})?',
-            'EUR': r'€[\d,]+(?:\.\d{2})?',
-            'GBP': r'£[\d,]+(?:\.\d{2})?',
-            'SGD': r'S\$[\d,]+(?:\.\d{2})?',
-            'MYR': r'RM[\d,]+(?:\.\d{2})?',
-            'general': r'[\$€£¥₹][\d,]+(?:\.\d{2})?|[\d,]+(?:\.\d{2})?\s*(?:USD|EUR|GBP|SGD|MYR|dollars?|euros?|pounds?)'
+            'SGD': r'S\$[\d,]+(?:\.\d{2})?|[\d,]+(?:\.\d{2})?\s*SGD',
+            'MYR': r'RM[\d,]+(?:\.\d{2})?|[\d,]+(?:\.\d{2})?\s*(?:MYR|ringgit)',
+            'USD': r'(?:US)?\$[\d,]+(?:\.\d{2})?|[\d,]+(?:\.\d{2})?\s*(?:USD|dollars?)',
+            'EUR': r'€[\d,]+(?:\.\d{2})?|[\d,]+(?:\.\d{2})?\s*(?:EUR|euros?)',
+            'GBP': r'£[\d,]+(?:\.\d{2})?|[\d,]+(?:\.\d{2})?\s*(?:GBP|pounds?)'
         }
         
         self.pricing_keywords = [
@@ -64,12 +238,66 @@ class PricingAnalyzer:
             'maintenance', 'transaction', 'processing', 'payment', 'gateway',
             'integration', 'customization', 'migration', 'data import'
         ]
+        
+        self.billing_patterns = {
+            'monthly': r'(?:per month|monthly|\/month|\/mo)',
+            'annual': r'(?:per year|yearly|annually|\/year|\/yr)',
+            'per_terminal': r'(?:per terminal|per device|per pos)',
+            'per_location': r'(?:per location|per store|per site)',
+            'per_user': r'(?:per user|per employee|per staff)',
+            'percentage': r'(?:% of sales|percentage of revenue|transaction fee)',
+            'one_time': r'(?:one-time|onetime|upfront|initial cost)'
+        }
+        
+        self._page_extractor = _PricingPageExtractor(
+            self.currency_patterns, self.pricing_keywords, self.billing_patterns, self.hidden_fee_indicators
+        )
+        
+        self.hardware_indicators = {
+            'proprietary': ['proprietary', 'custom', 'branded', 'exclusive'],
+            'commodity': ['ipad', 'tablet', 'android', 'standard']
+        }
+        self._hardware_indicator_to_category = {
+            indicator: category
+            for category, indicators in self.hardware_indicators.items()
+            for indicator in indicators
+        }
+        self._hardware_indicator_re = re.compile(
+            '|'.join(re.escape(indicator) for indicator in self._hardware_indicator_to_category)
+        )
+        
+        self.fee_categorization = {
+            'setup': ['setup', 'implementation', 'onboarding', 'installation'],
+            'transaction': ['transaction', 'processing', 'payment', 'gateway'],
+            'support': ['support', 'maintenance', 'premium'],
+            'integration': ['integration', 'customization', 'migration'],
+            'training': ['training', 'education', 'consultation']
+        }
+        
+        # Reverse index and single alternation so each fee mention is
+        # categorized in one scan instead of one scan per keyword
+        self._fee_keyword_to_category = {
+            keyword: category
+            for category, keywords in self.fee_categorization.items()
+            for keyword in keywords
+        }
+        self._fee_category_order = {
+            category: index for index, category in enumerate(self.fee_categorization)
+        }
+        self._fee_keyword_re = re.compile(
+            '|'.join(re.escape(keyword) for keyword in
+                     sorted(self._fee_keyword_to_category, key=len, reverse=True))
+        )
+        
+        # Process pool for extracting large page sets, started on first use
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
     
     def analyze_competitor_pricing(
         self, 
         competitor_name: str,
         scraped_content: List[Dict[str, Any]],
-        country_context: Optional[Dict[str, Any]] = None
+        country_context: Optional[Dict[str, Any]] = None,
+        analysis_timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Perform comprehensive pricing analysis on competitor data.
@@ -78,12 +306,17 @@ class PricingAnalyzer:
             competitor_name: Name of the competitor being analyzed
             scraped_content: List of scraped page content
             country_context: Country-specific context for pricing analysis
+            analysis_timestamp: ISO timestamp to stamp the result with; batch
+                callers pass one shared value, otherwise the current time is used
             
         Returns:
             Comprehensive pricing analysis results
         """
         self.logger.info(f"Starting pricing analysis for {competitor_name}")
         
+        if analysis_timestamp is None:
+            analysis_timestamp = datetime.now().isoformat()
+        
         try:
             # Extract pricing data from content
             pricing_data = self._extract_pricing_data(scraped_content)
@@ -104,7 +337,7 @@ class PricingAnalyzer:
             # Compile comprehensive analysis
             analysis_result = {
                 'competitor': competitor_name,
-                'analysis_date': datetime.now().isoformat(),
+                'analysis_date': analysis_timestamp,
                 'currency_detected': pricing_data.get('primary_currency', 'USD'),
                 'hardware_pricing': hardware_analysis,
                 'software_pricing': software_analysis,
@@ -122,7 +355,38 @@ class PricingAnalyzer:
             
         except Exception as e:
             self.logger.error(f"Error in pricing analysis: {str(e)}", exc_info=True)
-            return self._generate_error_response(competitor_name, str(e))
+            return self._generate_error_response(competitor_name, str(e), analysis_timestamp)
+    
+    def analyze_competitor_pricing_batch(
+        self,
+        items: List[Tuple[str, List[Dict[str, Any]], Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform pricing analysis for several competitors in one run.
+        
+        Every competitor is sent with the same byte-identical prompt prefix, so
+        after the first request the provider serves the prefix from its cache.
+        
+        Args:
+            items: List of (competitor_name, scraped_content, country_context) tuples
+            
+        Returns:
+            List of pricing analysis results in the same order as items
+        """
+        self.logger.info(f"Starting batch pricing analysis for {len(items)} competitors")
+        
+        # One timestamp for the whole batch
+        analysis_timestamp = datetime.now().isoformat()
+        
+        results = []
+        for competitor_name, scraped_content, country_context in items:
+            results.append(
+                self.analyze_competitor_pricing(
+                    competitor_name, scraped_content, country_context, analysis_timestamp
+                )
+            )
+        
+        return results
     
     def _extract_pricing_data(self, scraped_content: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extract pricing information from scraped content."""
@@ -130,142 +394,86 @@ class PricingAnalyzer:
             'prices_found': [],
             'pricing_pages': [],
             'primary_currency': None,
-            'billing_models': [],
+            'billing_models': set(),
             'pricing_tiers': [],
             'hardware_mentions': [],
             'software_mentions': [],
             'fee_mentions': []
         }
         
-        for page in scraped_content:
-            if not page.get('content'):
-                continue
-                
-            content = page['content'].lower()
-            
-            # Skip if not a pricing-related page
-            if not any(keyword in content for keyword in self.pricing_keywords):
+        pages = [page for page in scraped_content if page.get('content')]
+        
+        # Pages are independent, so large page sets are spread across processes
+        if len(pages) >= PARALLEL_PAGE_THRESHOLD:
+            page_results = self._extract_pages_in_parallel(pages)
+        else:
+            page_results = [self._extract_page_pricing_data(page) for page in pages]
+        
+        for page_data in page_results:
+            if page_data is None:
                 continue
-                
-            pricing_data['pricing_pages'].append({
-                'url': page.get('url', ''),
-                'title': page.get('title', ''),
-                'category': page.get('category', 'unknown')
-            })
-            
-            # Extract currency and prices
-            self._extract_prices_from_content(content, pricing_data)
-            
-            # Extract pricing models and tiers
-            self._extract_pricing_models(content, pricing_data)
-            
-            # Extract hardware/software mentions
-            self._extract_hardware_software_mentions(content, pricing_data)
-            
-            # Extract fee mentions
-            self._extract_fee_mentions(content, pricing_data)
+            pricing_data['billing_models'].update(page_data.pop('billing_models'))
+            for key, values in page_data.items():
+                pricing_data[key].extend(values)
         
         # Determine primary currency
         pricing_data['primary_currency'] = self._determine_primary_currency(pricing_data['prices_found'])
         
         return pricing_data
     
-    def _extract_prices_from_content(self, content: str, pricing_data: Dict[str, Any]) -> None:
-        """Extract price values from content."""
-        for currency, pattern in self.currency_patterns.items():
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                pricing_data['prices_found'].append({
-                    'value': match,
-                    'currency': currency,
-                    'context': self._extract_price_context(content, match)
-                })
-    
-    def _extract_price_context(self, content: str, price: str) -> str:
-        """Extract context around a price mention."""
-        price_index = content.lower().find(price.lower())
-        if price_index == -1:
-            return ""
-        
-        # Get surrounding context (50 characters before and after)
-        start = max(0, price_index - 50)
-        end = min(len(content), price_index + len(price) + 50)
-        
-        return content[start:end].strip()
+    def _extract_pages_in_parallel(self, pages: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Extract pricing data from pages using the process pool, in page order."""
+        extract_pool = self._get_extract_pool()
+        if extract_pool is not None:
+            try:
+                return list(extract_pool.map(_analyze_page, pages, chunksize=4))
+            except BrokenProcessPool as e:
+                self.logger.warning(f"Parallel pricing extraction unavailable, falling back to serial: {str(e)}")
+                self._discard_extract_pool(extract_pool)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                # Pages that cannot be sent to a worker leave the pool itself usable
+                self.logger.warning(f"Pages could not be sent to the pricing pool, falling back to serial: {str(e)}")
+        
+        return [self._extract_page_pricing_data(page) for page in pages]
     
-    def _extract_pricing_models(self, content: str, pricing_data: Dict[str, Any]) -> None:
-        """Extract pricing models and billing patterns."""
-        billing_patterns = {
-            'monthly': r'(?:per month|monthly|\/month|\/mo)',
-            'annual': r'(?:per year|yearly|annually|\/year|\/yr)',
-            'per_terminal': r'(?:per terminal|per device|per pos)',
-            'per_location': r'(?:per location|per store|per site)',
-            'per_user': r'(?:per user|per employee|per staff)',
-            'percentage': r'(?:% of sales|percentage of revenue|transaction fee)',
-            'one_time': r'(?:one-time|onetime|upfront|initial cost)'
-        }
-        
-        for model, pattern in billing_patterns.items():
-            if re.search(pattern, content, re.IGNORECASE):
-                pricing_data['billing_models'].append(model)
+    def _get_extract_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the extraction pool, starting it on first use (None if processes are unavailable)."""
+        if self._extract_pool is None:
+            try:
+                self._extract_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    initializer=_init_pricing_worker,
+                    initargs=((self.currency_patterns, self.pricing_keywords,
+                               self.billing_patterns, self.hidden_fee_indicators),)
+                )
+            except OSError as e:
+                self.logger.warning(f"Parallel pricing extraction unavailable, falling back to serial: {str(e)}")
+        return self._extract_pool
     
-    def _extract_hardware_software_mentions(self, content: str, pricing_data: Dict[str, Any]) -> None:
-        """Extract hardware and software pricing mentions."""
-        hardware_keywords = [
-            'terminal', 'ipad', 'tablet', 'hardware', 'device', 'pos system',
-            'card reader', 'cash drawer', 'receipt printer', 'barcode scanner'
-        ]
-        
-        software_keywords = [
-            'software', 'app', 'application', 'subscription', 'saas',
-            'license', 'plan', 'tier', 'package', 'feature'
-        ]
-        
-        for keyword in hardware_keywords:
-            if keyword in content:
-                context = self._extract_keyword_context(content, keyword)
-                pricing_data['hardware_mentions'].append({
-                    'keyword': keyword,
-                    'context': context
-                })
-        
-        for keyword in software_keywords:
-            if keyword in content:
-                context = self._extract_keyword_context(content, keyword)
-                pricing_data['software_mentions'].append({
-                    'keyword': keyword,
-                    'context': context
-                })
+    def _discard_extract_pool(self, extract_pool: ProcessPoolExecutor) -> None:
+        """Drop a broken extraction pool so the next batch starts a fresh one."""
+        if self._extract_pool is extract_pool:
+            self._extract_pool = None
+            extract_pool.shutdown(wait=False)
     
-    def _extract_keyword_context(self, content: str, keyword: str) -> str:
-        """Extract context around a keyword mention."""
-        keyword_index = content.lower().find(keyword.lower())
-        if keyword_index == -1:
-            return ""
-        
-        start = max(0, keyword_index - 30)
-        end = min(len(content), keyword_index + len(keyword) + 30)
-        
-        return content[start:end].strip()
+    def close(self) -> None:
+        """Shut down the extraction pool."""
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown()
+            self._extract_pool = None
     
-    def _extract_fee_mentions(self, content: str, pricing_data: Dict[str, Any]) -> None:
-        """Extract mentions of additional fees."""
-        for indicator in self.hidden_fee_indicators:
-            if indicator in content:
-                context = self._extract_keyword_context(content, indicator)
-                pricing_data['fee_mentions'].append({
-                    'type': indicator,
-                    'context': context
-                })
+    def _extract_page_pricing_data(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract pricing data from a single page, or None if it is not pricing-related."""
+        return self._page_extractor.extract_page(page)
     
-    def _determine_primary_currency(self, prices: List[Dict[str, Any]]) -> str:
+    def _determine_primary_currency(self, prices: List[PriceHit]) -> str:
         """Determine the primary currency used in pricing."""
         if not prices:
             return 'USD'
         
         currency_counts = {}
         for price in prices:
-            currency = price['currency']
+            currency = price.currency
             currency_counts[currency] = currency_counts.get(currency, 0) + 1
         
         return max(currency_counts.items(), key=lambda x: x[1])[0] if currency_counts else 'USD'
@@ -281,20 +489,22 @@ class PricingAnalyzer:
             'confidence_score': 0.0
         }
         
+        # Mention contexts are cut from lowercased page content, so no further lowering is needed
         hardware_mentions = pricing_data.get('hardware_mentions', [])
         
         if hardware_mentions:
-            # Analyze device types
-            proprietary_indicators = ['proprietary', 'custom', 'branded', 'exclusive']
-            commodity_indicators = ['ipad', 'tablet', 'android', 'standard']
+            # Analyze device types: one scan per context covers both indicator groups
+            indicator_counts = {category: 0 for category in self.hardware_indicators}
+            for mention in hardware_mentions:
+                categories_hit = {
+                    self._hardware_indicator_to_category[match.group()]
+                    for match in self._hardware_indicator_re.finditer(mention.context)
+                }
+                for category in categories_hit:
+                    indicator_counts[category] += 1
             
-            proprietary_count = sum(1 for mention in hardware_mentions 
-                                  if any(indicator in mention['context'].lower() 
-                                        for indicator in proprietary_indicators))
-            
-            commodity_count = sum(1 for mention in hardware_mentions 
-                                if any(indicator in mention['context'].lower() 
-                                      for indicator in commodity_indicators))
+            proprietary_count = indicator_counts['proprietary']
+            commodity_count = indicator_counts['commodity']
             
             if proprietary_count > commodity_count:
                 hardware_analysis['model_type'] = 'proprietary'
@@ -304,7 +514,7 @@ class PricingAnalyzer:
                 hardware_analysis['model_type'] = 'mixed'
             
             hardware_analysis['confidence_score'] = min(1.0, len(hardware_mentions) * 0.2)
-            hardware_analysis['devices_mentioned'] = [m['keyword'] for m in hardware_mentions]
+            hardware_analysis['devices_mentioned'] = [m.keyword for m in hardware_mentions]
         
         return hardware_analysis
     
@@ -367,28 +577,23 @@ class PricingAnalyzer:
         
         fee_mentions = pricing_data.get('fee_mentions', [])
         
-        fee_categorization = {
-            'setup': ['setup', 'implementation', 'onboarding', 'installation'],
-            'transaction': ['transaction', 'processing', 'payment', 'gateway'],
-            'support': ['support', 'maintenance', 'premium'],
-            'integration': ['integration', 'customization', 'migration'],
-            'training': ['training', 'education', 'consultation']
-        }
-        
         for mention in fee_mentions:
-            fee_type = mention['type']
-            context = mention['context']
+            fee_type = mention.type
+            context = mention.context
             
-            # Categorize the fee
-            for category, keywords in fee_categorization.items():
-                if any(keyword in fee_type or keyword in context.lower() for keyword in keywords):
-                    hidden_fees['categories'][category].append({
-                        'type': fee_type,
-                        'context': context
-                    })
-                    break
+            # Categorize the fee; the first category in declaration order wins
+            categories_hit = {
+                self._fee_keyword_to_category[match.group()]
+                for match in self._fee_keyword_re.finditer(f"{fee_type} {context}")
+            }
+            if categories_hit:
+                category = min(categories_hit, key=self._fee_category_order.__getitem__)
+                hidden_fees['categories'][category].append({
+                    'type': fee_type,
+                    'context': context
+                })
             
-            hidden_fees['fees_detected'].append(mention)
+            hidden_fees['fees_detected'].append(mention._asdict())
         
         # Determine risk level
         total_fees = len(hidden_fees['fees_detected'])
@@ -418,7 +623,7 @@ class PricingAnalyzer:
                 'pricing_data_summary': {
                     'total_prices_found': len(pricing_data.get('prices_found', [])),
                     'primary_currency': pricing_data.get('primary_currency'),
-                    'billing_models': pricing_data.get('billing_models', []),
+                    'billing_models': sorted(pricing_data.get('billing_models', [])),
                     'pricing_pages_count': len(pricing_data.get('pricing_pages', []))
                 },
                 'hardware_analysis': hardware_analysis,
@@ -431,19 +636,29 @@ class PricingAnalyzer:
                 'country_context': country_context or {}
             }
             
-            # Get pricing analysis prompt
-            pricing_prompt = self.prompt_designer.get_pricing_analysis_prompt(
+            # Get pricing analysis prompt split into the shared prefix and the
+            # per-competitor payload so the provider can cache the prefix
+            prompt_prefix, prompt_payload = self.prompt_designer.get_pricing_analysis_prompt_parts(
                 competitor_name, analysis_context
             )
             
             # Generate AI insights
             ai_response = self.ai_engine.analyze_with_prompt(
-                prompt=pricing_prompt,
+                prompt=prompt_payload,
                 context=analysis_context,
-                analysis_type="pricing_strategy"
+                analysis_type="pricing_strategy",
+                system_prompt=prompt_prefix,
+                temperature=0
             )
             
-            return ai_response
+            return {
+                'pricing_strategy': {
+                    'summary': ai_response.get('content', ''),
+                    'key_insights': ai_response.get('key_insights', [])
+                },
+                'competitive_positioning': {},
+                'recommendations': ai_response.get('recommendations', [])
+            }
             
         except Exception as e:
             self.logger.error(f"Error generating AI pricing insights: {str(e)}")
@@ -466,15 +681,18 @@ class PricingAnalyzer:
         prices = pricing_data.get('prices_found', [])
         billing_models = pricing_data.get('billing_models', [])
         
-        for price in prices:
-            context = price.get('context', '').lower()
-            
-            if any(model in billing_models for model in ['one_time']):
-                cost_breakdown['upfront_costs'].append(price)
-            elif any(model in billing_models for model in ['monthly', 'annual']):
-                cost_breakdown['recurring_costs'].append(price)
-            elif 'percentage' in billing_models:
-                cost_breakdown['variable_costs'].append(price)
+        # The classification depends only on the billing models, so decide it once
+        if 'one_time' in billing_models:
+            cost_bucket = 'upfront_costs'
+        elif 'monthly' in billing_models or 'annual' in billing_models:
+            cost_bucket = 'recurring_costs'
+        elif 'percentage' in billing_models:
+            cost_bucket = 'variable_costs'
+        else:
+            cost_bucket = None
+        
+        if cost_bucket:
+            cost_breakdown[cost_bucket] = [price._asdict() for price in prices]
         
         return cost_breakdown
     
@@ -522,11 +740,16 @@ class PricingAnalyzer:
         
         return scores
     
-    def _generate_error_response(self, competitor_name: str, error_message: str) -> Dict[str, Any]:
+    def _generate_error_response(
+        self,
+        competitor_name: str,
+        error_message: str,
+        analysis_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Generate error response for failed analysis."""
         return {
             'competitor': competitor_name,
-            'analysis_date': datetime.now().isoformat(),
+            'analysis_date': analysis_timestamp or datetime.now().isoformat(),
             'error': error_message,
             'status': 'failed',
             'hardware_pricing': {'error': 'Analysis failed'},
@@ -545,36 +768,45 @@ class PricingAnalyzer:
         
         competitor = analysis_result.get('competitor', 'Unknown')
         
-        report = f"""
-# Pricing Analysis Report: {competitor}
-
-## Executive Summary
-- **Analysis Date**: {analysis_result.get('analysis_date', 'Unknown')}
-- **Primary Currency**: {analysis_result.get('currency_detected', 'Unknown')}
-- **Overall Confidence**: {analysis_result.get('confidence_scores', {}).get('overall_confidence', 0):.2f}
-
-## Hardware Pricing Analysis
-- **Model Type**: {analysis_result.get('hardware_pricing', {}).get('model_type', 'Unknown')}
-- **Cost Structure**: {analysis_result.get('hardware_pricing', {}).get('cost_structure', 'Unknown')}
-- **Devices Mentioned**: {', '.join(analysis_result.get('hardware_pricing', {}).get('devices_mentioned', []))}
-
-## Software Pricing Analysis
-- **Pricing Model**: {analysis_result.get('software_pricing', {}).get('pricing_model', 'Unknown')}
-- **Billing Frequency**: {analysis_result.get('software_pricing', {}).get('billing_frequency', 'Unknown')}
-- **Billing Axis**: {analysis_result.get('software_pricing', {}).get('billing_axis', 'Unknown')}
-
-## Hidden Fees Analysis
-- **Risk Level**: {analysis_result.get('hidden_fees', {}).get('risk_level', 'Unknown')}
-- **Fees Detected**: {len(analysis_result.get('hidden_fees', {}).get('fees_detected', []))}
-
-## AI-Generated Insights
-{self._format_ai_insights(analysis_result.get('pricing_strategy', {}))}
-
-## Recommendations
-{self._format_recommendations(analysis_result.get('pricing_recommendations', []))}
-"""
+        # Resolve each section once up front instead of inside the template
+        hardware = analysis_result.get('hardware_pricing') or {}
+        software = analysis_result.get('software_pricing') or {}
+        hidden_fees = analysis_result.get('hidden_fees') or {}
+        confidence_scores = analysis_result.get('confidence_scores') or {}
+        ai_insights = self._format_ai_insights(analysis_result.get('pricing_strategy') or {})
+        recommendations = self._format_recommendations(analysis_result.get('pricing_recommendations') or [])
+        
+        report = io.StringIO()
+        write = report.write
+        
+        write(f"\n# Pricing Analysis Report: {competitor}\n\n")
+        
+        write("## Executive Summary\n")
+        write(f"- **Analysis Date**: {analysis_result.get('analysis_date', 'Unknown')}\n")
+        write(f"- **Primary Currency**: {analysis_result.get('currency_detected', 'Unknown')}\n")
+        write(f"- **Overall Confidence**: {confidence_scores.get('overall_confidence', 0):.2f}\n\n")
+        
+        write("## Hardware Pricing Analysis\n")
+        write(f"- **Model Type**: {hardware.get('model_type', 'Unknown')}\n")
+        write(f"- **Cost Structure**: {hardware.get('cost_structure', 'Unknown')}\n")
+        write(f"- **Devices Mentioned**: {', '.join(hardware.get('devices_mentioned', []))}\n\n")
+        
+        write("## Software Pricing Analysis\n")
+        write(f"- **Pricing Model**: {software.get('pricing_model', 'Unknown')}\n")
+        write(f"- **Billing Frequency**: {software.get('billing_frequency', 'Unknown')}\n")
+        write(f"- **Billing Axis**: {software.get('billing_axis', 'Unknown')}\n\n")
+        
+        write("## Hidden Fees Analysis\n")
+        write(f"- **Risk Level**: {hidden_fees.get('risk_level', 'Unknown')}\n")
+        write(f"- **Fees Detected**: {len(hidden_fees.get('fees_detected', []))}\n\n")
+        
+        write("## AI-Generated Insights\n")
+        write(f"{ai_insights}\n\n")
+        
+        write("## Recommendations\n")
+        write(f"{recommendations}\n")
         
-        return report
+        return report.getvalue()
     
     def _format_ai_insights(self, insights: Dict[str, Any]) -> str:
         """Format AI insights for the report."""
@@ -1,17 +1,244 @@
 import requests
 import time
 import random
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Any, Tuple
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree, html as lxml_html
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple, Coroutine, Union, Callable, Iterator, IO
 import logging
 import re
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 import hashlib
 import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
 from utils.logger import log_execution_time, log_function_call
 
+# Response headers kept on scraped results (the cache validators and content metadata)
+_KEPT_HEADERS = ('Content-Type', 'Content-Length', 'Content-Encoding', 'ETag', 'Last-Modified')
+
+# Tags _extract_content reads; the soup only builds subtrees rooted at these
+_CONTENT_STRAINER = SoupStrainer([
+    'title', 'meta', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'a', 'img', 'ul', 'ol', 'li', 'script'
+])
+
+# Elements whose strings BeautifulSoup's get_text() skips, and those also left out of clean_text
+_NON_TEXT_TAGS = ('script', 'style', 'rt', 'rp')
+_NON_CONTENT_TAGS = ('script', 'style', 'nav', 'header', 'footer')
+
+# Runs of whitespace collapsed by _extract_clean_text
+_WS_RE = re.compile(r'\s+')
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)')
+
+# Optional linear-time regex engine for the patterns scanned over whole pages
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def _compile_linear(pattern: str) -> Any:
+    """Compile a pattern with RE2 when installed (no pathological backtracking), else with re"""
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Contact patterns shared by every page
+_EMAIL_RE = _compile_linear(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = _compile_linear(r'(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}')
+
+# Advertise only the content codings urllib3 can decode here (br/zstd when their packages are installed)
+_ACCEPT_ENCODING = ', '.join(ACCEPT_ENCODING.split(','))
+
+# Optional fast JSON parser for JSON-LD blocks
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional fast non-cryptographic hash for cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional Redis client for a cache shared across processes and hosts
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Redis keys holding cached pages, and the channel announcing URL prefixes to evict
+_REDIS_KEY_PREFIX = 'scraper:page:'
+_INVALIDATION_CHANNEL = 'scraper:invalidate'
+
+# Redis sorted set indexing cached pages by URL: members are b'<url>\0<cache key>', all with
+# score 0, so the pages under a URL prefix are one lexicographic range
+_REDIS_URL_INDEX = 'scraper:urls'
+
+# Optional async HTTP client (HTTP/2 capable) for concurrent scraping
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# httpx only speaks HTTP/2 with the optional h2 package; without it the async client stays on HTTP/1.1
+try:
+    import h2
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Session headers the async client does not inherit: the hop-by-hop connection headers, which
+# HTTP/2 forbids and httpx manages itself, and Accept-Encoding (end-to-end, but httpx should
+# advertise exactly the codings it can decode)
+_HOP_BY_HOP_HEADERS = ('connection', 'keep-alive')
+_ASYNC_EXCLUDED_HEADERS = _HOP_BY_HOP_HEADERS + ('accept-encoding',)
+
+# Header sets tried in turn by _try_fallback_methods, built once
+_FALLBACK_BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'no-cache'
+}
+_FALLBACK_HEADERS = tuple(dict(_FALLBACK_BASE_HEADERS, **{'User-Agent': user_agent}) for user_agent in (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:120.0) Gecko/20100101 Firefox/120.0'
+))
+_MOBILE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive'
+}
+_MINIMAL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; WebScraper/1.0; +http://www.webscraper.com)',
+    'Accept': 'text/html',
+    'Connection': 'keep-alive'
+}
+
+
+def _is_html_content_type(content_type: str) -> bool:
+    """Whether a (lowercased) Content-Type is worth parsing as HTML; a missing type is assumed to be HTML"""
+    return not content_type or 'html' in content_type
+
+
+def _header_charset(content_type: str) -> Optional[str]:
+    """The charset declared in a Content-Type header, if any"""
+    match = _CHARSET_RE.search(content_type)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=64)
+def _currency_re(country_code: str) -> Any:
+    """Compiled currency amount pattern for a country, built once per country"""
+    from .country_localization import country_localization
+    
+    # Get country-specific currency symbols
+    country_symbols = country_localization.get_currency_symbols(country_code)
+    
+    # Build currency pattern from country symbols
+    if country_symbols:
+        escaped_symbols = [re.escape(symbol) for symbol in country_symbols]
+        return _compile_linear(f'[{"".join(escaped_symbols)}][\\d,.]+')
+    return _compile_linear(r'[$€£¥₹][\d,.]+')
+
+
+@lru_cache(maxsize=64)
+def _pricing_terms(country_code: str) -> Tuple[List[str], re.Pattern, Dict[str, List[str]]]:
+    """A country's pricing terms with their compiled single-scan matcher (see WebScraper._compile_pricing_terms)"""
+    from .country_localization import country_localization
+    
+    pricing_terms = country_localization.get_localized_pricing_patterns(country_code)
+    return (pricing_terms,) + WebScraper._compile_pricing_terms(pricing_terms)
+
+
+def _dump_json_text(record: Any) -> str:
+    """Serialize a record as a JSON string"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(record, default=str)
+
+
+def _load_json(payload: Union[str, bytes]) -> Any:
+    """Parse a JSON string or bytes payload"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _dump_json_line(record: Dict[str, Any]) -> bytes:
+    """Serialize one record as an NDJSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, default=str) + b'\n'
+    return json.dumps(record, default=str).encode('utf-8') + b'\n'
+
+
+class _DomainState:
+    """Per-domain rate limiting state: a token bucket refilled on monotonic time, and the request count"""
+    __slots__ = ('tokens', 'last_refill', 'count')
+    
+    def __init__(self, capacity: float):
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.count = 0
+
+
+class _FetchedResponse(NamedTuple):
+    """Response read by the async client, exposing what _process_response uses"""
+    status_code: int
+    headers: Any
+    content: bytes
+    text: str
+
+
+# Concurrent scrapes of at least this many pages parse HTML in a process pool
+PARALLEL_PARSE_THRESHOLD = 8
+
+# Scraper used by parse pool workers, set once per worker by the initializer
+_worker_scraper: Optional['WebScraper'] = None
+
+
+def _init_parse_worker(config) -> None:
+    """Process pool initializer: build one scraper per worker."""
+    global _worker_scraper
+    _worker_scraper = WebScraper(config)
+
+
+def _parse_page(url: str, response: _FetchedResponse, country_code: str) -> Dict[str, Any]:
+    """Process pool task: parse one fetched page and extract its content."""
+    return _worker_scraper._process_response(url, response, True, country_code)
+
+
 class WebScraper:
     """
     Robust web scraping system with error handling, rate limiting, and content extraction
@@ -26,6 +253,12 @@ class WebScraper:
     - Content caching
     """
     
+    # Tags collected in a single traversal by _extract_content
+    _BUCKETED_TAGS = ['title', 'meta', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'a', 'img', 'script', 'ul', 'ol']
+    
+    # Tags sharing a bucket, so they stay in document order together
+    _TAG_BUCKETS = {'ul': 'lists', 'ol': 'lists'}
+    
     def __init__(self, config=None):
         """
         Initialize the web scraper
@@ -36,8 +269,11 @@ class WebScraper:
         self.config = config
         self.logger = logging.getLogger("competitive_analysis")
         
-        # Initialize session with realistic headers
+        # Initialize session with realistic headers and pooled keep-alive connections
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=16, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -52,34 +288,73 @@ class WebScraper:
         self.max_pages_per_site = getattr(config, 'max_pages_per_site', 100)
         self.bypass_robots_txt = getattr(config, 'bypass_robots_txt', False)
         
-        # Content cache
-        self.cache = {}
+        # Content cache (LRU-bounded, entries also expire after cache_duration); the lock
+        # also covers evictions made from the Redis invalidation listener thread
+        self.cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.cache_duration = getattr(config, 'cache_duration', 3600)  # 1 hour
+        self.max_cache_entries = getattr(config, 'max_cache_entries', 500)
+        
+        # Whether extracted results also carry the decoded page HTML (raw_html)
+        self.keep_raw_html = getattr(config, 'keep_raw_html', False)
+        
+        # Largest response body read per page
+        self.max_content_bytes = getattr(config, 'max_content_bytes', 5 * 1024 * 1024)
+        
+        # Persistent cache (sqlite), also holds validators for conditional GETs
+        self.cache_db_path = getattr(config, 'scraper_cache_path', None)
+        self._cache_db = None
+        self._cache_db_lock = threading.Lock()
+        
+        # Shared cache (Redis) consulted between memory and disk; its entries expire after cache_duration
+        self.redis_url = getattr(config, 'scraper_redis_url', None)
+        self._redis = None
+        self._redis_lock = threading.Lock()
+        self._invalidation_thread = None
         
-        # Rate limiting
-        self.last_request_time = {}
-        self.request_count = {}
+        # Fallback sessions by user agent, kept open for reuse by _try_fallback_scraping
+        self._fallback_sessions: Dict[str, requests.Session] = {}
         
-        # Robots.txt cache
+        # Rate limiting: domain -> _DomainState, one token per base_delay with bursts up to rate_limit_burst
+        self._domain_state = {}
+        self.rate_limit_burst = getattr(config, 'rate_limit_burst', 1)
+        
+        # Robots.txt cache: base URL -> (parser or None, fetched_at)
         self.robots_cache = {}
+        self.robots_cache_ttl = getattr(config, 'robots_cache_ttl', 86400)  # 24 hours
         
-        # Initialize session headers
-        self._update_session_headers()
-    
-    def _update_session_headers(self):
-        """Update session with rotating user agent and realistic headers"""
-        self.session.headers.update({
-            'User-Agent': random.choice(self.user_agents),
+        # Concurrent scraping
+        self.max_concurrent_requests = getattr(config, 'max_concurrent_requests', 10)
+        self.max_connections_per_host = getattr(config, 'max_connections_per_host', 4)
+        self._domain_semaphores = {}
+        self._robots_locks = {}
+        
+        # Process pool for HTML parsing, started on the first large batch and reused until close()
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Precomputed header sets, one per user agent, rotated by _update_session_headers
+        base_headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': _ACCEPT_ENCODING,
             'Connection': 'keep-alive',
+            'Keep-Alive': 'timeout=85',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'no-cache'
-        })
+        }
+        self._header_variants = [dict(base_headers, **{'User-Agent': ua}) for ua in self.user_agents]
+        self._ua_idx = random.randrange(len(self._header_variants))
+        
+        # Initialize session headers
+        self._update_session_headers()
+    
+    def _update_session_headers(self) -> None:
+        """Update session with rotating user agent and realistic headers"""
+        self.session.headers.update(self._header_variants[self._ua_idx])
+        self._ua_idx = (self._ua_idx + 1) % len(self._header_variants)
     
     def _can_fetch(self, url: str) -> bool:
         """Check if URL can be fetched according to robots.txt (if enabled)"""
@@ -89,70 +364,396 @@ class WebScraper:
             return True
             
         try:
-            parsed = urlparse(url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
+            base_url = self._robots_base_url(url)
+            
+            if not self._robots_fresh(base_url):
+                self.robots_cache[base_url] = (self._fetch_robots(base_url), time.time())
             
-            if base_url not in self.robots_cache:
-                robots_url = urljoin(base_url, '/robots.txt')
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-                try:
-                    rp.read()
-                    self.robots_cache[base_url] = rp
-                except:
-                    # If robots.txt can't be read, assume we can fetch
-                    self.robots_cache[base_url] = None
+            return self._robots_allow(base_url, url)
             
-            robots = self.robots_cache[base_url]
-            if robots:
-                can_fetch = robots.can_fetch(self.session.headers.get('User-Agent', '*'), url)
-                if not can_fetch:
-                    self.logger.debug(f"Robots.txt disallows fetching {url}")
-                return can_fetch
+        except Exception as e:
+            self.logger.debug(f"Error checking robots.txt for {url}: {str(e)}")
+            return True
+    
+    async def _can_fetch_async(self, client: 'httpx.AsyncClient', url: str) -> bool:
+        """
+        Async counterpart of _can_fetch, fetching robots.txt over the shared client
+        
+        A lock per host makes concurrent first requests to the same origin share
+        one robots.txt fetch.
+        """
+        if self.bypass_robots_txt:
+            self.logger.debug(f"Bypassing robots.txt check for {url}")
             return True
+        
+        try:
+            base_url = self._robots_base_url(url)
+            
+            if not self._robots_fresh(base_url):
+                async with self._robots_locks.setdefault(base_url, asyncio.Lock()):
+                    if not self._robots_fresh(base_url):
+                        self.robots_cache[base_url] = (await self._fetch_robots_async(client, base_url), time.time())
+            
+            return self._robots_allow(base_url, url)
             
         except Exception as e:
             self.logger.debug(f"Error checking robots.txt for {url}: {str(e)}")
             return True
     
-    def _rate_limit(self, domain: str):
-        """Implement rate limiting per domain"""
-        now = time.time()
-        
-        # Check if we need to wait
-        if domain in self.last_request_time:
-            elapsed = now - self.last_request_time[domain]
-            if elapsed < self.base_delay:
-                sleep_time = self.base_delay - elapsed
-                time.sleep(sleep_time)
-        
-        # Update request tracking
-        self.last_request_time[domain] = time.time()
-        self.request_count[domain] = self.request_count.get(domain, 0) + 1
-        
-        # Add extra delay for many requests
-        if self.request_count[domain] > 10:
-            time.sleep(self.base_delay * 0.5)
-    
-    def _get_cache_key(self, url: str) -> str:
-        """Generate cache key for URL"""
-        return hashlib.md5(url.encode()).hexdigest()
-    
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached content is still valid"""
-        if cache_key not in self.cache:
-            return False
+    @staticmethod
+    def _robots_base_url(url: str) -> str:
+        """Origin whose robots.txt governs a URL"""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+    
+    def _robots_fresh(self, base_url: str) -> bool:
+        """Whether robots.txt for an origin is cached and within robots_cache_ttl"""
+        cached = self.robots_cache.get(base_url)
+        return cached is not None and time.time() - cached[1] < self.robots_cache_ttl
+    
+    def _robots_allow(self, base_url: str, url: str) -> bool:
+        """Apply an origin's cached robots.txt to a URL"""
+        robots = self.robots_cache[base_url][0]
+        if robots:
+            can_fetch = robots.can_fetch(self.session.headers.get('User-Agent', '*'), url)
+            if not can_fetch:
+                self.logger.debug(f"Robots.txt disallows fetching {url}")
+            return can_fetch
+        return True
+    
+    @staticmethod
+    def _parse_robots(rp: RobotFileParser, status_code: int, text: str) -> None:
+        """Load a robots.txt response into a parser, with the same status handling as RobotFileParser.read()"""
+        if status_code in (401, 403) or status_code >= 500:
+            # read() leaves a parser unread on server errors, and unread parsers disallow every fetch
+            rp.disallow_all = True
+        elif 400 <= status_code < 500:
+            rp.allow_all = True
+        else:
+            rp.parse(text.splitlines())
+    
+    def _fetch_robots(self, base_url: str) -> Optional[RobotFileParser]:
+        """Fetch and parse robots.txt over the pooled session (None if it can't be read)"""
+        robots_url = urljoin(base_url, '/robots.txt')
+        rp = RobotFileParser()
+        rp.set_url(robots_url)
+        
+        try:
+            response = self.session.get(robots_url, timeout=self.timeout)
+            self._parse_robots(rp, response.status_code, response.text)
+            return rp
+        except Exception:
+            # If robots.txt can't be read, assume we can fetch
+            return None
+    
+    async def _fetch_robots_async(self, client: 'httpx.AsyncClient', base_url: str) -> Optional[RobotFileParser]:
+        """Fetch and parse robots.txt over the shared async client (None if it can't be read)"""
+        robots_url = urljoin(base_url, '/robots.txt')
+        rp = RobotFileParser()
+        rp.set_url(robots_url)
+        
+        try:
+            response = await client.get(robots_url)
+            self._parse_robots(rp, response.status_code, response.text)
+            return rp
+        except Exception:
+            # If robots.txt can't be read, assume we can fetch
+            return None
+    
+    def _get_domain_state(self, domain: str) -> '_DomainState':
+        """Get (or start) the rate limiting state for a domain"""
+        state = self._domain_state.get(domain)
+        if state is None:
+            state = self._domain_state[domain] = _DomainState(self.rate_limit_burst)
+        return state
+    
+    def _reserve_request(self, domain: str) -> float:
+        """
+        Take a token from the domain's bucket and return how long to wait before sending
+        
+        The bucket may go negative: each caller reserves its own slot immediately, so
+        concurrent callers queue up behind each other without needing a lock.
+        """
+        state = self._get_domain_state(domain)
+        state.count += 1
         
-        cached_time = self.cache[cache_key].get('timestamp', 0)
+        if self.base_delay <= 0:
+            return 0.0
+        
+        now = time.monotonic()
+        rate = 1.0 / self.base_delay
+        state.tokens = min(self.rate_limit_burst, state.tokens + (now - state.last_refill) * rate)
+        state.last_refill = now
+        state.tokens -= 1
+        
+        return -state.tokens / rate if state.tokens < 0 else 0.0
+    
+    def _rate_limit(self, domain: str) -> None:
+        """Implement rate limiting per domain"""
+        wait = self._reserve_request(domain)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def _rate_limit_async(self, domain: str) -> None:
+        """Implement rate limiting per domain without blocking the event loop"""
+        wait = self._reserve_request(domain)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def _get_cache_key(self, url: str, extract_content: bool = True) -> str:
+        """Generate cache key for URL and extraction mode (a 128-bit hash either way)"""
+        # Extracted results only carry raw_html when keep_raw_html is set, so raw pages get their own entries
+        key_source = url if extract_content else 'raw\0' + url
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(key_source)
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    
+    def _is_cache_valid(self, entry: Dict[str, Any]) -> bool:
+        """Check if a cache entry is still within cache_duration"""
+        cached_time = entry.get('timestamp', 0)
         return time.time() - cached_time < self.cache_duration
     
-    def _try_fallback_scraping(self, url: str, country_code: str = 'US') -> Optional[Dict[str, Any]]:
+    def _get_disk_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent cache database on first use"""
+        if not self.cache_db_path:
+            return None
+        
+        if self._cache_db is None:
+            # Async scrapes reach the cache from worker threads; open it only once
+            with self._cache_db_lock:
+                if self._cache_db is None and self.cache_db_path:
+                    try:
+                        directory = os.path.dirname(self.cache_db_path)
+                        if directory:
+                            os.makedirs(directory, exist_ok=True)
+                        
+                        db = sqlite3.connect(self.cache_db_path, check_same_thread=False)
+                        db.execute(
+                            'CREATE TABLE IF NOT EXISTS pages ('
+                            'cache_key TEXT PRIMARY KEY, data TEXT NOT NULL, etag TEXT, '
+                            'last_modified TEXT, timestamp REAL NOT NULL)'
+                        )
+                        db.commit()
+                        self._cache_db = db
+                    except (sqlite3.Error, OSError) as e:
+                        self.logger.warning(f"Disabling persistent scraper cache: {str(e)}")
+                        self.cache_db_path = None
+        
+        return self._cache_db
+    
+    def _get_shared_cache(self) -> Optional['redis.Redis']:
+        """Connect to the shared Redis cache on first use"""
+        if not self.redis_url:
+            return None
+        
+        if self._redis is None:
+            if not REDIS_AVAILABLE:
+                self.logger.warning("Disabling shared scraper cache: redis is not installed")
+                self.redis_url = None
+                return None
+            
+            # Async scrapes reach the cache from worker threads; connect (and subscribe) only once
+            with self._redis_lock:
+                if self._redis is None and self.redis_url:
+                    try:
+                        client = redis.Redis.from_url(self.redis_url, socket_timeout=5)
+                        client.ping()
+                        
+                        # Evict pages from memory when any scraper announces they changed
+                        pubsub = client.pubsub(ignore_subscribe_messages=True)
+                        pubsub.subscribe(**{_INVALIDATION_CHANNEL: self._on_invalidation})
+                        self._invalidation_thread = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+                        self._redis = client
+                    except (redis.RedisError, ValueError) as e:
+                        self.logger.warning(f"Disabling shared scraper cache: {str(e)}")
+                        self.redis_url = None
+        
+        return self._redis
+    
+    def _on_invalidation(self, message: Dict[str, Any]) -> None:
+        """Pub/sub handler: evict the announced URL prefix from the in-memory cache"""
+        url_prefix = message['data']
+        if isinstance(url_prefix, bytes):
+            url_prefix = url_prefix.decode('utf-8', errors='replace')
+        self._evict_from_memory(url_prefix)
+    
+    def _evict_from_memory(self, url_prefix: str) -> int:
+        """Drop in-memory cache entries whose page URL starts with url_prefix"""
+        with self._cache_lock:
+            stale = [
+                cache_key for cache_key, entry in self.cache.items()
+                if entry['data'].get('url', '').startswith(url_prefix)
+            ]
+            for cache_key in stale:
+                del self.cache[cache_key]
+        return len(stale)
+    
+    def _remember(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """Put an entry in the in-memory cache, evicting the least recently used beyond max_cache_entries"""
+        with self._cache_lock:
+            self.cache[cache_key] = entry
+            self.cache.move_to_end(cache_key)
+            
+            while len(self.cache) > self.max_cache_entries:
+                self.cache.popitem(last=False)
+    
+    def _persist(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """Write an entry through to the shared and persistent caches"""
+        shared = self._get_shared_cache()
+        if shared is not None:
+            try:
+                url = entry['data'].get('url', '')
+                pipeline = shared.pipeline()
+                pipeline.setex(_REDIS_KEY_PREFIX + cache_key, max(1, int(self.cache_duration)), _dump_json_line(entry))
+                pipeline.zadd(_REDIS_URL_INDEX, {url.encode('utf-8') + b'\0' + cache_key.encode('ascii'): 0})
+                pipeline.execute()
+            except redis.RedisError as e:
+                self.logger.warning(f"Failed to share cache entry: {str(e)}")
+        
+        db = self._get_disk_cache()
+        if db is None:
+            return
+        
+        try:
+            with self._cache_db_lock:
+                db.execute(
+                    'INSERT OR REPLACE INTO pages (cache_key, data, etag, last_modified, timestamp) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (cache_key, _dump_json_text(entry['data']), entry.get('etag'),
+                     entry.get('last_modified'), entry['timestamp'])
+                )
+                db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to persist cache entry: {str(e)}")
+    
+    def _lookup_cache_entry(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Find a cache entry in memory, then in Redis, then on disk; expired entries are returned for revalidation"""
+        with self._cache_lock:
+            entry = self.cache.get(cache_key)
+            if entry is not None:
+                self.cache.move_to_end(cache_key)
+                return entry
+        
+        shared = self._get_shared_cache()
+        if shared is not None:
+            try:
+                payload = shared.get(_REDIS_KEY_PREFIX + cache_key)
+            except redis.RedisError as e:
+                self.logger.warning(f"Failed to read shared cache entry: {str(e)}")
+                payload = None
+            
+            if payload is not None:
+                entry = _load_json(payload)
+                self._remember(cache_key, entry)
+                return entry
+        
+        db = self._get_disk_cache()
+        if db is None:
+            return None
+        
+        try:
+            with self._cache_db_lock:
+                row = db.execute(
+                    'SELECT data, etag, last_modified, timestamp FROM pages WHERE cache_key = ?',
+                    (cache_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to read cache entry: {str(e)}")
+            return None
+        
+        if row is None:
+            return None
+        
+        entry = {
+            'data': _load_json(row[0]),
+            'etag': row[1],
+            'last_modified': row[2],
+            'timestamp': row[3]
+        }
+        self._remember(cache_key, entry)
+        return entry
+    
+    def _conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cached entry's validators"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _revalidate_cached(self, cache_key: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Renew a cached entry after a 304 Not Modified response and return its data"""
+        entry['timestamp'] = time.time()
+        self._remember(cache_key, entry)
+        self._persist(cache_key, entry)
+        return entry['data']
+    
+    def _store_in_cache(self, cache_key: str, result: Dict[str, Any], headers: Any) -> None:
+        """Cache a result with its ETag / Last-Modified validators"""
+        entry = {
+            'data': result,
+            'timestamp': time.time(),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified')
+        }
+        self._remember(cache_key, entry)
+        self._persist(cache_key, entry)
+    
+    async def _run_cache_io(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a cache read or write off the event loop when it may reach Redis or sqlite"""
+        if self.redis_url or self.cache_db_path:
+            return await asyncio.to_thread(function, *args)
+        return function(*args)
+    
+    def _get_fallback_session(self, headers: Dict[str, str]) -> requests.Session:
+        """Get the pooled fallback session for a header set (keyed by its User-Agent), creating it once"""
+        user_agent = headers['User-Agent']
+        session = self._fallback_sessions.get(user_agent)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=4, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(headers)
+            self._fallback_sessions[user_agent] = session
+        return session
+    
+    def _fetch_fallback(self, session: requests.Session, url: str) -> Optional[_FetchedResponse]:
+        """
+        Fetch a page for a fallback attempt, streaming it like scrape_page does
+        
+        Returns None unless it is a 200 HTML page of more than 1000 bytes; other
+        content types are rejected from their headers without reading the body.
+        """
+        with session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('Content-Type', '').lower()
+            if response.status_code != 200 or not _is_html_content_type(content_type):
+                return None
+            
+            fetched = self._read_response(url, response, True)
+        
+        return fetched if len(fetched.content) > 1000 else None
+    
+    def _cache_fallback(self, url: str, fetched: _FetchedResponse, extract_content: bool,
+                        country_code: str) -> Dict[str, Any]:
+        """Process and cache a fallback page with its validators, so later scrapes can revalidate it with a conditional GET"""
+        result = self._process_response(url, fetched, extract_content, country_code)
+        self._store_in_cache(self._get_cache_key(url, extract_content), result, result['headers'])
+        return result
+    
+    def _try_fallback_scraping(self, url: str, country_code: str = 'US',
+                               extract_content: bool = True) -> Optional[Dict[str, Any]]:
         """
         Try fallback scraping methods when normal scraping fails
         
         Args:
             url: URL to scrape
             country_code: Country code for localization
+            extract_content: Whether to extract content, as for scrape_page
             
         Returns:
             Scraped data or None if all methods fail
@@ -160,42 +761,22 @@ class WebScraper:
         self.logger.info(f"Attempting fallback scraping methods for {url}")
         
         # Method 1: Try different user agents
-        fallback_user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:120.0) Gecko/20100101 Firefox/120.0'
-        ]
-        
-        for user_agent in fallback_user_agents:
+        for headers in _FALLBACK_HEADERS:
+            user_agent = headers['User-Agent']
             try:
                 self.logger.debug(f"Trying fallback user agent: {user_agent[:50]}...")
                 
-                # Create new session with different user agent
-                fallback_session = requests.Session()
-                fallback_session.headers.update({
-                    'User-Agent': user_agent,
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Cache-Control': 'no-cache'
-                })
+                # Reuse this user agent's session (and its open connections) across pages
+                fallback_session = self._get_fallback_session(headers)
                 
                 # Add random delay
                 time.sleep(random.uniform(2, 5))
                 
-                response = fallback_session.get(url, timeout=self.timeout)
-                response.raise_for_status()
+                fetched = self._fetch_fallback(fallback_session, url)
                 
-                if response.status_code == 200 and len(response.content) > 1000:
+                if fetched is not None:
                     self.logger.info(f"Fallback scraping successful with user agent: {user_agent[:50]}...")
-                    return self._process_response(url, response, True, country_code)
+                    return self._cache_fallback(url, fetched, extract_content, country_code)
                     
             except Exception as e:
                 self.logger.debug(f"Fallback user agent failed: {str(e)}")
@@ -204,22 +785,14 @@ class WebScraper:
         # Method 2: Try with mobile user agent
         try:
             self.logger.debug("Trying mobile user agent...")
-            mobile_session = requests.Session()
-            mobile_session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive'
-            })
+            mobile_session = self._get_fallback_session(_MOBILE_HEADERS)
             
             time.sleep(random.uniform(3, 6))
-            response = mobile_session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            fetched = self._fetch_fallback(mobile_session, url)
             
-            if response.status_code == 200 and len(response.content) > 1000:
+            if fetched is not None:
                 self.logger.info("Fallback scraping successful with mobile user agent")
-                return self._process_response(url, response, True, country_code)
+                return self._cache_fallback(url, fetched, extract_content, country_code)
                 
         except Exception as e:
             self.logger.debug(f"Mobile user agent failed: {str(e)}")
@@ -227,27 +800,21 @@ class WebScraper:
         # Method 3: Try with minimal headers
         try:
             self.logger.debug("Trying minimal headers...")
-            minimal_session = requests.Session()
-            minimal_session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (compatible; WebScraper/1.0; +http://www.webscraper.com)',
-                'Accept': 'text/html',
-                'Connection': 'keep-alive'
-            })
+            minimal_session = self._get_fallback_session(_MINIMAL_HEADERS)
             
             time.sleep(random.uniform(2, 4))
-            response = minimal_session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            fetched = self._fetch_fallback(minimal_session, url)
             
-            if response.status_code == 200 and len(response.content) > 1000:
+            if fetched is not None:
                 self.logger.info("Fallback scraping successful with minimal headers")
-                return self._process_response(url, response, True, country_code)
+                return self._cache_fallback(url, fetched, extract_content, country_code)
                 
         except Exception as e:
             self.logger.debug(f"Minimal headers failed: {str(e)}")
         
         self.logger.warning(f"All fallback scraping methods failed for {url}")
         return None
-
+    
     @log_execution_time
     def scrape_page(self, url: str, extract_content: bool = True, country_code: str = 'US') -> Optional[Dict[str, Any]]:
         """
@@ -255,17 +822,20 @@ class WebScraper:
         
         Args:
             url: URL to scrape
-            extract_content: Whether to extract and clean content
+            extract_content: Whether to extract and clean content (otherwise the
+                result holds the page as raw_html; extracted results only include
+                raw_html when keep_raw_html is configured)
             
         Returns:
             Dictionary with scraped data or None if failed
         """
-        cache_key = self._get_cache_key(url)
+        cache_key = self._get_cache_key(url, extract_content)
         
         # Check cache first
-        if self._is_cache_valid(cache_key):
+        cached_entry = self._lookup_cache_entry(cache_key)
+        if cached_entry is not None and self._is_cache_valid(cached_entry):
             self.logger.debug(f"Returning cached content for {url}")
-            return self.cache[cache_key]['data']
+            return cached_entry['data']
         
         # Check robots.txt (if enabled)
         if not self._can_fetch(url):
@@ -274,7 +844,7 @@ class WebScraper:
             else:
                 self.logger.warning(f"Robots.txt disallows fetching {url} - trying fallback methods")
                 # Try fallback scraping methods
-                fallback_result = self._try_fallback_scraping(url, country_code)
+                fallback_result = self._try_fallback_scraping(url, country_code, extract_content)
                 if fallback_result:
                     return fallback_result
                 else:
@@ -294,18 +864,26 @@ class WebScraper:
                 
                 self.logger.debug(f"Scraping {url} (attempt {attempt + 1})")
                 
-                # Make request
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
+                # Make request, revalidating any expired cache entry; the body is streamed
+                with self.session.get(
+                    url,
+                    timeout=self.timeout,
+                    headers=self._conditional_headers(cached_entry),
+                    stream=True
+                ) as response:
+                    response.raise_for_status()
+                    
+                    if response.status_code == 304 and cached_entry is not None:
+                        self.logger.debug(f"Cached content for {url} not modified")
+                        return self._revalidate_cached(cache_key, cached_entry)
+                    
+                    fetched = self._read_response(url, response, extract_content)
                 
                 # Process successful response
-                result = self._process_response(url, response, extract_content, country_code)
+                result = self._process_response(url, fetched, extract_content, country_code)
                 
                 # Cache result
-                self.cache[cache_key] = {
-                    'data': result,
-                    'timestamp': time.time()
-                }
+                self._store_in_cache(cache_key, result, fetched.headers)
                 
                 return result
                 
@@ -319,7 +897,7 @@ class WebScraper:
                 else:
                     self.logger.error(f"Failed to scrape {url} after {self.max_retries} attempts - trying fallback methods")
                     # Try fallback methods as last resort
-                    fallback_result = self._try_fallback_scraping(url, country_code)
+                    fallback_result = self._try_fallback_scraping(url, country_code, extract_content)
                     if fallback_result:
                         return fallback_result
                     else:
@@ -328,163 +906,387 @@ class WebScraper:
             except Exception as e:
                 self.logger.error(f"Unexpected error scraping {url}: {str(e)}")
                 return None
+        
+        return None
     
-    def _process_response(self, url: str, response: requests.Response, extract_content: bool, country_code: str = 'US') -> Dict[str, Any]:
+    async def scrape_page_async(self, client: 'httpx.AsyncClient', url: str, extract_content: bool = True,
+                                country_code: str = 'US', parse_pool: Optional[ProcessPoolExecutor] = None
+                                ) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of scrape_page, used by scrape_multiple_pages
+        
+        Args:
+            client: Shared client from create_async_client
+            url: URL to scrape
+            extract_content: Whether to extract and clean content
+            country_code: Country code for localization
+            parse_pool: Process pool for HTML parsing (None to parse in this process)
+            
+        Returns:
+            Dictionary with scraped data or None if failed
+        """
+        cache_key = self._get_cache_key(url, extract_content)
+        
+        # Check cache first
+        cached_entry = await self._run_cache_io(self._lookup_cache_entry, cache_key)
+        if cached_entry is not None and self._is_cache_valid(cached_entry):
+            self.logger.debug(f"Returning cached content for {url}")
+            return cached_entry['data']
+        
+        # Check robots.txt (if enabled)
+        if not await self._can_fetch_async(client, url):
+            if self.bypass_robots_txt:
+                self.logger.info(f"Bypassing robots.txt restriction for {url}")
+            else:
+                self.logger.warning(f"Robots.txt disallows fetching {url} - trying fallback methods")
+                fallback_result = await asyncio.to_thread(self._try_fallback_scraping, url, country_code, extract_content)
+                if fallback_result:
+                    return fallback_result
+                else:
+                    self.logger.warning(f"Robots.txt disallows fetching {url} - Use bypass_robots_txt=True to override")
+                    return None
+        
+        domain = urlparse(url).netloc
+        
+        for attempt in range(self.max_retries):
+            try:
+                # Rate limiting
+                await self._rate_limit_async(domain)
+                
+                self.logger.debug(f"Scraping {url} (attempt {attempt + 1})")
+                
+                # Make request, revalidating any expired cache entry; the body is streamed
+                async with client.stream('GET', url, headers=self._conditional_headers(cached_entry)) as response:
+                    # httpx treats 304 as an error status, so check it first
+                    if response.status_code == 304 and cached_entry is not None:
+                        self.logger.debug(f"Cached content for {url} not modified")
+                        return await self._run_cache_io(self._revalidate_cached, cache_key, cached_entry)
+                    
+                    response.raise_for_status()
+                    fetched = await self._read_response_async(url, response, extract_content)
+                
+                # Process successful response
+                result = await self._process_response_async(url, fetched, extract_content, country_code, parse_pool)
+                
+                # Cache result
+                await self._run_cache_io(self._store_in_cache, cache_key, result, fetched.headers)
+                
+                return result
+                
+            except httpx.HTTPError as e:
+                self.logger.warning(f"Request failed for {url} (attempt {attempt + 1}): {str(e)}")
+                
+                if attempt < self.max_retries - 1:
+                    # Exponential backoff
+                    sleep_time = self.base_delay * (2 ** attempt) + random.uniform(0, 1)
+                    await asyncio.sleep(sleep_time)
+                else:
+                    self.logger.error(f"Failed to scrape {url} after {self.max_retries} attempts - trying fallback methods")
+                    # Try fallback methods as last resort
+                    return await asyncio.to_thread(self._try_fallback_scraping, url, country_code, extract_content)
+                    
+            except Exception as e:
+                self.logger.error(f"Unexpected error scraping {url}: {str(e)}")
+                return None
+        
+        return None
+    
+    def _read_response(self, url: str, response: requests.Response, extract_content: bool) -> _FetchedResponse:
+        """
+        Read a streamed response body, up to max_content_bytes
+        
+        Bodies that will not be parsed (non-HTML when extracting content) are not
+        downloaded at all, and larger bodies are truncated at the cap.
+        """
+        body = b''
+        
+        if self._wants_body(url, response.headers, extract_content):
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= self.max_content_bytes:
+                    self.logger.warning(f"Truncated {url} at {self.max_content_bytes} bytes")
+                    break
+            body = b''.join(chunks)[:self.max_content_bytes]
+        
+        return _FetchedResponse(
+            status_code=response.status_code,
+            headers=CaseInsensitiveDict(response.headers),
+            content=body,
+            text=body.decode(response.encoding or 'utf-8', errors='replace')
+        )
+    
+    async def _read_response_async(self, url: str, response: 'httpx.Response', extract_content: bool) -> _FetchedResponse:
+        """Async counterpart of _read_response for a streamed httpx response"""
+        body = b''
+        
+        if self._wants_body(url, response.headers, extract_content):
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= self.max_content_bytes:
+                    self.logger.warning(f"Truncated {url} at {self.max_content_bytes} bytes")
+                    break
+            body = b''.join(chunks)[:self.max_content_bytes]
+        
+        return _FetchedResponse(
+            status_code=response.status_code,
+            headers=CaseInsensitiveDict(response.headers),
+            content=body,
+            text=body.decode(response.charset_encoding or 'utf-8', errors='replace')
+        )
+    
+    def _wants_body(self, url: str, headers: Any, extract_content: bool) -> bool:
+        """Whether a response body is worth downloading, warning when it declares more than max_content_bytes"""
+        content_type = headers.get('Content-Type', '').lower()
+        if extract_content and not _is_html_content_type(content_type):
+            return False
+        
+        declared_length = headers.get('Content-Length', '')
+        if declared_length.isdigit() and int(declared_length) > self.max_content_bytes:
+            self.logger.warning(f"{url} declares {declared_length} bytes; reading only the first {self.max_content_bytes}")
+        return True
+    
+    async def _process_response_async(self, url: str, fetched: _FetchedResponse, extract_content: bool,
+                                      country_code: str, parse_pool: Optional[ProcessPoolExecutor]) -> Dict[str, Any]:
+        """Process a fetched response, parsing in the process pool when one is available"""
+        if not extract_content:
+            return self._process_response(url, fetched, False, country_code)
+        
+        if parse_pool is not None:
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(parse_pool, _parse_page, url, fetched, country_code)
+            except BrokenProcessPool as e:
+                self.logger.warning(f"Parse pool unavailable, parsing {url} in process: {str(e)}")
+                self._discard_parse_pool(parse_pool)
+        
+        return self._process_response(url, fetched, True, country_code)
+    
+    def _process_response(self, url: str, response: Union[requests.Response, _FetchedResponse], extract_content: bool, country_code: str = 'US') -> Dict[str, Any]:
         """Process HTTP response and extract data"""
         result = {
             'url': url,
             'status_code': response.status_code,
-            'headers': dict(response.headers),
+            'headers': {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers},
             'scraped_at': datetime.now().isoformat(),
             'content_length': len(response.content),
             'content_type': response.headers.get('Content-Type', '').lower()
         }
         
-        # Store raw HTML
-        result['raw_html'] = response.text
+        # Non-HTML responses (PDFs, images, JSON, ...) have nothing to extract
+        if extract_content and not _is_html_content_type(result['content_type']):
+            self.logger.debug(f"Skipping content extraction for {url} ({result['content_type']})")
+            return result
+        
+        if not extract_content:
+            result['raw_html'] = response.text
+            return result
+        
+        # Parse only the tags the extractors read; the whole-page text comes from a
+        # plain lxml document, which is far cheaper to build than a full soup.
+        # A declared charset spares bs4 from sniffing the encoding itself.
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=_CONTENT_STRAINER,
+                             from_encoding=_header_charset(result['content_type']))
+        encoding = soup.original_encoding
+        
+        # Store raw HTML only on request (it dwarfs the extracted data in the cache),
+        # decoded once with the encoding the parser settled on
+        if self.keep_raw_html:
+            result['raw_html'] = response.content.decode(encoding, errors='replace') if encoding else response.text
         
-        if extract_content:
-            # Parse HTML and extract structured content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            result.update(self._extract_content(soup, country_code))
+        document = self._parse_text_document(response.content, encoding)
+        result.update(self._extract_content(soup, country_code, document))
         
         return result
     
-    def _extract_content(self, soup: BeautifulSoup, country_code: str = 'US') -> Dict[str, Any]:
-        """Extract structured content from HTML"""
-        content = {}
+    def _parse_text_document(self, content: bytes, encoding: Optional[str]) -> Optional[lxml_html.HtmlElement]:
+        """Parse a page into an lxml document for text extraction (None if it has no markup)"""
+        try:
+            parser = lxml_html.HTMLParser(encoding=encoding)
+            return lxml_html.document_fromstring(content, parser=parser)
+        except (etree.ParserError, LookupError, ValueError):
+            return None
+    
+    @staticmethod
+    def _clear_elements(document: lxml_html.HtmlElement, tags: Tuple[str, ...]) -> None:
+        """Empty the given elements in place, keeping each tail as a separate string like decompose() does"""
+        for element in list(document.iter(*tags)):
+            element.clear(keep_tail=True)
+    
+    def _extract_content(self, soup: BeautifulSoup, country_code: str = 'US',
+                         document: Optional[lxml_html.HtmlElement] = None) -> Dict[str, Any]:
+        """Extract structured content from HTML (a strained soup plus the full lxml document for text)"""
+        content: Dict[str, Any] = {}
+        
+        # Collect every tag the helpers need in one traversal
+        tags_by_name: Dict[str, List[Tag]] = {self._TAG_BUCKETS.get(name, name): [] for name in self._BUCKETED_TAGS}
+        for tag in soup.find_all(self._BUCKETED_TAGS):
+            tags_by_name[self._TAG_BUCKETS.get(tag.name, tag.name)].append(tag)
         
         # Basic metadata
-        content['title'] = self._extract_title(soup)
-        content['meta_description'] = self._extract_meta_description(soup)
-        content['meta_keywords'] = self._extract_meta_keywords(soup)
+        meta_by_name = self._index_meta_tags(tags_by_name['meta'])
+        content['title'] = self._extract_title(tags_by_name['title'])
+        content['meta_description'] = self._extract_meta_description(meta_by_name)
+        content['meta_keywords'] = self._extract_meta_keywords(meta_by_name)
         
         # Content extraction
-        content['headings'] = self._extract_headings(soup)
-        content['paragraphs'] = self._extract_paragraphs(soup)
-        content['links'] = self._extract_links(soup)
-        content['images'] = self._extract_images(soup)
+        content['headings'] = self._extract_headings(tags_by_name)
+        content['paragraphs'] = self._extract_paragraphs(tags_by_name['p'])
+        content['links'] = self._extract_links(tags_by_name['a'])
+        content['images'] = self._extract_images(tags_by_name['img'])
         
         # Structured data
-        content['structured_data'] = self._extract_structured_data(soup)
+        content['structured_data'] = self._extract_structured_data(tags_by_name['script'])
         
-        # Page-specific content
-        content['pricing_indicators'] = self._extract_pricing_indicators(soup, country_code)
-        content['feature_lists'] = self._extract_feature_lists(soup)
-        content['contact_info'] = self._extract_contact_info(soup)
+        # Page-specific content; walk the tree for its text once and share it
+        if document is not None:
+            self._clear_elements(document, _NON_TEXT_TAGS)
+            page_text = document.text_content()
+        else:
+            page_text = soup.get_text()
+        content['pricing_indicators'] = self._extract_pricing_indicators(page_text, country_code, page_text.lower())
+        content['feature_lists'] = self._extract_feature_lists(tags_by_name['lists'])
+        content['contact_info'] = self._extract_contact_info(page_text)
         
         # Text content
-        content['clean_text'] = self._extract_clean_text(soup)
-        content['word_count'] = len(content['clean_text'].split())
+        content['clean_text'] = self._extract_clean_text(document if document is not None else soup)
+        # clean_text has single spaces between words, so count them instead of splitting
+        content['word_count'] = content['clean_text'].count(' ') + 1 if content['clean_text'] else 0
         
         return content
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    @staticmethod
+    def _index_meta_tags(meta_tags: List[Tag]) -> Dict[str, Tag]:
+        """Map each meta name to the first meta tag carrying it"""
+        meta_by_name: Dict[str, Tag] = {}
+        for meta in meta_tags:
+            name = meta.get('name')
+            if isinstance(name, str):
+                meta_by_name.setdefault(name, meta)
+        return meta_by_name
+    
+    def _extract_title(self, title_tags: List[Tag]) -> str:
         """Extract page title"""
-        title_tag = soup.find('title')
-        return title_tag.get_text(strip=True) if title_tag else ""
+        return title_tags[0].get_text(strip=True) if title_tags else ""
     
-    def _extract_meta_description(self, soup: BeautifulSoup) -> str:
+    def _extract_meta_description(self, meta_by_name: Dict[str, Tag]) -> str:
         """Extract meta description"""
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc = meta_by_name.get('description')
         return meta_desc.get('content', '') if meta_desc else ""
     
-    def _extract_meta_keywords(self, soup: BeautifulSoup) -> str:
+    def _extract_meta_keywords(self, meta_by_name: Dict[str, Tag]) -> str:
         """Extract meta keywords"""
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+        meta_keywords = meta_by_name.get('keywords')
         return meta_keywords.get('content', '') if meta_keywords else ""
     
-    def _extract_headings(self, soup: BeautifulSoup) -> Dict[str, List[str]]:
+    def _extract_headings(self, tags_by_name: Dict[str, List[Tag]]) -> Dict[str, List[str]]:
         """Extract all headings (h1-h6)"""
         headings = {}
         for i in range(1, 7):
             tag = f'h{i}'
-            elements = soup.find_all(tag)
-            headings[tag] = [elem.get_text(strip=True) for elem in elements]
+            headings[tag] = [elem.get_text(strip=True) for elem in tags_by_name[tag]]
         return headings
     
-    def _extract_paragraphs(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_paragraphs(self, paragraphs: List[Tag]) -> List[str]:
         """Extract paragraph text"""
-        paragraphs = soup.find_all('p')
-        return [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
-    
-    def _extract_links(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """Extract all links with text and href"""
-        links = []
-        for link in soup.find_all('a', href=True):
-            links.append({
-                'text': link.get_text(strip=True),
-                'href': link.get('href', ''),
-                'title': link.get('title', '')
-            })
-        return links[:50]  # Limit to first 50 links
-    
-    def _extract_images(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """Extract image information"""
-        images = []
-        for img in soup.find_all('img'):
-            images.append({
-                'src': img.get('src', ''),
-                'alt': img.get('alt', ''),
-                'title': img.get('title', '')
-            })
-        return images[:20]  # Limit to first 20 images
-    
-    def _extract_structured_data(self, soup: BeautifulSoup) -> List[Dict]:
+        texts = (p.get_text(strip=True) for p in paragraphs)
+        return [text for text in texts if text]
+    
+    def _extract_links(self, anchors: List[Tag]) -> Dict[str, List[str]]:
+        """Extract links as parallel text/href/title columns"""
+        texts, hrefs, titles = [], [], []
+        for link in anchors:
+            if not link.has_attr('href'):
+                continue
+            texts.append(link.get_text(strip=True))
+            hrefs.append(link.get('href', ''))
+            titles.append(link.get('title', ''))
+            if len(hrefs) == 50:  # Limit to first 50 links
+                break
+        return {'text': texts, 'href': hrefs, 'title': titles}
+    
+    def _extract_images(self, img_tags: List[Tag]) -> Dict[str, List[str]]:
+        """Extract images as parallel src/alt/title columns"""
+        img_tags = img_tags[:20]  # Limit to first 20 images
+        return {
+            'src': [img.get('src', '') for img in img_tags],
+            'alt': [img.get('alt', '') for img in img_tags],
+            'title': [img.get('title', '') for img in img_tags]
+        }
+    
+    def _extract_structured_data(self, scripts: List[Tag]) -> List[Dict]:
         """Extract JSON-LD structured data"""
         structured_data = []
-        scripts = soup.find_all('script', type='application/ld+json')
         
         for script in scripts:
+            if script.get('type') != 'application/ld+json' or not script.string:
+                continue
             try:
-                data = json.loads(script.string)
+                if ORJSON_AVAILABLE:
+                    # orjson rejects str subclasses such as NavigableString
+                    data = orjson.loads(str(script.string))
+                else:
+                    data = json.loads(script.string)
                 structured_data.append(data)
-            except json.JSONDecodeError:
+            except ValueError:
+                # Covers json.JSONDecodeError and orjson.JSONDecodeError
                 continue
         
         return structured_data
     
-    def _extract_pricing_indicators(self, soup: BeautifulSoup, country_code: str = 'US') -> Dict[str, Any]:
-        """Extract pricing-related content"""
-        from .country_localization import country_localization
-        
-        pricing = {
+    def _extract_pricing_indicators(self, text: str, country_code: str = 'US', text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Extract pricing-related content from the page text"""
+        pricing: Dict[str, List[str]] = {
             'currency_symbols': [],
             'price_patterns': [],
             'pricing_terms': []
         }
         
-        # Get country-specific currency symbols
-        country_symbols = country_localization.get_currency_symbols(country_code)
-        
-        # Build currency pattern from country symbols
-        if country_symbols:
-            escaped_symbols = [re.escape(symbol) for symbol in country_symbols]
-            currency_pattern = f'[{"".join(escaped_symbols)}][\\d,.]+'
-        else:
-            currency_pattern = r'[$€£¥₹][\d,.]+'
-        
-        text = soup.get_text()
-        pricing['currency_symbols'] = list(set(re.findall(currency_pattern, text)))
+        pricing['currency_symbols'] = list(set(_currency_re(country_code).findall(text)))
         
         # Get country-specific pricing terms
-        pricing_terms = country_localization.get_localized_pricing_patterns(country_code)
+        pricing_terms, terms_re, contained_terms = _pricing_terms(country_code)
+        
+        if text_lower is None:
+            text_lower = text.lower()
         
-        found_terms = []
-        for term in pricing_terms:
-            if term.lower() in text.lower():
-                found_terms.append(term)
+        # One scan over the text finds every term occurrence (see _compile_pricing_terms)
+        hits = set(terms_re.findall(text_lower))
+        present = set()
+        for hit in hits:
+            present.update(contained_terms.get(hit, ()))
         
-        pricing['pricing_terms'] = found_terms
+        pricing['pricing_terms'] = [term for term in pricing_terms if term.lower() in present]
         
         return pricing
     
-    def _extract_feature_lists(self, soup: BeautifulSoup) -> List[str]:
+    @staticmethod
+    def _compile_pricing_terms(pricing_terms: List[str]) -> Tuple[re.Pattern, Dict[str, List[str]]]:
+        """
+        Compile pricing terms into a single overlapping-match alternation
+        
+        The lookahead tries the longest term first at every position, so a shorter
+        term that starts at the same position is a prefix of the reported hit.
+        contained_terms maps each term to every term it contains, which recovers
+        those shorter terms and keeps plain substring-containment semantics.
+        """
+        lowered = sorted({term.lower() for term in pricing_terms}, key=len, reverse=True)
+        terms_re = re.compile('(?=(' + '|'.join(re.escape(term) for term in lowered) + '))')
+        contained_terms = {
+            term: [other for other in lowered if other in term]
+            for term in lowered
+        }
+        return terms_re, contained_terms
+    
+    def _extract_feature_lists(self, lists: List[Tag]) -> List[str]:
         """Extract feature lists and bullet points"""
         features = []
         
-        # Find unordered lists
-        lists = soup.find_all(['ul', 'ol'])
         for list_elem in lists:
             items = list_elem.find_all('li')
             for item in items:
@@ -494,58 +1296,119 @@ class WebScraper:
         
         return features[:30]  # Limit to first 30 features
     
-    def _extract_contact_info(self, soup: BeautifulSoup) -> Dict[str, List[str]]:
-        """Extract contact information"""
-        contact = {
+    def _extract_contact_info(self, text: str) -> Dict[str, List[str]]:
+        """Extract contact information from the page text"""
+        contact: Dict[str, List[str]] = {
             'emails': [],
             'phones': [],
             'addresses': []
         }
         
-        text = soup.get_text()
-        
-        # Extract emails
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        contact['emails'] = list(set(re.findall(email_pattern, text)))
+        # Extract emails; a page without an '@' cannot contain one, and the C-level
+        # substring check is much cheaper than trying the pattern at every word boundary
+        if '@' in text:
+            contact['emails'] = list(set(_EMAIL_RE.findall(text)))
         
         # Extract phone numbers
-        phone_pattern = r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'
-        contact['phones'] = list(set(re.findall(phone_pattern, text)))
+        contact['phones'] = list(set(_PHONE_RE.findall(text)))
         
         return contact
     
-    def _extract_clean_text(self, soup: BeautifulSoup) -> str:
-        """Extract clean, readable text content"""
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
-        
-        # Get text and clean it
-        text = soup.get_text()
-        
-        # Clean whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+    def _extract_clean_text(self, page: Union[BeautifulSoup, lxml_html.HtmlElement]) -> str:
+        """Extract clean, readable text content from a soup or an lxml document"""
+        if isinstance(page, BeautifulSoup):
+            # Remove script and style elements
+            for script in page(list(_NON_CONTENT_TAGS)):
+                script.decompose()
+            text = page.get_text(separator=' ')
+        else:
+            self._clear_elements(page, _NON_CONTENT_TAGS)
+            text = ' '.join(page.itertext())
         
-        return text
+        # Collapse whitespace in one pass
+        return _WS_RE.sub(' ', text).strip()
     
-    def scrape_multiple_pages(self, urls: List[str], max_pages: Optional[int] = None, country_code: str = 'US') -> Dict[str, Any]:
+    def scrape_multiple_pages(self, urls: List[str], max_pages: Optional[int] = None, country_code: str = 'US',
+                              output_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Scrape multiple pages with progress tracking
         
+        Pages are fetched concurrently (see scrape_multiple_pages_async) when httpx
+        is installed and there is more than one URL, otherwise one after another.
+        
         Args:
-            urls: List of URLs to scrape
-            max_pages: Maximum number of pages to scrape (None for all)
+            urls: List of URLs to scrape (duplicates are scraped once)
+            max_pages: Maximum number of distinct pages to scrape (None for all)
             country_code: Country code for localized analysis
+            output_path: Optional NDJSON file to stream full page results to as they
+                complete; scraped_pages then only holds url/status_code/word_count
+                summaries (read the file back with load_scraped_pages)
             
         Returns:
             Dictionary with scraping results
         """
+        # Scrape each URL once, keeping first-seen order
+        urls = list(dict.fromkeys(urls))
+        if max_pages:
+            urls = urls[:max_pages]
+        
+        if HTTPX_AVAILABLE and len(urls) > 1:
+            return self._run_coroutine(self.scrape_multiple_pages_async(urls, country_code=country_code, output_path=output_path))
+        
+        results = self._start_scrape_results(urls)
+        output_file = open(output_path, 'wb') if output_path else None
+        
+        try:
+            for i, url in enumerate(urls, 1):
+                self.logger.info(f"Scraping page {i}/{len(urls)}: {url}")
+                self._record_scraped_page(results, url, self.scrape_page(url, country_code=country_code), output_file)
+        finally:
+            if output_file is not None:
+                output_file.close()
+        
+        return self._finish_scrape_results(results, output_path)
+    
+    async def scrape_multiple_pages_async(self, urls: List[str], max_pages: Optional[int] = None, country_code: str = 'US',
+                                          output_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Scrape multiple pages concurrently over one HTTP/2 client
+        
+        Same arguments and result as scrape_multiple_pages. Without httpx the pages
+        are scraped one after another in a worker thread.
+        """
+        # Scrape each URL once, keeping first-seen order
+        urls = list(dict.fromkeys(urls))
         if max_pages:
             urls = urls[:max_pages]
         
-        results = {
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.scrape_multiple_pages, urls, None, country_code, output_path)
+        
+        results = self._start_scrape_results(urls)
+        output_file = open(output_path, 'wb') if output_path else None
+        
+        try:
+            if output_file is not None:
+                # Write pages as they complete instead of holding them all
+                await self._scrape_pages_async(
+                    urls, country_code,
+                    on_page=lambda url, data: self._record_scraped_page(results, url, data, output_file)
+                )
+            else:
+                page_results = await self._scrape_pages_async(urls, country_code)
+                for url, scraped_data in zip(urls, page_results):
+                    self._record_scraped_page(results, url, scraped_data, None)
+        finally:
+            if output_file is not None:
+                output_file.close()
+        
+        return self._finish_scrape_results(results, output_path)
+    
+    def _start_scrape_results(self, urls: List[str]) -> Dict[str, Any]:
+        """Create the result structure for a multi-page scrape"""
+        self.logger.info(f"Starting to scrape {len(urls)} pages")
+        
+        return {
             'scraped_pages': [],
             'failed_pages': [],
             'summary': {
@@ -555,44 +1418,281 @@ class WebScraper:
                 'start_time': datetime.now().isoformat()
             }
         }
+    
+    def _record_scraped_page(self, results: Dict[str, Any], url: str, scraped_data: Optional[Dict[str, Any]],
+                             output_file: Optional[IO[bytes]]) -> None:
+        """Add one page outcome to the results, streaming the full page to output_file if given"""
+        if scraped_data:
+            if output_file is not None:
+                output_file.write(_dump_json_line(scraped_data))
+                scraped_data = {
+                    'url': scraped_data.get('url', url),
+                    'status_code': scraped_data.get('status_code'),
+                    'word_count': scraped_data.get('word_count', 0)
+                }
+            results['scraped_pages'].append(scraped_data)
+            results['summary']['successful'] += 1
+        else:
+            results['failed_pages'].append(url)
+            results['summary']['failed'] += 1
+    
+    def _finish_scrape_results(self, results: Dict[str, Any], output_path: Optional[str]) -> Dict[str, Any]:
+        """Complete the summary of a multi-page scrape"""
+        if output_path:
+            results['output_path'] = output_path
         
-        self.logger.info(f"Starting to scrape {len(urls)} pages")
+        results['summary']['end_time'] = datetime.now().isoformat()
+        results['summary']['success_rate'] = results['summary']['successful'] / results['summary']['total_attempted'] * 100
+        
+        self.logger.info(f"Scraping completed. Success rate: {results['summary']['success_rate']:.1f}%")
+        
+        return results
+    
+    async def _scrape_pages_async(self, urls: List[str], country_code: str = 'US',
+                                  on_page: Optional[Callable[[str, Optional[Dict[str, Any]]], None]] = None
+                                  ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Scrape URLs concurrently over one pooled HTTP/2 client, preserving input order
+        
+        When on_page is given it is called with each (url, result) as soon as the page
+        completes and the returned list holds None instead of the results.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         
-        for i, url in enumerate(urls, 1):
-            self.logger.info(f"Scraping page {i}/{len(urls)}: {url}")
+        # Semaphores are bound to the event loop, so start each run with fresh ones
+        self._domain_semaphores = {}
+        
+        # Parsing is CPU-bound, so spread it over cores for larger batches
+        parse_pool = self._get_parse_pool() if len(urls) >= PARALLEL_PARSE_THRESHOLD else None
+        
+        async with self.create_async_client() as client:
             
-            scraped_data = self.scrape_page(url, country_code=country_code)
+            async def bounded_scrape(index: int, url: str) -> Optional[Dict[str, Any]]:
+                # Take the per-domain slot first so a busy host never holds global slots
+                domain_semaphore = self._domain_semaphores.setdefault(
+                    urlparse(url).netloc, asyncio.Semaphore(self.max_connections_per_host)
+                )
+                async with domain_semaphore, semaphore:
+                    self.logger.info(f"Scraping page {index}/{len(urls)}: {url}")
+                    result = await self.scrape_page_async(client, url, country_code=country_code, parse_pool=parse_pool)
+                
+                if on_page is not None:
+                    on_page(url, result)
+                    return None
+                return result
             
-            if scraped_data:
-                results['scraped_pages'].append(scraped_data)
-                results['summary']['successful'] += 1
-            else:
-                results['failed_pages'].append(url)
-                results['summary']['failed'] += 1
+            return await asyncio.gather(
+                *(bounded_scrape(i, url) for i, url in enumerate(urls, 1))
+            )
+    
+    def create_async_client(self) -> 'httpx.AsyncClient':
+        """
+        Create the pooled client used by scrape_page_async (HTTP/2 when h2 is installed)
         
-        results['summary']['end_time'] = datetime.now().isoformat()
-        results['summary']['success_rate'] = results['summary']['successful'] / len(urls) * 100
+        Use it as an async context manager within a single event loop run.
+        """
+        # Locks are bound to the event loop, so start each client with fresh ones
+        self._robots_locks = {}
         
-        self.logger.info(f"Scraping completed. Success rate: {results['summary']['success_rate']:.1f}%")
+        # httpx advertises the codings it can decode itself
+        headers = {key: value for key, value in self.session.headers.items() if key.lower() not in _ASYNC_EXCLUDED_HEADERS}
         
-        return results
+        # HTTP/2 multiplexes requests to a host over one connection; HTTP/1.1 keeps them alive
+        limits = httpx.Limits(
+            max_connections=self.max_concurrent_requests,
+            max_keepalive_connections=self.max_concurrent_requests,
+            keepalive_expiry=85.0
+        )
+        
+        return httpx.AsyncClient(
+            http2=H2_AVAILABLE,
+            follow_redirects=True,
+            limits=limits,
+            headers=headers,
+            timeout=self.timeout
+        )
+    
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the parse pool, starting it on first use (None if processes are unavailable)"""
+        if self._parse_pool is None:
+            try:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    initializer=_init_parse_worker,
+                    initargs=(self.config,)
+                )
+            except OSError as e:
+                self.logger.warning(f"Parse pool unavailable, parsing in process: {str(e)}")
+        return self._parse_pool
+    
+    def _discard_parse_pool(self, parse_pool: ProcessPoolExecutor) -> None:
+        """Drop a broken parse pool so the next batch starts a fresh one"""
+        if self._parse_pool is parse_pool:
+            self._parse_pool = None
+            parse_pool.shutdown(wait=False)
+    
+    @staticmethod
+    def _run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine to completion from synchronous code"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        # Already inside an event loop (e.g. a notebook): run on a separate thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
     
     def get_scraping_stats(self) -> Dict[str, Any]:
         """Get scraping statistics"""
+        request_count = {domain: state.count for domain, state in self._domain_state.items()}
         return {
             'cache_size': len(self.cache),
-            'domains_scraped': len(self.request_count),
-            'total_requests': sum(self.request_count.values()),
+            'domains_scraped': len(request_count),
+            'total_requests': sum(request_count.values()),
             'robots_cache_size': len(self.robots_cache),
-            'request_count_by_domain': self.request_count
+            'request_count_by_domain': request_count
         }
     
-    def clear_cache(self):
+    def invalidate(self, url_prefix: str) -> int:
+        """
+        Evict cached pages whose URL starts with url_prefix from every cache tier
+        
+        With a shared Redis cache the prefix is also published, so other scrapers
+        drop their in-memory copies instead of serving them until cache_duration
+        runs out. Call this when pages are known to have changed (e.g. from a
+        sitemap watcher or webhook).
+        
+        Args:
+            url_prefix: URL prefix to evict (a full URL evicts just that page)
+            
+        Returns:
+            Number of entries evicted from this scraper's memory and disk caches
+        """
+        evicted = self._evict_from_memory(url_prefix)
+        
+        shared = self._get_shared_cache()
+        if shared is not None:
+            try:
+                # Every indexed page whose URL starts with url_prefix (no UTF-8 byte is 0xff)
+                lower = b'[' + url_prefix.encode('utf-8')
+                members = shared.zrangebylex(_REDIS_URL_INDEX, lower, lower + b'\xff')
+                if members:
+                    pipeline = shared.pipeline()
+                    pipeline.delete(*[
+                        _REDIS_KEY_PREFIX + member.rsplit(b'\0', 1)[1].decode('ascii') for member in members
+                    ])
+                    pipeline.zrem(_REDIS_URL_INDEX, *members)
+                    pipeline.execute()
+                shared.publish(_INVALIDATION_CHANNEL, url_prefix)
+            except redis.RedisError as e:
+                self.logger.warning(f"Failed to invalidate shared cache: {str(e)}")
+        
+        db = self._get_disk_cache()
+        if db is not None:
+            try:
+                with self._cache_db_lock:
+                    cursor = db.execute(
+                        "DELETE FROM pages WHERE substr(json_extract(data, '$.url'), 1, length(?)) = ?",
+                        (url_prefix, url_prefix)
+                    )
+                    db.commit()
+                evicted += cursor.rowcount
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to invalidate persistent cache: {str(e)}")
+        
+        self.logger.info(f"Invalidated cached pages under {url_prefix}")
+        return evicted
+    
+    def clear_cache(self) -> None:
         """Clear the content cache"""
-        self.cache.clear()
+        with self._cache_lock:
+            self.cache.clear()
+        
+        shared = self._get_shared_cache()
+        if shared is not None:
+            try:
+                keys = list(shared.scan_iter(match=_REDIS_KEY_PREFIX + '*', count=500))
+                shared.delete(_REDIS_URL_INDEX, *keys)
+            except redis.RedisError as e:
+                self.logger.warning(f"Failed to clear shared cache: {str(e)}")
+        
+        db = self._get_disk_cache()
+        if db is not None:
+            try:
+                with self._cache_db_lock:
+                    db.execute('DELETE FROM pages')
+                    db.commit()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to clear persistent cache: {str(e)}")
         self.logger.info("Scraper cache cleared")
+    
+    def close(self) -> None:
+        """Shut down the parse pool and release the HTTP session and shared and persistent caches"""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        
+        self.session.close()
+        for session in self._fallback_sessions.values():
+            session.close()
+        self._fallback_sessions.clear()
+        
+        if self._invalidation_thread is not None:
+            self._invalidation_thread.stop()
+            self._invalidation_thread = None
+        
+        if self._redis is not None:
+            self._redis.close()
+            self._redis = None
+        
+        if self._cache_db is not None:
+            with self._cache_db_lock:
+                self._cache_db.close()
+                self._cache_db = None
 
 # Utility functions for content analysis
+
+# Title terms per page category, matched by extract_page_category
+_TITLE_CATEGORY_TERMS = {
+    'pricing': ['pricing', 'plans', 'packages'],
+    'features': ['features', 'capabilities', 'product'],
+    'blog': ['blog', 'news', 'article', 'post'],
+    'careers': ['careers', 'jobs', 'employment'],
+    'contact': ['contact', 'support', 'help'],
+    'about': ['about', 'company', 'story'],
+}
+
+# Zero-width lookahead so terms overlapping each other are all found
+_TITLE_CATEGORY_RE = re.compile('(?=(?:' + '|'.join(
+    f'(?P<{category}>' + '|'.join(map(re.escape, terms)) + ')'
+    for category, terms in _TITLE_CATEGORY_TERMS.items()
+) + '))')
+_PRICING_TEXT_RE = re.compile(r'pricing|subscription|plan')
+
+def _row_count(columns: Union[Dict[str, List[Any]], List[Any], None]) -> int:
+    """Number of rows in a column dict (links, images), also accepting results cached as a list of rows"""
+    if not columns:
+        return 0
+    if isinstance(columns, dict):
+        return len(next(iter(columns.values())))
+    return len(columns)
+
+def load_scraped_pages(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream page results written by scrape_multiple_pages(output_path=...)
+    
+    Args:
+        path: NDJSON file with one scraped page per line
+        
+    Yields:
+        Scraped page dictionaries, one at a time
+    """
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _load_json(line)
+
 def extract_page_category(scraped_data: Dict[str, Any]) -> str:
     """
     Determine page category based on scraped content
@@ -607,35 +1707,38 @@ def extract_page_category(scraped_data: Dict[str, Any]) -> str:
         return "unknown"
     
     title = scraped_data.get('title', '').lower()
-    text = scraped_data.get('clean_text', '').lower()
+    text_start = scraped_data.get('clean_text', '')[:1000].lower()
     pricing_indicators = scraped_data.get('pricing_indicators', {})
     
+    # One scan of the title finds every category it mentions
+    title_categories = {match.lastgroup for match in _TITLE_CATEGORY_RE.finditer(title)}
+    
     # Check for pricing page
     if (pricing_indicators.get('currency_symbols') or 
-        any(term in title for term in ['pricing', 'plans', 'packages']) or
-        any(term in text[:1000] for term in ['pricing', 'subscription', 'plan'])):
+        'pricing' in title_categories or
+        _PRICING_TEXT_RE.search(text_start)):
         return "pricing"
     
     # Check for features page
-    if (any(term in title for term in ['features', 'capabilities', 'product']) or
+    if ('features' in title_categories or
         len(scraped_data.get('feature_lists', [])) > 5):
         return "features"
     
     # Check for blog/news
-    if any(term in title for term in ['blog', 'news', 'article', 'post']):
+    if 'blog' in title_categories:
         return "blog"
     
     # Check for careers
-    if any(term in title for term in ['careers', 'jobs', 'employment']):
+    if 'careers' in title_categories:
         return "careers"
     
     # Check for contact
-    if (any(term in title for term in ['contact', 'support', 'help']) or
+    if ('contact' in title_categories or
         scraped_data.get('contact_info', {}).get('emails')):
         return "contact"
     
     # Check for about
-    if any(term in title for term in ['about', 'company', 'story']):
+    if 'about' in title_categories:
         return "about"
     
     return "other"
@@ -650,7 +1753,7 @@ def analyze_content_quality(scraped_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Content quality analysis
     """
-    quality = {
+    quality: Dict[str, Any] = {
         'completeness_score': 0,
         'content_richness': 0,
         'structure_quality': 0,
@@ -668,8 +1771,8 @@ def analyze_content_quality(scraped_data: Dict[str, Any]) -> Dict[str, Any]:
     
     # Check content richness
     word_count = scraped_data.get('word_count', 0)
-    image_count = len(scraped_data.get('images', []))
-    link_count = len(scraped_data.get('links', []))
+    image_count = _row_count(scraped_data.get('images'))
+    link_count = _row_count(scraped_data.get('links'))
     
     quality['content_richness'] = min(100, (word_count / 10) + (image_count * 5) + (link_count * 2))
     
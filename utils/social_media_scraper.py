@@ -19,17 +19,28 @@ Supported Platforms:
 - Software Advice
 """
 
+import asyncio
 import logging
+import math
+import os
 import re
 import time
 import random
 import json
-from typing import Dict, List, Optional, Any, Tuple
+import queue
+import threading
+from collections import OrderedDict
+from typing import IO, Dict, List, Optional, Any, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from bs4 import BeautifulSoup, Tag
+import soupsieve
 from datetime import datetime, timedelta
 import requests
 import hashlib
+import heapq
+from bisect import bisect_right
 
 # Try to import Selenium, make it optional
 try:
@@ -60,15 +71,251 @@ except ImportError:
     class WebDriverException(Exception):  # type: ignore
         pass
 
-from .scraper import WebScraper
+# Optional compact language identifier (CLD3)
+try:
+    import gcld3
+    CLD3_AVAILABLE = True
+except ImportError:
+    CLD3_AVAILABLE = False
+
+from .scraper import WebScraper, HTTPX_AVAILABLE, PARALLEL_PARSE_THRESHOLD, _dump_json_line
 from .country_localization import country_localization
 from .logger import log_execution_time, log_function_call
 
+# Complaint keywords with weights
+_COMPLAINT_KEYWORDS = {
+    'terrible': 0.9, 'awful': 0.9, 'worst': 0.8, 'hate': 0.8,
+    'disappointed': 0.7, 'frustrated': 0.7, 'angry': 0.7,
+    'complaint': 0.8, 'problem': 0.7, 'issue': 0.6, 'bug': 0.6,
+    'broken': 0.8, 'doesn\'t work': 0.9, 'not working': 0.8,
+    'support': 0.5, 'help': 0.4, 'slow': 0.6, 'expensive': 0.6,
+    'overpriced': 0.7, 'waste of money': 0.9, 'regret': 0.8,
+    'avoid': 0.9, 'poor quality': 0.8, 'unreliable': 0.7,
+    'crashed': 0.8, 'down': 0.6, 'offline': 0.7, 'glitch': 0.7,
+    'fails': 0.7, 'error': 0.6, 'timeout': 0.6, 'freeze': 0.7,
+    'unstable': 0.7, 'buggy': 0.8, 'useless': 0.8, 'horrible': 0.9
+}
+
+
+def _first_char_alternation(keywords: List[str]) -> str:
+    """
+    Regex alternation of keywords factored by their first character
+    
+    Positions whose character starts no keyword fail after one test instead of
+    trying every alternative. Keywords stay longest first within each group.
+    """
+    groups: Dict[str, List[str]] = {}
+    for keyword in sorted(keywords, key=len, reverse=True):
+        groups.setdefault(keyword[0], []).append(keyword[1:])
+    return '|'.join(
+        re.escape(first) + '(?:' + '|'.join(re.escape(rest) for rest in rests) + ')'
+        for first, rests in groups.items()
+    )
+
+
+# One overlapping scan finds every keyword: the lookahead reports the longest keyword
+# starting at each position, and _COMPLAINT_CONTAINED maps it to every keyword it
+# contains (e.g. 'buggy' -> 'bug'), which keeps plain substring semantics
+_COMPLAINT_RE = re.compile('(?=(' + _first_char_alternation(list(_COMPLAINT_KEYWORDS)) + '))')
+_COMPLAINT_CONTAINED = {
+    keyword: [other for other in _COMPLAINT_KEYWORDS if other in keyword]
+    for keyword in _COMPLAINT_KEYWORDS
+}
+
+
+def _complaint_scores(texts: List[str]) -> List[float]:
+    """
+    Complaint scores (0-1) for many texts from one keyword scan
+    
+    The lowercased texts are joined with newlines, which no keyword contains, so
+    every hit falls inside a single text and is attributed to it by offset.
+    """
+    lowered = [text.lower() if text else '' for text in texts]
+    starts = []
+    offset = 0
+    for text in lowered:
+        starts.append(offset)
+        offset += len(text) + 1
+    
+    present = [set() for _ in lowered]
+    for match in _COMPLAINT_RE.finditer('\n'.join(lowered)):
+        present[bisect_right(starts, match.start()) - 1].update(_COMPLAINT_CONTAINED[match.group(1)])
+    
+    scores = []
+    for found in present:
+        if not found:
+            scores.append(0.0)
+            continue
+        
+        # Sum in keyword order so scores match scoring each text on its own
+        score = sum(weight for keyword, weight in _COMPLAINT_KEYWORDS.items() if keyword in found)
+        scores.append(min(score / len(found), 1.0))
+    
+    return scores
+
+# Review rating patterns, tried in order
+_RATING_PATTERNS = [
+    re.compile(r'(\d+(?:\.\d+)?)\s*(?:out of|\/)\s*5'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*star'),
+    re.compile(r'rating[:\s]*(\d+(?:\.\d+)?)'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*\/\s*5')
+]
+# span/div elements whose class mentions star or rating
+_RATING_ELEMENTS = soupsieve.compile(
+    'span[class*="star"], span[class*="rating"], div[class*="star"], div[class*="rating"]'
+)
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Language detection: CLD3 reads a sample of each text; without it (or when it is
+# unsure) the script of the characters decides, in this order of precedence
+_LANGUAGE_SAMPLE_CHARS = 400
+_LANGUAGE_SAMPLE_LIMIT = 4000
+_SCRIPT_LANGUAGES = [
+    ('zh', re.compile(r'[一-龯]')),
+    ('ru', re.compile(r'[а-яё]', re.IGNORECASE)),
+    ('ja', re.compile(r'[あ-んア-ンー]')),
+    ('ko', re.compile(r'[가-힣]'))
+]
+# Any of the scripts above (none of them but Cyrillic has case), to skip Latin-only texts in one scan
+_ANY_SCRIPT_RE = re.compile('|'.join(pattern.pattern for _, pattern in _SCRIPT_LANGUAGES), re.IGNORECASE)
+
+# Opening tags of the comments on comment-heavy platforms; pages larger than
+# _LARGE_PAGE_CHARS are only parsed up to the comment after the last one kept
+_LARGE_PAGE_CHARS = 512_000
+_COMMENT_START_RES = {
+    'youtube': re.compile(r'<div\b[^>]*\bid=["\']content-text["\']', re.IGNORECASE),
+    'reddit': re.compile(r'<div\b[^>]*\bclass=["\'][^"\']*\b[Cc]omment\b')
+}
+
+
+class _SelectorChain:
+    """
+    Fallback CSS selectors where the first one with usable matches wins
+    
+    All selectors are evaluated in one traversal through their compiled union;
+    each hit is credited to the earliest selector it matches, which gives the
+    same result as trying the selectors one after another.
+    """
+    
+    def __init__(self, selectors: List[str]):
+        self.selectors = [soupsieve.compile(selector) for selector in selectors]
+        self.union = soupsieve.compile(', '.join(selectors))
+    
+    def matches(self, soup: BeautifulSoup, min_length: int) -> List[Tuple[Tag, str]]:
+        """(element, text) pairs for the first selector with text longer than min_length"""
+        buckets: Dict[int, List[Tuple[Tag, str]]] = {}
+        for element in self.union.select(soup):
+            text = element.get_text(strip=True)
+            if text and len(text) > min_length:
+                index = next(i for i, selector in enumerate(self.selectors) if selector.match(element))
+                buckets.setdefault(index, []).append((element, text))
+        return buckets[min(buckets)] if buckets else []
+
+
+_FACEBOOK_POSTS = _SelectorChain([
+    '[data-testid="story-subtilted-top-level"] [data-testid="story-subtitle"]',
+    '[data-ft="top_level_post_id"]',
+    '[data-testid="story-subtitle"]',
+    '.userContent'
+])
+
+_TWITTER_POSTS = _SelectorChain([
+    '[data-testid="tweet"]',
+    '.tweet-text',
+    '.TweetTextSize',
+    '.tweet-content'  # Nitter
+])
+
+# Single-selector platform layouts
+_YOUTUBE_COMMENTS = soupsieve.compile('div#content-text')
+_INSTAGRAM_CAPTIONS = soupsieve.compile('div.C4VMK')
+_LINKEDIN_POSTS = soupsieve.compile('div.feed-shared-update-v2__description')
+_REDDIT_POSTS = soupsieve.compile('div.Post')
+_REDDIT_COMMENTS = soupsieve.compile('div.Comment')
+_REDDIT_TITLE = soupsieve.compile('h3')
+_REDDIT_BODY = soupsieve.compile('div.RichTextJSON-root')
+
+# old.reddit.com layout, served by the Reddit mirror
+_OLD_REDDIT_POSTS = soupsieve.compile('div.thing.link')
+_OLD_REDDIT_COMMENTS = soupsieve.compile('div.thing.comment')
+_OLD_REDDIT_TITLE = soupsieve.compile('a.title')
+_OLD_REDDIT_BODY = soupsieve.compile('div.usertext-body div.md')
+
+_REVIEW_SITE_REVIEWS = {
+    'g2': _SelectorChain(['div[data-testid="review-text"]', '.review-text', '.review-content']),
+    'capterra': _SelectorChain(['.review-text', '.review-content', '.review-body']),
+    'trustpilot': _SelectorChain(['.review-content', '.review-text', '[data-service-review-text-typography]']),
+    'getapp': _SelectorChain(['.review-text', '.review-content', '.review-body'])
+}
+_DEFAULT_REVIEWS = _SelectorChain(['.review-text', '.review-content'])
+
+
+# Scraper used by extract pool workers, set once per worker by the initializer
+_worker_extractor: Optional['SocialMediaScraperBase'] = None
+
+
+def _init_extract_worker(config) -> None:
+    """Process pool initializer: build one extractor per worker."""
+    global _worker_extractor
+    _worker_extractor = SocialMediaScraperBase(config)
+
+
+def _extract_page(html: str, platform: str, url: str, country_code: str) -> Optional[Dict[str, Any]]:
+    """Process pool task: parse one fetched page, extract its content and score it."""
+    content = _worker_extractor._extract_scraped_page({'raw_html': html}, platform, url)
+    return _worker_extractor._finish_content(content, platform, country_code)
+
+
 class SocialMediaScraperBase:
     """
     Base class for social media scrapers with common functionality
     """
     
+    # Minimum seconds between requests per platform (others use social_media_delay)
+    _PLATFORM_DELAYS = {
+        'facebook': 5.0,
+        'twitter': 3.0,
+        'youtube': 2.0,
+        'instagram': 4.0,
+        'linkedin': 3.0,
+        'reddit': 2.0,
+        'g2': 2.0,
+        'capterra': 2.0,
+        'trustpilot': 2.0
+    }
+    
+    # Platforms that need a rendered page (scraped with Selenium when enabled)
+    _JS_HEAVY_PLATFORMS = ('facebook', 'twitter', 'instagram', 'youtube')
+    
+    # Element Selenium waits for before reading a rendered page, per platform
+    _SELENIUM_WAIT_SELECTORS = {
+        'facebook': '[data-testid="post_message"]',
+        'twitter': '[data-testid="tweet"]',
+        'youtube': '#comments'
+    }
+    
+    # Content extractor method per platform; review sites share one extractor
+    _PLATFORM_EXTRACTORS = {
+        'facebook': '_extract_facebook_content',
+        'twitter': '_extract_twitter_content',
+        'youtube': '_extract_youtube_content',
+        'instagram': '_extract_instagram_content',
+        'linkedin': '_extract_linkedin_content',
+        'reddit': '_extract_reddit_content'
+    }
+    _REVIEW_SITES = frozenset({'g2', 'capterra', 'trustpilot', 'getapp'})
+    
+    # Server-rendered mirrors fetched over plain HTTP instead of rendering the live site
+    _MIRROR_HOSTS = {
+        'twitter.com': 'nitter.net',
+        'www.twitter.com': 'nitter.net',
+        'mobile.twitter.com': 'nitter.net',
+        'x.com': 'nitter.net',
+        'www.x.com': 'nitter.net',
+        'reddit.com': 'old.reddit.com',
+        'www.reddit.com': 'old.reddit.com'
+    }
+    
     def __init__(self, config=None):
         """
         Initialize base social media scraper
@@ -83,7 +330,12 @@ class SocialMediaScraperBase:
         self.request_delay = getattr(config, 'social_media_delay', 3.0)
         self.max_retries = getattr(config, 'max_retries', 3)
         self.timeout = getattr(config, 'request_timeout', 30)
+        self.max_concurrent_requests = getattr(config, 'max_concurrent_requests', 10)
+        self.max_connections_per_host = getattr(config, 'max_connections_per_host', 4)
         self.use_selenium = getattr(config, 'use_selenium', False) and SELENIUM_AVAILABLE
+        self.mirror_hosts = getattr(config, 'social_mirror_hosts', self._MIRROR_HOSTS)
+        self.max_comments_per_page = getattr(config, 'max_comments_per_page', 200)
+        self.max_posts_per_page = getattr(config, 'max_posts_per_page', 50)
         
         # Log Selenium availability
         if not SELENIUM_AVAILABLE:
@@ -93,8 +345,12 @@ class SocialMediaScraperBase:
         # Initialize basic scraper
         self.scraper = WebScraper(config)
         
-        # Selenium driver (initialized when needed)
-        self.driver = None
+        # Selenium drivers, started when first needed and kept for reuse; up to
+        # max_browser_drivers pages render at once, each on its own driver
+        self.max_browser_drivers = max(1, getattr(config, 'max_browser_drivers', 2))
+        self._driver_pool = queue.Queue()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
         self.driver_options = None
         
         # Anti-bot measures
@@ -110,20 +366,38 @@ class SocialMediaScraperBase:
         self.last_request_time = {}
         self.request_count = {}
         
-        # Content cache
-        self.content_cache = {}
-        self.cache_duration = 3600  # 1 hour
+        # Content cache of scraped URLs (LRU-bounded, entries also expire after cache_duration)
+        self.content_cache = OrderedDict()
+        self.cache_duration = getattr(config, 'cache_duration', 3600)  # 1 hour
+        self.max_cache_entries = getattr(config, 'max_cache_entries', 500)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._content_cache_lock = threading.Lock()
+        
+        # Extracted content of recently parsed pages, keyed by platform and HTML digest
+        self._parse_cache = OrderedDict()
+        self.max_parse_cache_entries = getattr(config, 'max_parse_cache_entries', 512)
+        
+        # CLD3 identifiers are not shared between threads, so each thread creates its own
+        self._language_identifiers = threading.local()
+        
+        # Detected language per digest of a page's texts (LRU-bounded)
+        self._language_cache = OrderedDict()
+        self.max_language_cache_entries = getattr(config, 'max_language_cache_entries', 1024)
+        
+        # Process pool parsing fetched pages for larger concurrent batches (started on first use)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
     
-    def _setup_selenium_driver(self) -> bool:
+    def _setup_selenium_driver(self) -> Optional[Any]:
         """
-        Set up Selenium Chrome driver with anti-detection measures
+        Set up a Selenium Chrome driver with anti-detection measures
         
         Returns:
-            True if driver setup successful, False otherwise
+            The new driver, or None if setup failed
         """
         if not SELENIUM_AVAILABLE:
             self.logger.error("Selenium not available. Cannot set up driver.")
-            return False
+            return None
             
         try:
             # Chrome options for anti-detection
@@ -135,65 +409,113 @@ class SocialMediaScraperBase:
             self.driver_options.add_experimental_option('useAutomationExtension', False)
             self.driver_options.add_argument('--disable-extensions')
             self.driver_options.add_argument('--disable-plugins')
-            self.driver_options.add_argument('--disable-images')
-            self.driver_options.add_argument('--disable-javascript')
             self.driver_options.add_argument(f'--user-agent={random.choice(self.user_agents)}')
             
+            # Pages are rendered for their scripts, so keep JavaScript but skip images,
+            # and hand the page back at DOMContentLoaded (the waits below cover the rest)
+            self.driver_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+            self.driver_options.page_load_strategy = 'eager'
+            
             # Headless mode for production
             if getattr(self.config, 'headless_browser', True):
-                self.driver_options.add_argument('--headless')
+                self.driver_options.add_argument('--headless=new')
             
             # Initialize driver
-            self.driver = webdriver.Chrome(options=self.driver_options)  # type: ignore
+            driver = webdriver.Chrome(options=self.driver_options)  # type: ignore
             
             # Execute script to remove webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")  # type: ignore
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")  # type: ignore
             
             self.logger.info("Selenium driver initialized successfully")
-            return True
+            return driver
             
         except Exception as e:
             self.logger.error(f"Failed to setup Selenium driver: {str(e)}")
-            return False
+            return None
     
-    def _rate_limit(self, platform: str):
+    def _checkout_driver(self) -> Optional[Any]:
         """
-        Implement platform-specific rate limiting
+        Take a driver from the pool, starting a new one while fewer than
+        max_browser_drivers exist, otherwise waiting for one to be returned
+        
+        Returns:
+            A driver for exclusive use until _return_driver, or None if none became available
+        """
+        try:
+            return self._driver_pool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._drivers_lock:
+            start_new = len(self._drivers) < self.max_browser_drivers
+            if start_new:
+                # Reserve the slot while Chrome starts outside the lock
+                self._drivers.append(None)
+        
+        if not start_new:
+            try:
+                return self._driver_pool.get(timeout=self.timeout)
+            except queue.Empty:
+                self.logger.warning("Timed out waiting for a free Selenium driver")
+                return None
+        
+        driver = self._setup_selenium_driver()
+        with self._drivers_lock:
+            self._drivers.remove(None)
+            if driver is not None:
+                self._drivers.append(driver)
+        return driver
+    
+    def _return_driver(self, driver: Any) -> None:
+        """Hand a checked-out driver back to the pool"""
+        self._driver_pool.put(driver)
+    
+    def _reserve_request(self, platform: str) -> float:
+        """
+        Book the platform's next request slot and return how long to wait before sending
+        
+        The slot is recorded immediately, so concurrent callers queue up behind
+        each other instead of all seeing the same last request time.
         
         Args:
             platform: Platform name for rate limiting
         """
         now = time.time()
-        
-        # Platform-specific delays
-        platform_delays = {
-            'facebook': 5.0,
-            'twitter': 3.0,
-            'youtube': 2.0,
-            'instagram': 4.0,
-            'linkedin': 3.0,
-            'reddit': 2.0,
-            'g2': 2.0,
-            'capterra': 2.0,
-            'trustpilot': 2.0
-        }
-        
-        delay = platform_delays.get(platform.lower(), self.request_delay)
+        delay = self._PLATFORM_DELAYS.get(platform.lower(), self.request_delay)
         
         # Check if we need to wait
+        wait = 0.0
         if platform in self.last_request_time:
             elapsed = now - self.last_request_time[platform]
             if elapsed < delay:
-                sleep_time = delay - elapsed + random.uniform(0, 1)
-                time.sleep(sleep_time)
+                wait = delay - elapsed + random.uniform(0, 1)
         
         # Update tracking
-        self.last_request_time[platform] = time.time()
+        self.last_request_time[platform] = now + wait
         self.request_count[platform] = self.request_count.get(platform, 0) + 1
         
         # Add extra delay for high request counts
         if self.request_count[platform] > 10:
-            time.sleep(random.uniform(1, 3))
+            wait += random.uniform(1, 3)
+        
+        return wait
+    
+    def _rate_limit(self, platform: str):
+        """
+        Implement platform-specific rate limiting
+        
+        Args:
+            platform: Platform name for rate limiting
+        """
+        wait = self._reserve_request(platform)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def _rate_limit_async(self, platform: str):
+        """Platform-specific rate limiting without blocking the event loop"""
+        wait = self._reserve_request(platform)
+        if wait > 0:
+            await asyncio.sleep(wait)
     
     def _extract_content_with_selenium(self, url: str, platform: str) -> Optional[Dict[str, Any]]:
         """
@@ -206,52 +528,41 @@ class SocialMediaScraperBase:
         Returns:
             Extracted content or None if failed
         """
-        if not self.driver:
-            if not self._setup_selenium_driver():
-                return None
+        driver = self._checkout_driver()
+        if driver is None:
+            return None
         
         try:
             # Navigate to page
-            self.driver.get(url)  # type: ignore
+            driver.get(url)
             
             # Wait for content to load
-            wait = WebDriverWait(self.driver, self.timeout)  # type: ignore
+            wait = WebDriverWait(driver, self.timeout)  # type: ignore
             
             # Platform-specific waiting strategies
-            if platform.lower() == 'facebook':
+            wait_selector = self._SELENIUM_WAIT_SELECTORS.get(platform.lower())
+            if wait_selector:
                 try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="post_message"]')))  # type: ignore
-                except TimeoutException:  # type: ignore
-                    pass
-            
-            elif platform.lower() == 'twitter':
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]')))  # type: ignore
-                except TimeoutException:  # type: ignore
-                    pass
-            
-            elif platform.lower() == 'youtube':
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '#comments')))  # type: ignore
+                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector)))  # type: ignore
                 except TimeoutException:  # type: ignore
                     pass
             
             # Random scroll to simulate human behavior
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")  # type: ignore
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
             time.sleep(random.uniform(1, 2))
             
             # Get page source
-            page_source = self.driver.page_source  # type: ignore
+            page_source = driver.page_source
             
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Extract content based on platform
-            return self._extract_platform_content(soup, platform, url)
+            # Parse with BeautifulSoup and extract content based on platform
+            return self._extract_html(page_source, platform, url)
             
         except Exception as e:
             self.logger.error(f"Error extracting content with Selenium from {url}: {str(e)}")
             return None
+        
+        finally:
+            self._return_driver(driver)
     
     def _extract_platform_content(self, soup: BeautifulSoup, platform: str, url: str) -> Dict[str, Any]:
         """
@@ -265,6 +576,7 @@ class SocialMediaScraperBase:
         Returns:
             Extracted content dictionary
         """
+        # Posts, comments and reviews extracted from this page share its timestamp
         content = {
             'url': url,
             'platform': platform,
@@ -275,153 +587,108 @@ class SocialMediaScraperBase:
             'metadata': {}
         }
         
-        # Platform-specific extraction
-        if platform.lower() == 'facebook':
-            content = self._extract_facebook_content(soup, content)
-        elif platform.lower() == 'twitter':
-            content = self._extract_twitter_content(soup, content)
-        elif platform.lower() == 'youtube':
-            content = self._extract_youtube_content(soup, content)
-        elif platform.lower() == 'instagram':
-            content = self._extract_instagram_content(soup, content)
-        elif platform.lower() == 'linkedin':
-            content = self._extract_linkedin_content(soup, content)
-        elif platform.lower() == 'reddit':
-            content = self._extract_reddit_content(soup, content)
-        elif platform.lower() in ['g2', 'capterra', 'trustpilot', 'getapp']:
-            content = self._extract_review_site_content(soup, content, platform)
+        # Platform-specific extraction, appending to content in place
+        platform_key = platform.lower()
+        extractor = self._PLATFORM_EXTRACTORS.get(platform_key)
+        if extractor:
+            getattr(self, extractor)(soup, content)
+        elif platform_key in self._REVIEW_SITES:
+            self._extract_review_site_content(soup, content, platform)
         
         return content
     
-    def _extract_facebook_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_facebook_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> None:
         """Extract Facebook-specific content"""
         try:
             # Look for posts
-            post_selectors = [
-                '[data-testid="story-subtilted-top-level"] [data-testid="story-subtitle"]',
-                '[data-ft="top_level_post_id"]',
-                '[data-testid="story-subtitle"]',
-                '.userContent'
-            ]
-            
-            for selector in post_selectors:
-                posts = soup.select(selector)
-                for post in posts:
-                    text = post.get_text(strip=True)
-                    if text and len(text) > 20:
-                        content['posts'].append({
-                            'text': text,
-                            'platform': 'Facebook',
-                            'timestamp': datetime.now().isoformat()
-                        })
+            for post, text in _FACEBOOK_POSTS.matches(soup, 20):
+                content['posts'].append({
+                    'text': text,
+                    'platform': 'Facebook',
+                    'timestamp': content['timestamp']
+                })
                 
-                if content['posts']:
-                    break
-                    
         except Exception as e:
             self.logger.debug(f"Error extracting Facebook content: {str(e)}")
-        
-        return content
     
-    def _extract_twitter_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_twitter_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> None:
         """Extract Twitter-specific content"""
         try:
             # Look for tweets
-            tweet_selectors = [
-                '[data-testid="tweet"]',
-                '.tweet-text',
-                '.TweetTextSize'
-            ]
-            
-            for selector in tweet_selectors:
-                tweets = soup.select(selector)
-                for tweet in tweets:
-                    text = tweet.get_text(strip=True)
-                    if text and len(text) > 10:
-                        content['posts'].append({
-                            'text': text,
-                            'platform': 'Twitter',
-                            'timestamp': datetime.now().isoformat()
-                        })
+            for tweet, text in _TWITTER_POSTS.matches(soup, 10):
+                content['posts'].append({
+                    'text': text,
+                    'platform': 'Twitter',
+                    'timestamp': content['timestamp']
+                })
                 
-                if content['posts']:
-                    break
-                    
         except Exception as e:
             self.logger.debug(f"Error extracting Twitter content: {str(e)}")
-        
-        return content
     
-    def _extract_youtube_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_youtube_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> None:
         """Extract YouTube-specific content"""
-        # YouTube comments
-        comments = soup.find_all(['div'], {'id': 'content-text'})
-        
-        for comment in comments:
+        # YouTube comments, walking the page only until enough are found
+        for comment in _YOUTUBE_COMMENTS.iselect(soup):
+            if len(content['comments']) >= self.max_comments_per_page:
+                break
             try:
                 comment_text = comment.get_text(strip=True)
                 if comment_text and len(comment_text) > 10:
                     content['comments'].append({
                         'text': comment_text,
                         'platform': 'youtube',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': content['timestamp']
                     })
             except Exception as e:
                 self.logger.debug(f"Error extracting YouTube comment: {str(e)}")
-        
-        return content
     
-    def _extract_instagram_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_instagram_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> None:
         """Extract Instagram-specific content"""
         # Instagram post captions
-        captions = soup.find_all(['div'], {'class': 'C4VMK'})
-        
-        for caption in captions:
+        for caption in _INSTAGRAM_CAPTIONS.iselect(soup):
+            if len(content['posts']) >= self.max_posts_per_page:
+                break
             try:
                 caption_text = caption.get_text(strip=True)
                 if caption_text:
                     content['posts'].append({
                         'text': caption_text,
                         'platform': 'instagram',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': content['timestamp']
                     })
             except Exception as e:
                 self.logger.debug(f"Error extracting Instagram caption: {str(e)}")
-        
-        return content
     
-    def _extract_linkedin_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_linkedin_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> None:
         """Extract LinkedIn-specific content"""
         # LinkedIn post content
-        posts = soup.find_all(['div'], {'class': 'feed-shared-update-v2__description'})
-        
-        for post in posts:
+        for post in _LINKEDIN_POSTS.iselect(soup):
+            if len(content['posts']) >= self.max_posts_per_page:
+                break
             try:
                 post_text = post.get_text(strip=True)
                 if post_text:
                     content['posts'].append({
                         'text': post_text,
                         'platform': 'linkedin',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': content['timestamp']
                     })
             except Exception as e:
                 self.logger.debug(f"Error extracting LinkedIn post: {str(e)}")
-        
-        return content
     
-    def _extract_reddit_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_reddit_content(self, soup: BeautifulSoup, content: Dict[str, Any]) -> None:
         """Extract Reddit-specific content"""
         # Reddit post titles and content
-        posts = soup.find_all(['div'], {'class': 'Post'})
-        
-        for post in posts:
+        for post in _REDDIT_POSTS.iselect(soup):
+            if len(content['posts']) >= self.max_posts_per_page:
+                break
             try:
                 # Post title
-                title_elem = post.find(['h3'])
+                title_elem = _REDDIT_TITLE.select_one(post)
                 title = title_elem.get_text(strip=True) if title_elem else ""
                 
                 # Post content
-                content_elem = post.find(['div'], {'class': 'RichTextJSON-root'})
+                content_elem = _REDDIT_BODY.select_one(post)
                 post_content = content_elem.get_text(strip=True) if content_elem else ""
                 
                 if title or post_content:
@@ -429,107 +696,179 @@ class SocialMediaScraperBase:
                         'title': title,
                         'text': post_content,
                         'platform': 'reddit',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': content['timestamp']
                     })
             except Exception as e:
                 self.logger.debug(f"Error extracting Reddit post: {str(e)}")
         
         # Reddit comments
-        comments = soup.find_all(['div'], {'class': 'Comment'})
-        
-        for comment in comments:
+        for comment in _REDDIT_COMMENTS.iselect(soup):
+            if len(content['comments']) >= self.max_comments_per_page:
+                break
             try:
-                comment_elem = comment.find(['div'], {'class': 'RichTextJSON-root'})
+                comment_elem = _REDDIT_BODY.select_one(comment)
                 if comment_elem:
                     comment_text = comment_elem.get_text(strip=True)
                     if comment_text:
                         content['comments'].append({
                             'text': comment_text,
                             'platform': 'reddit',
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': content['timestamp']
                         })
             except Exception as e:
                 self.logger.debug(f"Error extracting Reddit comment: {str(e)}")
         
-        return content
-    
-    def _extract_review_site_content(self, soup: BeautifulSoup, content: Dict[str, Any], platform: str) -> Dict[str, Any]:
-        """Extract review site-specific content"""
-        # Generic review extraction
-        review_selectors = {
-            'g2': ['div[data-testid="review-text"]', '.review-text', '.review-content'],
-            'capterra': ['.review-text', '.review-content', '.review-body'],
-            'trustpilot': ['.review-content', '.review-text', '[data-service-review-text-typography]'],
-            'getapp': ['.review-text', '.review-content', '.review-body']
-        }
-        
-        selectors = review_selectors.get(platform.lower(), ['.review-text', '.review-content'])
+        # old.reddit.com posts and comments
+        for post in _OLD_REDDIT_POSTS.iselect(soup):
+            if len(content['posts']) >= self.max_posts_per_page:
+                break
+            try:
+                title_elem = _OLD_REDDIT_TITLE.select_one(post)
+                title = title_elem.get_text(strip=True) if title_elem else ""
+                
+                content_elem = _OLD_REDDIT_BODY.select_one(post)
+                post_content = content_elem.get_text(strip=True) if content_elem else ""
+                
+                if title or post_content:
+                    content['posts'].append({
+                        'title': title,
+                        'text': post_content,
+                        'platform': 'reddit',
+                        'timestamp': content['timestamp']
+                    })
+            except Exception as e:
+                self.logger.debug(f"Error extracting Reddit post: {str(e)}")
         
-        for selector in selectors:
+        for comment in _OLD_REDDIT_COMMENTS.iselect(soup):
+            if len(content['comments']) >= self.max_comments_per_page:
+                break
             try:
-                reviews = soup.select(selector)
-                for review in reviews:
-                    review_text = review.get_text(strip=True)
-                    if review_text and len(review_text) > 20:
-                        # Extract rating if available
-                        rating = self._extract_review_rating(review.parent)
-                        
-                        content['reviews'].append({
-                            'text': review_text,
-                            'rating': rating,
-                            'platform': platform,
-                            'timestamp': datetime.now().isoformat()
+                # The comment's own body comes before those of its replies
+                comment_elem = _OLD_REDDIT_BODY.select_one(comment)
+                if comment_elem:
+                    comment_text = comment_elem.get_text(strip=True)
+                    if comment_text:
+                        content['comments'].append({
+                            'text': comment_text,
+                            'platform': 'reddit',
+                            'timestamp': content['timestamp']
                         })
-                
-                if content['reviews']:
-                    break  # Stop if we found reviews
-                    
             except Exception as e:
-                self.logger.debug(f"Error extracting {platform} reviews with selector {selector}: {str(e)}")
+                self.logger.debug(f"Error extracting Reddit comment: {str(e)}")
+    
+    def _extract_review_site_content(self, soup: BeautifulSoup, content: Dict[str, Any], platform: str) -> None:
+        """Extract review site-specific content"""
+        # Generic review extraction
+        selectors = _REVIEW_SITE_REVIEWS.get(platform.lower(), _DEFAULT_REVIEWS)
         
-        return content
+        try:
+            for review, review_text in selectors.matches(soup, 20):
+                # Extract rating if available
+                rating = self._extract_review_rating(review.parent)
+                
+                content['reviews'].append({
+                    'text': review_text,
+                    'rating': rating,
+                    'platform': platform,
+                    'timestamp': content['timestamp']
+                })
+                
+        except Exception as e:
+            self.logger.debug(f"Error extracting {platform} reviews: {str(e)}")
     
     def _extract_review_rating(self, review_parent) -> Optional[float]:
         """Extract review rating from parent element"""
         try:
-            # Common rating patterns
-            rating_patterns = [
-                r'(\d+(?:\.\d+)?)\s*(?:out of|\/)\s*5',
-                r'(\d+(?:\.\d+)?)\s*star',
-                r'rating[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*\/\s*5'
-            ]
-            
             text = review_parent.get_text().lower()
             
-            for pattern in rating_patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    return float(matches[0])
+            # Common rating patterns
+            for pattern in _RATING_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    return float(match.group(1))
             
-            # Look for star elements
-            stars = review_parent.find_all(['span', 'div'], {'class': re.compile(r'star|rating')})
-            if stars:
-                for star in stars:
-                    star_text = star.get_text(strip=True)
-                    numbers = re.findall(r'\d+(?:\.\d+)?', star_text)
-                    if numbers:
-                        return float(numbers[0])
+            # Look for star elements, stopping at the first one with a number
+            for star in _RATING_ELEMENTS.iselect(review_parent):
+                star_text = star.get_text(strip=True)
+                number = _NUMBER_RE.search(star_text)
+                if number:
+                    return float(number.group())
         
         except Exception as e:
             self.logger.debug(f"Error extracting review rating: {str(e)}")
         
         return None
     
+    def _content_cache_key(self, url: str, country_code: str) -> str:
+        """Cache key for one URL scraped for one country"""
+        return hashlib.sha1(f"{url}|{country_code}".encode('utf-8')).hexdigest()
+    
+    def _get_cached_content(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return content scraped within cache_duration, or None"""
+        with self._content_cache_lock:
+            entry = self.content_cache.get(cache_key)
+            if entry and time.time() - entry['timestamp'] < self.cache_duration:
+                self.content_cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                return entry['data']
+            
+            self.content_cache.pop(cache_key, None)
+            self.cache_misses += 1
+            return None
+    
+    def _cache_content(self, cache_key: str, content: Dict[str, Any]) -> None:
+        """Remember scraped content, evicting the least recently used beyond max_cache_entries"""
+        with self._content_cache_lock:
+            self.content_cache[cache_key] = {'data': content, 'timestamp': time.time()}
+            self.content_cache.move_to_end(cache_key)
+            
+            while len(self.content_cache) > self.max_cache_entries:
+                self.content_cache.popitem(last=False)
+    
     def cleanup(self):
         """Clean up resources"""
-        if self.driver:
+        with self._drivers_lock:
+            drivers = [driver for driver in self._drivers if driver is not None]
+            self._drivers = [driver for driver in self._drivers if driver is None]
+        
+        for driver in drivers:
             try:
-                self.driver.quit()
+                driver.quit()
             except Exception as e:
                 self.logger.error(f"Error cleaning up Selenium driver: {str(e)}")
-            finally:
-                self.driver = None
+        
+        # Drop the pooled references to the drivers just quit
+        while True:
+            try:
+                self._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+        
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        
+        # Release the web scraper's pooled connections, parse pool and cache handles
+        self.scraper.close()
+    
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the parse pool, starting it on first use (None if processes are unavailable)"""
+        if self._parse_pool is None:
+            try:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    initializer=_init_extract_worker,
+                    initargs=(self.config,)
+                )
+            except OSError as e:
+                self.logger.warning(f"Parse pool unavailable, parsing in process: {str(e)}")
+        return self._parse_pool
+    
+    def _discard_parse_pool(self, parse_pool: ProcessPoolExecutor) -> None:
+        """Drop a broken parse pool so the next batch starts a fresh one"""
+        if self._parse_pool is parse_pool:
+            self._parse_pool = None
+            parse_pool.shutdown(wait=False)
 
 
 class SocialMediaScraper(SocialMediaScraperBase):
@@ -552,27 +891,147 @@ class SocialMediaScraper(SocialMediaScraperBase):
             'failed_urls': 0,
             'platforms': {},
             'start_time': None,
-            'end_time': None
+            'end_time': None,
+            'cache_hits': 0,
+            'cache_misses': 0
         }
     
     @log_execution_time
-    def scrape_social_media_urls(self, urls: List[Dict[str, str]], country_code: str = 'US') -> Dict[str, Any]:
+    def scrape_social_media_urls(self, urls: List[Dict[str, str]], country_code: str = 'US',
+                                 output_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Scrape multiple social media URLs
         
+        URLs are scraped concurrently (see scrape_social_media_urls_async) when httpx
+        is installed and there is more than one URL, otherwise one after another.
+        
         Args:
             urls: List of dictionaries with 'url' and 'platform' keys
             country_code: Country code for localized analysis
+            output_path: Optional NDJSON file to stream full content to as each URL
+                completes; scraped_content then only holds url/platform/content_metrics
+                summaries (read the file back with load_scraped_pages)
             
         Returns:
             Dictionary with scraping results
         """
+        if HTTPX_AVAILABLE and len(urls) > 1:
+            return WebScraper._run_coroutine(self.scrape_social_media_urls_async(urls, country_code, output_path))
+        
+        return self._scrape_urls_sequentially(urls, country_code, output_path)
+    
+    async def scrape_social_media_urls_async(self, urls: List[Dict[str, str]], country_code: str = 'US',
+                                             output_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Scrape multiple social media URLs concurrently
+        
+        HTTP pages share one pooled client, up to max_concurrent_requests at a time.
+        Each platform is paced by its own rate limit and capped at
+        max_connections_per_host in flight, and pages waiting on their platform do
+        not hold any of the global slots, so one slow platform never stalls the
+        others. Selenium pages are rendered in worker threads, at most
+        max_browser_drivers at a time, each on a pooled driver. Same arguments and
+        result as scrape_social_media_urls.
+        """
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self._scrape_urls_sequentially, urls, country_code, output_path)
+        
+        results = self._start_results(urls, country_code)
+        output_file = open(output_path, 'wb') if output_path else None
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        selenium_slots = asyncio.Semaphore(self.max_browser_drivers)
+        
+        # Semaphores are bound to the event loop, so start each run with fresh ones
+        platform_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        # Parsing and scoring are CPU-bound, so spread them over cores for larger batches
+        parse_pool = self._get_parse_pool() if len(urls) >= PARALLEL_PARSE_THRESHOLD else None
+        
+        try:
+            async with self.scraper.create_async_client() as client:
+                
+                async def bounded_scrape(index: int, url: str, platform: str) -> Optional[Dict[str, Any]]:
+                    # Wait out the platform's pacing before taking a global slot
+                    platform_semaphore = platform_semaphores.setdefault(
+                        platform.lower(), asyncio.Semaphore(self.max_connections_per_host)
+                    )
+                    async with platform_semaphore:
+                        await self._rate_limit_async(platform)
+                        
+                        async with semaphore:
+                            self.logger.info(f"Scraping {index}/{len(urls)}: {platform} - {url}")
+                            
+                            if self._uses_selenium(url, platform):
+                                async with selenium_slots:
+                                    content = await asyncio.to_thread(self._scrape_single_url, url, platform, country_code)
+                            else:
+                                content = await self._scrape_single_url_async(client, url, platform, country_code, parse_pool)
+                    
+                    if output_file is not None:
+                        # Write content as it completes instead of holding it all
+                        self._record_result(results, url, platform, content, output_file)
+                        return None
+                    return content
+                
+                outcomes = await asyncio.gather(
+                    *(bounded_scrape(i, url_info.get('url', ''), url_info.get('platform', 'unknown'))
+                      for i, url_info in enumerate(urls, 1)),
+                    return_exceptions=True
+                )
+        finally:
+            if output_file is not None:
+                output_file.close()
+        
+        for url_info, outcome in zip(urls, outcomes):
+            url = url_info.get('url', '')
+            platform = url_info.get('platform', 'unknown')
+            
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Error scraping {platform} URL {url}: {str(outcome)}")
+                self._record_failure(results, url, platform, str(outcome))
+            elif output_file is None:
+                self._record_result(results, url, platform, outcome)
+        
+        return self._finish_results(results, output_path)
+    
+    def _scrape_urls_sequentially(self, urls: List[Dict[str, str]], country_code: str,
+                                  output_path: Optional[str] = None) -> Dict[str, Any]:
+        """Scrape URLs one after another with blocking rate limiting"""
+        results = self._start_results(urls, country_code)
+        output_file = open(output_path, 'wb') if output_path else None
+        
+        try:
+            for i, url_info in enumerate(urls, 1):
+                url = url_info.get('url', '')
+                platform = url_info.get('platform', 'unknown')
+                
+                self.logger.info(f"Scraping {i}/{len(urls)}: {platform} - {url}")
+                
+                try:
+                    # Rate limiting
+                    self._rate_limit(platform)
+                    
+                    # Scrape content
+                    content = self._scrape_single_url(url, platform, country_code)
+                    self._record_result(results, url, platform, content, output_file)
+                        
+                except Exception as e:
+                    self.logger.error(f"Error scraping {platform} URL {url}: {str(e)}")
+                    self._record_failure(results, url, platform, str(e))
+        finally:
+            if output_file is not None:
+                output_file.close()
+        
+        return self._finish_results(results, output_path)
+    
+    def _start_results(self, urls: List[Dict[str, str]], country_code: str) -> Dict[str, Any]:
+        """Create the result structure for a scraping run"""
         self.logger.info(f"Starting social media scraping for {len(urls)} URLs")
         
         self.scraping_stats['start_time'] = datetime.now()
         self.scraping_stats['total_urls'] = len(urls)
         
-        results = {
+        return {
             'scraped_content': [],
             'failed_urls': [],
             'summary': {
@@ -583,60 +1042,76 @@ class SocialMediaScraper(SocialMediaScraperBase):
                 'country_code': country_code
             }
         }
+    
+    def _record_result(self, results: Dict[str, Any], url: str, platform: str, content: Optional[Dict[str, Any]],
+                       output_file: Optional[IO[bytes]] = None) -> None:
+        """Add one URL's scraped content (or its absence) to the results and stats, streaming it to output_file if given"""
+        if not content:
+            self._record_failure(results, url, platform, 'No content extracted')
+            return
+        
+        if output_file is not None:
+            output_file.write(_dump_json_line(content))
+            content = {
+                'url': content.get('url', url),
+                'platform': content.get('platform', platform),
+                'content_metrics': content.get('content_metrics', {})
+            }
         
-        for i, url_info in enumerate(urls, 1):
-            url = url_info.get('url', '')
-            platform = url_info.get('platform', 'unknown')
-            
-            self.logger.info(f"Scraping {i}/{len(urls)}: {platform} - {url}")
-            
-            try:
-                # Rate limiting
-                self._rate_limit(platform)
-                
-                # Scrape content
-                content = self._scrape_single_url(url, platform, country_code)
-                
-                if content:
-                    results['scraped_content'].append(content)
-                    results['summary']['successful'] += 1
-                    results['summary']['platforms_scraped'].add(platform)
-                    
-                    # Update platform stats
-                    if platform not in self.scraping_stats['platforms']:
-                        self.scraping_stats['platforms'][platform] = {'successful': 0, 'failed': 0}
-                    self.scraping_stats['platforms'][platform]['successful'] += 1
-                    
-                    self.logger.debug(f"Successfully scraped {platform} content from {url}")
-                else:
-                    results['failed_urls'].append({'url': url, 'platform': platform, 'reason': 'No content extracted'})
-                    results['summary']['failed'] += 1
-                    
-                    if platform not in self.scraping_stats['platforms']:
-                        self.scraping_stats['platforms'][platform] = {'successful': 0, 'failed': 0}
-                    self.scraping_stats['platforms'][platform]['failed'] += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Error scraping {platform} URL {url}: {str(e)}")
-                results['failed_urls'].append({'url': url, 'platform': platform, 'reason': str(e)})
-                results['summary']['failed'] += 1
-                
-                if platform not in self.scraping_stats['platforms']:
-                    self.scraping_stats['platforms'][platform] = {'successful': 0, 'failed': 0}
-                self.scraping_stats['platforms'][platform]['failed'] += 1
+        results['scraped_content'].append(content)
+        results['summary']['successful'] += 1
+        results['summary']['platforms_scraped'].add(platform)
         
-        # Finalize results
+        # Update platform stats
+        if platform not in self.scraping_stats['platforms']:
+            self.scraping_stats['platforms'][platform] = {'successful': 0, 'failed': 0}
+        self.scraping_stats['platforms'][platform]['successful'] += 1
+        
+        self.logger.debug(f"Successfully scraped {platform} content from {url}")
+    
+    def _record_failure(self, results: Dict[str, Any], url: str, platform: str, reason: str) -> None:
+        """Add one failed URL to the results and platform stats"""
+        results['failed_urls'].append({'url': url, 'platform': platform, 'reason': reason})
+        results['summary']['failed'] += 1
+        
+        if platform not in self.scraping_stats['platforms']:
+            self.scraping_stats['platforms'][platform] = {'successful': 0, 'failed': 0}
+        self.scraping_stats['platforms'][platform]['failed'] += 1
+    
+    def _finish_results(self, results: Dict[str, Any], output_path: Optional[str] = None) -> Dict[str, Any]:
+        """Complete the summary and stats of a scraping run"""
+        if output_path:
+            results['output_path'] = output_path
+        
+        total_urls = results['summary']['total_urls']
         results['summary']['platforms_scraped'] = list(results['summary']['platforms_scraped'])
-        results['summary']['success_rate'] = (results['summary']['successful'] / len(urls)) * 100 if urls else 0
+        results['summary']['success_rate'] = (results['summary']['successful'] / total_urls) * 100 if total_urls else 0
         
         self.scraping_stats['end_time'] = datetime.now()
         self.scraping_stats['successful_urls'] = results['summary']['successful']
         self.scraping_stats['failed_urls'] = results['summary']['failed']
+        self.scraping_stats['cache_hits'] = self.cache_hits
+        self.scraping_stats['cache_misses'] = self.cache_misses
         
+        self.logger.debug(f"Content cache: hits={self.cache_hits}, misses={self.cache_misses}")
         self.logger.info(f"Social media scraping completed. Success rate: {results['summary']['success_rate']:.1f}%")
         
         return results
     
+    def _uses_selenium(self, url: str, platform: str) -> bool:
+        """Whether a page is rendered with Selenium (never when a mirror serves it)"""
+        return (
+            self.use_selenium
+            and platform.lower() in self._JS_HEAVY_PLATFORMS
+            and self._mirror_url(url) == url
+        )
+    
+    def _mirror_url(self, url: str) -> str:
+        """The URL on the platform's server-rendered mirror, or url itself when there is none"""
+        parsed = urlparse(url)
+        mirror = self.mirror_hosts.get(parsed.netloc.lower())
+        return parsed._replace(netloc=mirror).geturl() if mirror else url
+    
     def _scrape_single_url(self, url: str, platform: str, country_code: str) -> Optional[Dict[str, Any]]:
         """
         Scrape a single social media URL
@@ -649,40 +1124,144 @@ class SocialMediaScraper(SocialMediaScraperBase):
         Returns:
             Scraped content or None if failed
         """
+        cache_key = self._content_cache_key(url, country_code)
+        cached = self._get_cached_content(cache_key)
+        if cached:
+            self.logger.debug(f"Using cached {platform} content for {url}")
+            return cached
+        
         try:
-            # Check if platform requires Selenium
-            js_heavy_platforms = ['facebook', 'twitter', 'instagram', 'youtube']
-            
-            if platform.lower() in js_heavy_platforms and self.use_selenium:
+            if self._uses_selenium(url, platform):
                 # Use Selenium for JavaScript-heavy platforms
                 content = self._extract_content_with_selenium(url, platform)
             else:
-                # Use regular HTTP scraping
-                scraped_data = self.scraper.scrape_page(url, extract_content=True, country_code=country_code)
-                
-                if scraped_data:
-                    soup = BeautifulSoup(scraped_data.get('html', ''), 'html.parser')
-                    content = self._extract_platform_content(soup, platform, url)
-                else:
-                    content = None
+                # Use regular HTTP scraping (of the mirror if any); the extractors need the page itself
+                scraped_data = self.scraper.scrape_page(self._mirror_url(url), extract_content=False, country_code=country_code)
+                content = self._extract_scraped_page(scraped_data, platform, url)
             
-            # Post-process content
+            content = self._finish_content(content, platform, country_code)
             if content:
-                content = self._post_process_content(content, platform, country_code)
-                
-                # Add metadata
-                content['scraping_metadata'] = {
-                    'scraping_method': 'selenium' if platform.lower() in js_heavy_platforms and self.use_selenium else 'http',
-                    'country_code': country_code,
-                    'scraping_timestamp': datetime.now().isoformat()
-                }
+                self._cache_content(cache_key, content)
+            return content
             
+        except Exception as e:
+            self.logger.error(f"Error scraping {platform} URL {url}: {str(e)}")
+            return None
+    
+    async def _scrape_single_url_async(self, client: Any, url: str, platform: str, country_code: str,
+                                       parse_pool: Optional[ProcessPoolExecutor] = None) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of _scrape_single_url for HTTP-scraped platforms, over a shared client
+        
+        The page is parsed and scored in parse_pool when one is given.
+        """
+        cache_key = self._content_cache_key(url, country_code)
+        cached = self._get_cached_content(cache_key)
+        if cached:
+            self.logger.debug(f"Using cached {platform} content for {url}")
+            return cached
+        
+        try:
+            scraped_data = await self.scraper.scrape_page_async(client, self._mirror_url(url), extract_content=False, country_code=country_code)
+            content = await self._extract_page_async(scraped_data, platform, url, country_code, parse_pool)
+            if content:
+                self._cache_content(cache_key, content)
             return content
             
         except Exception as e:
             self.logger.error(f"Error scraping {platform} URL {url}: {str(e)}")
             return None
     
+    async def _extract_page_async(self, scraped_data: Optional[Dict[str, Any]], platform: str, url: str,
+                                  country_code: str, parse_pool: Optional[ProcessPoolExecutor]) -> Optional[Dict[str, Any]]:
+        """Extract and post-process a fetched page, in the parse pool when one is available"""
+        if scraped_data and parse_pool is not None:
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    parse_pool, _extract_page, scraped_data.get('raw_html', ''), platform, url, country_code
+                )
+            except BrokenProcessPool as e:
+                self.logger.warning(f"Parse pool unavailable, parsing {url} in process: {str(e)}")
+                self._discard_parse_pool(parse_pool)
+        
+        content = self._extract_scraped_page(scraped_data, platform, url)
+        return self._finish_content(content, platform, country_code)
+    
+    def _extract_scraped_page(self, scraped_data: Optional[Dict[str, Any]], platform: str, url: str) -> Optional[Dict[str, Any]]:
+        """Run the platform extractors over a page fetched by the web scraper"""
+        if not scraped_data:
+            return None
+        
+        return self._extract_html(scraped_data.get('raw_html', ''), platform, url)
+    
+    def _extract_html(self, html: str, platform: str, url: str) -> Dict[str, Any]:
+        """
+        Extract platform content from a page's HTML, reusing the extraction of an identical page
+        
+        Extractions are cached by platform and a blake2b digest of the HTML, so a body
+        served under several URLs (mirrors, redirects, retries) is parsed once.
+        """
+        cache_key = (platform.lower(), hashlib.blake2b(html.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+        with self._content_cache_lock:
+            cached = self._parse_cache.get(cache_key)
+            if cached is not None:
+                self._parse_cache.move_to_end(cache_key)
+        
+        if cached is not None:
+            return self._copy_content(cached, platform, url)
+        
+        content = self._extract_platform_content(self._parse_page(html, platform), platform, url)
+        
+        # Keep a copy, since post-processing adds scores to the returned items
+        with self._content_cache_lock:
+            self._parse_cache[cache_key] = self._copy_content(content, platform, url)
+            while len(self._parse_cache) > self.max_parse_cache_entries:
+                self._parse_cache.popitem(last=False)
+        
+        return content
+    
+    @staticmethod
+    def _copy_content(content: Dict[str, Any], platform: str, url: str) -> Dict[str, Any]:
+        """Copy extracted content (down to its items) for url, stamped now"""
+        timestamp = datetime.now().isoformat()
+        copied = dict(content, url=url, platform=platform, timestamp=timestamp, metadata=dict(content['metadata']))
+        for key in ('posts', 'comments', 'reviews'):
+            copied[key] = [dict(item, timestamp=timestamp) for item in content[key]]
+        return copied
+    
+    def _parse_page(self, html: str, platform: str) -> BeautifulSoup:
+        """
+        Parse a page for the extractors
+        
+        Large pages of comment-heavy platforms are cut just before the comment
+        following the first max_comments_per_page, so the parser never builds the
+        (often multi-megabyte) tail of the thread. The parser closes the tags left
+        open at the cut.
+        """
+        comment_start_re = _COMMENT_START_RES.get(platform.lower())
+        if comment_start_re and len(html) > _LARGE_PAGE_CHARS:
+            for seen, match in enumerate(comment_start_re.finditer(html), 1):
+                if seen > self.max_comments_per_page:
+                    html = html[:match.start()]
+                    break
+        
+        return BeautifulSoup(html, 'lxml')
+    
+    def _finish_content(self, content: Optional[Dict[str, Any]], platform: str, country_code: str) -> Optional[Dict[str, Any]]:
+        """Post-process extracted content and attach scraping metadata"""
+        if content:
+            content = self._post_process_content(content, platform, country_code)
+            
+            # Add metadata
+            content['scraping_metadata'] = {
+                'scraping_method': 'selenium' if self._uses_selenium(content['url'], platform) else 'http',
+                'country_code': country_code,
+                'scraping_timestamp': datetime.now().isoformat()
+            }
+        
+        return content
+    
     def _post_process_content(self, content: Dict[str, Any], platform: str, country_code: str) -> Dict[str, Any]:
         """
         Post-process scraped content
@@ -695,15 +1274,11 @@ class SocialMediaScraper(SocialMediaScraperBase):
         Returns:
             Processed content
         """
-        # Add complaint scoring
-        for post in content.get('posts', []):
-            post['complaint_score'] = self._calculate_complaint_score(post.get('text', ''))
-        
-        for comment in content.get('comments', []):
-            comment['complaint_score'] = self._calculate_complaint_score(comment.get('text', ''))
-        
-        for review in content.get('reviews', []):
-            review['complaint_score'] = self._calculate_complaint_score(review.get('text', ''))
+        # Add complaint scoring, for all posts, comments and reviews in one pass
+        items = content.get('posts', []) + content.get('comments', []) + content.get('reviews', [])
+        scores = _complaint_scores([item.get('text', '') for item in items])
+        for item, score in zip(items, scores):
+            item['complaint_score'] = score
         
         # Add language detection
         content['detected_language'] = self._detect_language(content)
@@ -713,7 +1288,7 @@ class SocialMediaScraper(SocialMediaScraperBase):
             'total_posts': len(content.get('posts', [])),
             'total_comments': len(content.get('comments', [])),
             'total_reviews': len(content.get('reviews', [])),
-            'avg_complaint_score': self._calculate_avg_complaint_score(content)
+            'avg_complaint_score': sum(scores) / len(scores) if scores else 0.0
         }
         
         return content
@@ -728,38 +1303,7 @@ class SocialMediaScraper(SocialMediaScraperBase):
         Returns:
             Complaint score (0-1)
         """
-        if not text:
-            return 0.0
-        
-        text_lower = text.lower()
-        
-        # Complaint keywords with weights
-        complaint_keywords = {
-            'terrible': 0.9, 'awful': 0.9, 'worst': 0.8, 'hate': 0.8,
-            'disappointed': 0.7, 'frustrated': 0.7, 'angry': 0.7,
-            'complaint': 0.8, 'problem': 0.7, 'issue': 0.6, 'bug': 0.6,
-            'broken': 0.8, 'doesn\'t work': 0.9, 'not working': 0.8,
-            'support': 0.5, 'help': 0.4, 'slow': 0.6, 'expensive': 0.6,
-            'overpriced': 0.7, 'waste of money': 0.9, 'regret': 0.8,
-            'avoid': 0.9, 'poor quality': 0.8, 'unreliable': 0.7,
-            'crashed': 0.8, 'down': 0.6, 'offline': 0.7, 'glitch': 0.7,
-            'fails': 0.7, 'error': 0.6, 'timeout': 0.6, 'freeze': 0.7,
-            'unstable': 0.7, 'buggy': 0.8, 'useless': 0.8, 'horrible': 0.9
-        }
-        
-        score = 0.0
-        word_count = 0
-        
-        for keyword, weight in complaint_keywords.items():
-            if keyword in text_lower:
-                score += weight
-                word_count += 1
-        
-        # Normalize score
-        if word_count > 0:
-            score = min(score / word_count, 1.0)
-        
-        return score
+        return _complaint_scores([text])[0]
     
     def _detect_language(self, content: Dict[str, Any]) -> str:
         """
@@ -771,28 +1315,59 @@ class SocialMediaScraper(SocialMediaScraperBase):
         Returns:
             Language code (default: 'en')
         """
-        # Simple language detection based on common words
-        # In a production system, you'd use a proper language detection library
-        
-        all_text = ""
-        for post in content.get('posts', []):
-            all_text += post.get('text', '') + " "
-        for comment in content.get('comments', []):
-            all_text += comment.get('text', '') + " "
-        for review in content.get('reviews', []):
-            all_text += review.get('text', '') + " "
-        
-        # Basic language detection patterns
-        if re.search(r'[一-龯]', all_text):
-            return 'zh'
-        elif re.search(r'[а-яё]', all_text, re.IGNORECASE):
-            return 'ru'
-        elif re.search(r'[あ-んア-ンー]', all_text):
-            return 'ja'
-        elif re.search(r'[가-힣]', all_text):
-            return 'ko'
-        else:
-            return 'en'
+        texts = [
+            item.get('text', '')
+            for key in ('posts', 'comments', 'reviews')
+            for item in content.get(key, [])
+        ]
+        
+        # Pages seen before (re-scrapes, mirrors) reuse their detected language
+        cache_key = hashlib.blake2b('\x00'.join(texts).encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._content_cache_lock:
+            language = self._language_cache.get(cache_key)
+            if language is not None:
+                self._language_cache.move_to_end(cache_key)
+                return language
+        
+        language = self._identify_language(texts)
+        
+        with self._content_cache_lock:
+            self._language_cache[cache_key] = language
+            while len(self._language_cache) > self.max_language_cache_entries:
+                self._language_cache.popitem(last=False)
+        
+        return language
+    
+    def _identify_language(self, texts: List[str]) -> str:
+        """Language code of a page's texts (default: 'en')"""
+        # One identification over a sample of every text
+        if CLD3_AVAILABLE:
+            sample = ' '.join(text[:_LANGUAGE_SAMPLE_CHARS] for text in texts)[:_LANGUAGE_SAMPLE_LIMIT]
+            result = self._get_language_identifier().FindLanguage(text=sample)
+            if result.is_reliable:
+                return result.language
+        
+        # Basic language detection patterns in one pass over the texts: the earliest
+        # script in _SCRIPT_LANGUAGES found in any text wins
+        best = len(_SCRIPT_LANGUAGES)
+        for text in texts:
+            if not _ANY_SCRIPT_RE.search(text):
+                continue
+            for index in range(best):
+                if _SCRIPT_LANGUAGES[index][1].search(text):
+                    best = index
+                    break
+            if best == 0:
+                break
+        return _SCRIPT_LANGUAGES[best][0] if best < len(_SCRIPT_LANGUAGES) else 'en'
+    
+    def _get_language_identifier(self) -> 'gcld3.NNetLanguageIdentifier':
+        """Return this thread's CLD3 identifier, creating it on first use"""
+        identifier = getattr(self._language_identifiers, 'identifier', None)
+        if identifier is None:
+            identifier = gcld3.NNetLanguageIdentifier(min_num_bytes=20, max_num_bytes=_LANGUAGE_SAMPLE_LIMIT)
+            self._language_identifiers.identifier = identifier
+        return identifier
     
     def _calculate_avg_complaint_score(self, content: Dict[str, Any]) -> float:
         """
@@ -804,18 +1379,15 @@ class SocialMediaScraper(SocialMediaScraperBase):
         Returns:
             Average complaint score
         """
-        scores = []
-        
-        for post in content.get('posts', []):
-            scores.append(post.get('complaint_score', 0))
-        
-        for comment in content.get('comments', []):
-            scores.append(comment.get('complaint_score', 0))
-        
-        for review in content.get('reviews', []):
-            scores.append(review.get('complaint_score', 0))
+        count = sum(len(content.get(key, ())) for key in ('posts', 'comments', 'reviews'))
+        if not count:
+            return 0.0
         
-        return sum(scores) / len(scores) if scores else 0.0
+        return math.fsum(
+            item.get('complaint_score', 0)
+            for key in ('posts', 'comments', 'reviews')
+            for item in content.get(key, ())
+        ) / count
     
     def get_scraping_stats(self) -> Dict[str, Any]:
         """
@@ -830,6 +1402,9 @@ class SocialMediaScraper(SocialMediaScraperBase):
         """Clean up resources"""
         super().cleanup()
         self.scraped_content.clear()
+        self.content_cache.clear()
+        self._parse_cache.clear()
+        self._language_cache.clear()
 
 
 def create_social_media_urls_from_search_results(search_results: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -842,22 +1417,19 @@ def create_social_media_urls_from_search_results(search_results: Dict[str, Any])
     Returns:
         List of URL dictionaries for social media scraping
     """
-    urls = []
-    
-    for platform, platform_data in search_results.get('platforms', {}).items():
-        for result in platform_data.get('search_results', []):
-            url = result.get('url', '')
-            if url:
-                urls.append({
-                    'url': url,
-                    'platform': platform,
-                    'title': result.get('title', ''),
-                    'description': result.get('description', ''),
-                    'complaint_score': result.get('complaint_score', 0),
-                    'query': result.get('query', '')
-                })
-    
-    return urls
+    return [
+        {
+            'url': result['url'],
+            'platform': platform,
+            'title': result.get('title', ''),
+            'description': result.get('description', ''),
+            'complaint_score': result.get('complaint_score', 0),
+            'query': result.get('query', '')
+        }
+        for platform, platform_data in search_results.get('platforms', {}).items()
+        for result in platform_data.get('search_results', [])
+        if result.get('url')
+    ]
 
 
 def analyze_social_media_content(scraping_results: Dict[str, Any]) -> Dict[str, Any]:
@@ -886,6 +1458,9 @@ def analyze_social_media_content(scraping_results: Dict[str, Any]) -> Dict[str,
         }
     }
     
+    # Items and their complaint scores per platform, aggregated after the content loop
+    items_by_platform: Dict[str, Tuple[List[Dict[str, Any]], List[float]]] = {}
+    
     for content in scraping_results.get('scraped_content', []):
         platform = content.get('platform', 'unknown')
         
@@ -914,14 +1489,14 @@ def analyze_social_media_content(scraping_results: Dict[str, Any]) -> Dict[str,
         language = content.get('detected_language', 'en')
         analysis['language_distribution'][language] = analysis['language_distribution'].get(language, 0) + 1
         
-        # Complaint analysis
+        # Complaint analysis, reading each item's score once
         all_content = posts + comments + reviews
-        high_complaints = []
-        medium_complaints = []
-        low_complaints = []
+        scores = [item.get('complaint_score', 0) for item in all_content]
+        high_complaints = analysis['complaint_analysis']['high_complaint_content']
+        medium_complaints = analysis['complaint_analysis']['medium_complaint_content']
+        low_complaints = analysis['complaint_analysis']['low_complaint_content']
         
-        for item in all_content:
-            score = item.get('complaint_score', 0)
+        for item, score in zip(all_content, scores):
             if score >= 0.7:
                 high_complaints.append(item)
             elif score >= 0.4:
@@ -929,17 +1504,17 @@ def analyze_social_media_content(scraping_results: Dict[str, Any]) -> Dict[str,
             else:
                 low_complaints.append(item)
         
-        analysis['complaint_analysis']['high_complaint_content'].extend(high_complaints)
-        analysis['complaint_analysis']['medium_complaint_content'].extend(medium_complaints)
-        analysis['complaint_analysis']['low_complaint_content'].extend(low_complaints)
-        
-        # Platform-specific metrics
+        platform_items = items_by_platform.setdefault(platform, ([], []))
+        platform_items[0].extend(all_content)
+        platform_items[1].extend(scores)
+    
+    # Platform-specific metrics over every item scraped for the platform
+    for platform, (all_content, scores) in items_by_platform.items():
         if all_content:
-            avg_score = sum(item.get('complaint_score', 0) for item in all_content) / len(all_content)
-            analysis['platforms'][platform]['avg_complaint_score'] = avg_score
+            analysis['platforms'][platform]['avg_complaint_score'] = sum(scores) / len(scores)
             
-            # Top complaints for this platform
-            top_complaints = sorted(all_content, key=lambda x: x.get('complaint_score', 0), reverse=True)[:5]
-            analysis['platforms'][platform]['top_complaints'] = top_complaints
+            # Top complaints for this platform (same order as a full stable sort)
+            top = heapq.nlargest(5, range(len(scores)), key=scores.__getitem__)
+            analysis['platforms'][platform]['top_complaints'] = [all_content[i] for i in top]
     
     return analysis 
\ No newline at end of file
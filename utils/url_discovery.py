@@ -1,12 +1,33 @@
 import requests
+from requests.adapters import HTTPAdapter
+import json
+import os
 import re
+import sqlite3
 import time
+from io import BytesIO
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Set, Tuple
+from bs4 import BeautifulSoup, NavigableString
+from lxml import etree
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import logging
 from utils.logger import log_execution_time, log_function_call
 
+# Sitemaps are streamed through iterparse leniently, since many sites serve slightly malformed XML
+_SITEMAP_PARSE_OPTIONS = {'recover': True, 'huge_tree': True, 'resolve_entities': False}
+_SITEMAP_ENTRY_TAGS = ('{*}sitemap', '{*}url')
+# Sitemap page URLs are categorized in batches of this many
+_SITEMAP_BATCH_SIZE = 1000
+
+# Results of URL existence probes shared by every URLDiscovery, so re-running discovery
+# for a competitor skips the HEAD requests: normalized URL -> (exists, checked at)
+_URL_EXISTS_CACHE: 'OrderedDict[str, Tuple[bool, float]]' = OrderedDict()
+_URL_EXISTS_CACHE_SIZE = 4096
+_URL_EXISTS_LOCK = threading.Lock()
+
 class URLDiscovery:
     """
     Automated URL discovery system for competitor analysis
@@ -29,6 +50,12 @@ class URLDiscovery:
         """
         self.base_url = base_url.rstrip('/')
         self.domain = urlparse(base_url).netloc
+        # Absolute URL prefixes that are always internal when followed by a path boundary
+        self._internal_prefixes = tuple(
+            f'{scheme}://{host}'
+            for scheme in ('http', 'https')
+            for host in (self.domain, f'www.{self.domain}')
+        )
         self.config = config
         self.logger = logging.getLogger("competitive_analysis")
         
@@ -43,6 +70,12 @@ class URLDiscovery:
             'Upgrade-Insecure-Requests': '1'
         })
         
+        # Probes and sitemap fetches run in parallel over pooled keep-alive connections
+        self.max_workers = getattr(config, 'max_concurrent_requests', 10)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(16, self.max_workers))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         # Page type patterns for URL matching
         self.page_patterns = {
             'pricing': [
@@ -71,26 +104,62 @@ class URLDiscovery:
             ]
         }
         
+        # One case-insensitive alternation per page type, tried in page_patterns order
+        self._compiled_patterns = {
+            page_type: re.compile('(?:' + '|'.join(patterns) + ')', re.IGNORECASE)
+            for page_type, patterns in self.page_patterns.items()
+        }
+        
+        # Plain-word patterns are matched as lowercase substrings of ASCII URLs and link
+        # texts; only patterns using regex syntax still need a regex search there
+        self._page_keywords = {
+            page_type: tuple(p.lower() for p in patterns if re.fullmatch(r'[\w-]+', p))
+            for page_type, patterns in self.page_patterns.items()
+        }
+        self._regex_only_patterns = {
+            page_type: re.compile('(?:' + '|'.join(regexes) + ')', re.IGNORECASE)
+            for page_type, regexes in (
+                (page_type, [p for p in patterns if not re.fullmatch(r'[\w-]+', p)])
+                for page_type, patterns in self.page_patterns.items()
+            )
+            if regexes
+        }
+        
         # Common navigation selectors
         self.nav_selectors = [
             'nav', 'navigation', '.nav', '.navigation', '.menu', '.main-menu',
             'header nav', 'header ul', '.header-nav', '.top-nav', '.primary-nav',
             'footer nav', 'footer ul', '.footer-nav', '.footer-menu'
         ]
+        self.footer_selectors = ['footer', '.footer', '#footer', '.site-footer']
+        
+        # Selector lists joined into one selector each, so the homepage is walked once per strategy
+        self._nav_selector_joined = ', '.join(self.nav_selectors)
+        self._footer_selector_joined = ', '.join(self.footer_selectors)
         
         # Discovered URLs storage
         self.discovered_urls = {
-            'pricing': [],
-            'features': [],
-            'blog': [],
-            'careers': [],
-            'contact': [],
-            'about': [],
-            'other': []
+            'pricing': set(),
+            'features': set(),
+            'blog': set(),
+            'careers': set(),
+            'contact': set(),
+            'about': set(),
+            'other': set()
         }
         
         # Set to track processed URLs to avoid duplicates
         self.processed_urls = set()
+        
+        # Parsed homepage shared by the navigation and footer analyses (fetched once)
+        self._homepage_soup: Optional[BeautifulSoup] = None
+        self._homepage_fetched = False
+        
+        # Persistent cache (sqlite, shared with the scraper) of sitemap and homepage
+        # results with their validators, so repeat runs can use conditional GETs
+        self.cache_db_path = getattr(config, 'scraper_cache_path', None)
+        self._cache_db = None
+        self._cache_db_lock = threading.Lock()
     
     @log_execution_time
     def discover_all_pages(self) -> Dict[str, List[str]]:
@@ -103,17 +172,26 @@ class URLDiscovery:
         self.logger.info(f"Starting URL discovery for {self.base_url}")
         
         try:
-            # Strategy 1: Sitemap parsing
-            self.logger.info("Strategy 1: Parsing sitemaps")
-            self._parse_sitemaps()
-            
-            # Strategy 2: Navigation analysis
-            self.logger.info("Strategy 2: Analyzing navigation")
-            self._analyze_navigation()
-            
-            # Strategy 3: Common URL patterns
-            self.logger.info("Strategy 3: Checking common URL patterns")
-            self._check_common_patterns()
+            # The strategies' network work is independent, so fetch the sitemaps, the
+            # homepage and the common-path probes at once; categorizing then runs in
+            # strategy order, since the first strategy to see a URL decides its type
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                sitemap_future = executor.submit(self._find_sitemap_urls)
+                homepage_future = executor.submit(self._prefetch_homepage)
+                probes_future = executor.submit(self._probe_common_patterns)
+                
+                # Strategy 1: Sitemap parsing
+                self.logger.info("Strategy 1: Parsing sitemaps")
+                self._categorize_sitemap_urls(sitemap_future.result())
+                
+                # Strategy 2: Navigation analysis
+                self.logger.info("Strategy 2: Analyzing navigation")
+                homepage_future.result()
+                self._analyze_navigation()
+                
+                # Strategy 3: Common URL patterns
+                self.logger.info("Strategy 3: Checking common URL patterns")
+                self._record_common_patterns(probes_future.result())
             
             # Strategy 4: Footer analysis
             self.logger.info("Strategy 4: Analyzing footer links")
@@ -123,14 +201,18 @@ class URLDiscovery:
             self._clean_and_validate_urls()
             
             self.logger.info(f"URL discovery completed. Found {sum(len(urls) for urls in self.discovered_urls.values())} URLs")
-            return self.discovered_urls
+            return self._discovered_url_lists()
             
         except Exception as e:
             self.logger.error(f"Error in URL discovery: {str(e)}")
-            return self.discovered_urls
+            return self._discovered_url_lists()
     
     def _parse_sitemaps(self) -> None:
         """Parse XML sitemaps to discover URLs"""
+        self._categorize_sitemap_urls(self._find_sitemap_urls())
+    
+    def _find_sitemap_urls(self) -> List[str]:
+        """Fetch the site's sitemap, following sitemap indexes, and return its page URLs"""
         sitemap_urls = [
             f"{self.base_url}/sitemap.xml",
             f"{self.base_url}/sitemaps.xml",
@@ -138,81 +220,229 @@ class URLDiscovery:
             f"{self.base_url}/sitemap/sitemap.xml"
         ]
         
-        for sitemap_url in sitemap_urls:
-            try:
-                self.logger.debug(f"Checking sitemap: {sitemap_url}")
-                response = self.session.get(sitemap_url, timeout=10)
-                
-                if response.status_code == 200:
-                    self.logger.info(f"Found sitemap: {sitemap_url}")
-                    self._parse_sitemap_content(response.text)
-                    break
-                    
-            except Exception as e:
-                self.logger.debug(f"Sitemap not found or error: {sitemap_url} - {str(e)}")
-                continue
+        # Request every candidate at once, then use the first one found in this order
+        for sitemap_url, locs in zip(sitemap_urls, self._fetch_sitemaps(sitemap_urls)):
+            if locs is not None:
+                self.logger.info(f"Found sitemap: {sitemap_url}")
+                return self._collect_sitemap_urls(locs)
+        return []
     
-    def _parse_sitemap_content(self, content: str) -> None:
-        """Parse sitemap XML content and extract URLs"""
+    def _fetch_sitemap(self, sitemap_url: str) -> Optional[Tuple[List[str], List[str]]]:
+        """Stream and parse a sitemap, returning its (child sitemap URLs, page URLs) or None if it is missing"""
         try:
-            soup = BeautifulSoup(content, 'xml')
-            
-            # Handle sitemap index files
-            sitemaps = soup.find_all('sitemap')
-            if sitemaps:
-                for sitemap in sitemaps:
-                    loc = sitemap.find('loc')
-                    if loc and hasattr(loc, 'text'):
-                        self._parse_individual_sitemap(loc.text)
+            self.logger.debug(f"Checking sitemap: {sitemap_url}")
+            entry = self._lookup_validated(sitemap_url)
+            with self.session.get(sitemap_url, timeout=10, stream=True,
+                                  headers=self._conditional_headers(entry)) as response:
+                if response.status_code == 304 and entry is not None:
+                    self.logger.debug(f"Sitemap not modified: {sitemap_url}")
+                    child_urls, page_urls = entry['data']
+                    return child_urls, page_urls
+                if response.status_code == 200:
+                    # Let urllib3 undo gzip/deflate transfer encoding while streaming
+                    response.raw.decode_content = True
+                    locs = self._read_sitemap(response.raw)
+                    self._store_validated(sitemap_url, locs, response.headers)
+                    return locs
+        except Exception as e:
+            self.logger.debug(f"Sitemap not found or error: {sitemap_url} - {str(e)}")
+        return None
+    
+    def _fetch_sitemaps(self, sitemap_urls: List[str]) -> List[Optional[Tuple[List[str], List[str]]]]:
+        """Fetch sitemaps concurrently, in input order"""
+        if len(sitemap_urls) <= 1:
+            return [self._fetch_sitemap(url) for url in sitemap_urls]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(sitemap_urls))) as executor:
+            return list(executor.map(self._fetch_sitemap, sitemap_urls))
+    
+    def _read_sitemap(self, source) -> Tuple[List[str], List[str]]:
+        """
+        Stream <loc> URLs out of a sitemap without building its whole tree
+        
+        Args:
+            source: File-like object with the sitemap XML
             
-            # Handle individual sitemap files
-            urls = soup.find_all('url')
-            for url in urls:
-                loc = url.find('loc')
-                if loc and hasattr(loc, 'text'):
-                    self._categorize_url(loc.text)
-                    
+        Returns:
+            Tuple of (child sitemap URLs, page URLs); whatever was read before a parse error
+        """
+        child_urls = []
+        page_urls = []
+        try:
+            for _, entry in etree.iterparse(source, events=('end',), tag=_SITEMAP_ENTRY_TAGS,
+                                            **_SITEMAP_PARSE_OPTIONS):
+                # Text of the first <loc> in the entry, in any namespace
+                loc = next(entry.iter('{*}loc'), None)
+                if loc is not None:
+                    target = child_urls if etree.QName(entry).localname == 'sitemap' else page_urls
+                    target.append(''.join(loc.itertext()))
+                
+                # Drop finished entries so memory stays flat on large sitemaps
+                entry.clear()
+                parent = entry.getparent()
+                if parent is not None:
+                    while entry.getprevious() is not None:
+                        del parent[0]
         except Exception as e:
             self.logger.error(f"Error parsing sitemap content: {str(e)}")
+        return child_urls, page_urls
+    
+    def _parse_sitemap_content(self, content: Union[str, bytes]) -> None:
+        """Parse sitemap XML content and extract URLs"""
+        # Raw bytes let the parser honour the sitemap's declared encoding
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        self._process_sitemap_locs(self._read_sitemap(BytesIO(content)))
+    
+    def _process_sitemap_locs(self, locs: Tuple[List[str], List[str]]) -> None:
+        """Follow a sitemap's child sitemaps and categorize its page URLs"""
+        self._categorize_sitemap_urls(self._collect_sitemap_urls(locs))
+    
+    def _collect_sitemap_urls(self, locs: Tuple[List[str], List[str]]) -> List[str]:
+        """Page URLs of a sitemap and, first, of its child sitemaps"""
+        child_urls, page_urls = locs
+        urls = []
+        
+        # Handle sitemap index files, fetching the listed sitemaps concurrently
+        if child_urls:
+            for child_locs in self._fetch_sitemaps(child_urls):
+                if child_locs is not None:
+                    urls.extend(self._collect_sitemap_urls(child_locs))
+        
+        # Handle individual sitemap files
+        urls.extend(page_urls)
+        return urls
+    
+    def _categorize_sitemap_urls(self, urls: List[str]) -> None:
+        """Categorize sitemap page URLs in batches"""
+        for i in range(0, len(urls), _SITEMAP_BATCH_SIZE):
+            self._categorize_urls_bulk(urls[i:i + _SITEMAP_BATCH_SIZE])
     
     def _parse_individual_sitemap(self, sitemap_url: str) -> None:
         """Parse individual sitemap from sitemap index"""
-        try:
-            response = self.session.get(sitemap_url, timeout=10)
-            if response.status_code == 200:
-                self._parse_sitemap_content(response.text)
-        except Exception as e:
-            self.logger.debug(f"Error parsing individual sitemap {sitemap_url}: {str(e)}")
+        locs = self._fetch_sitemap(sitemap_url)
+        if locs is not None:
+            self._process_sitemap_locs(locs)
     
     def _analyze_navigation(self) -> None:
         """Analyze website navigation to find important pages"""
         try:
-            response = self.session.get(self.base_url, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract navigation links
-                nav_links = set()
-                for selector in self.nav_selectors:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        links = element.find_all('a', href=True)
-                        for link in links:
-                            href = link.get('href')
-                            if href and isinstance(href, str):
-                                full_url = urljoin(self.base_url, href)
-                                if self._is_internal_url(full_url):
-                                    nav_links.add(full_url)
-                                    link_text = link.get_text(strip=True) if hasattr(link, 'get_text') else ""
-                                    self._categorize_url(full_url, link_text)
+            soup = self._get_homepage_soup()
+            if soup is not None:
+                # Extract navigation links, selecting every navigation element in one pass
+                nav_links = self._categorize_links(soup.select(self._nav_selector_joined))
                 
                 self.logger.info(f"Found {len(nav_links)} navigation links")
                 
         except Exception as e:
             self.logger.error(f"Error analyzing navigation: {str(e)}")
     
+    def _get_homepage_soup(self) -> Optional[BeautifulSoup]:
+        """Fetch and parse the homepage on first use (None if it could not be fetched)"""
+        if not self._homepage_fetched:
+            self._homepage_fetched = True
+            entry = self._lookup_validated(self.base_url)
+            response = self.session.get(self.base_url, timeout=15, headers=self._conditional_headers(entry))
+            if response.status_code == 304 and entry is not None:
+                self.logger.debug(f"Homepage not modified: {self.base_url}")
+                self._homepage_soup = BeautifulSoup(entry['data'], 'lxml')
+            elif response.status_code == 200:
+                self._store_validated(self.base_url, response.text, response.headers)
+                self._homepage_soup = BeautifulSoup(response.text, 'lxml')
+        return self._homepage_soup
+    
+    def _get_disk_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent cache database on first use"""
+        if not self.cache_db_path:
+            return None
+        
+        if self._cache_db is None:
+            try:
+                directory = os.path.dirname(self.cache_db_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                
+                db = sqlite3.connect(self.cache_db_path, check_same_thread=False)
+                db.execute(
+                    'CREATE TABLE IF NOT EXISTS discovery ('
+                    'url TEXT PRIMARY KEY, data TEXT NOT NULL, etag TEXT, '
+                    'last_modified TEXT, timestamp REAL NOT NULL)'
+                )
+                db.commit()
+                self._cache_db = db
+            except (sqlite3.Error, OSError) as e:
+                self.logger.warning(f"Disabling persistent discovery cache: {str(e)}")
+                self.cache_db_path = None
+                return None
+        
+        return self._cache_db
+    
+    def _lookup_validated(self, url: str) -> Optional[Dict[str, Any]]:
+        """Find a previously fetched result for url with its ETag / Last-Modified validators"""
+        db = self._get_disk_cache()
+        if db is None:
+            return None
+        
+        try:
+            with self._cache_db_lock:
+                row = db.execute(
+                    'SELECT data, etag, last_modified FROM discovery WHERE url = ?', (url,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to read discovery cache entry: {str(e)}")
+            return None
+        
+        if row is None:
+            return None
+        
+        return {'data': json.loads(row[0]), 'etag': row[1], 'last_modified': row[2]}
+    
+    def _store_validated(self, url: str, data: Any, headers: Any) -> None:
+        """Persist a fetched result when the response carries ETag / Last-Modified validators"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        db = self._get_disk_cache()
+        if db is None:
+            return
+        
+        try:
+            with self._cache_db_lock:
+                db.execute(
+                    'INSERT OR REPLACE INTO discovery (url, data, etag, last_modified, timestamp) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (url, json.dumps(data), etag, last_modified, time.time())
+                )
+                db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to persist discovery cache entry: {str(e)}")
+    
+    @staticmethod
+    def _conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cached entry's validators"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _prefetch_homepage(self) -> None:
+        """Fetch the homepage ahead of the navigation and footer analyses"""
+        try:
+            self._get_homepage_soup()
+        except Exception as e:
+            self.logger.error(f"Error fetching homepage: {str(e)}")
+    
     def _check_common_patterns(self) -> None:
         """Check common URL patterns for different page types"""
+        self._record_common_patterns(self._probe_common_patterns())
+    
+    def _probe_common_patterns(self) -> List[Tuple[str, str]]:
+        """Probe common paths for each page type, returning the (page type, URL) pairs that exist"""
         common_paths = {
             'pricing': ['/pricing', '/price', '/plans', '/packages', '/subscription', '/buy'],
             'features': ['/features', '/capabilities', '/product', '/solutions', '/services'],
@@ -222,42 +452,66 @@ class URLDiscovery:
             'about': ['/about', '/company', '/who-we-are', '/our-story']
         }
         
-        for page_type, paths in common_paths.items():
-            for path in paths:
-                url = f"{self.base_url}{path}"
-                if self._check_url_exists(url):
-                    self.discovered_urls[page_type].append(url)
-                    self.logger.debug(f"Found {page_type} page: {url}")
+        candidates = [
+            (page_type, f"{self.base_url}{path}")
+            for page_type, paths in common_paths.items()
+            for path in paths
+        ]
+        
+        # Probe every candidate concurrently, keeping the original order
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(candidates))) as executor:
+            exists = list(executor.map(self._check_url_exists, [url for _, url in candidates]))
+        
+        return [candidate for candidate, found in zip(candidates, exists) if found]
+    
+    def _record_common_patterns(self, found: List[Tuple[str, str]]) -> None:
+        """Record common-path pages found by _probe_common_patterns"""
+        for page_type, url in found:
+            self.discovered_urls[page_type].add(url)
+            self.logger.debug(f"Found {page_type} page: {url}")
     
     def _analyze_footer(self) -> None:
         """Analyze footer links for additional pages"""
         try:
-            response = self.session.get(self.base_url, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Find footer elements
-                footer_selectors = ['footer', '.footer', '#footer', '.site-footer']
-                footer_links = set()
-                
-                for selector in footer_selectors:
-                    footer = soup.select_one(selector)
-                    if footer:
-                        links = footer.find_all('a', href=True)
-                        for link in links:
-                            href = link.get('href')
-                            if href and isinstance(href, str):
-                                full_url = urljoin(self.base_url, href)
-                                if self._is_internal_url(full_url):
-                                    footer_links.add(full_url)
-                                    link_text = link.get_text(strip=True) if hasattr(link, 'get_text') else ""
-                                    self._categorize_url(full_url, link_text)
+            soup = self._get_homepage_soup()
+            if soup is not None:
+                # Find footer elements, selecting every footer selector in one pass
+                footer_links = self._categorize_links(soup.select(self._footer_selector_joined))
                 
                 self.logger.info(f"Found {len(footer_links)} footer links")
                 
         except Exception as e:
             self.logger.error(f"Error analyzing footer: {str(e)}")
     
+    def _categorize_links(self, elements: List) -> Set[str]:
+        """Categorize the internal links inside elements, returning their absolute URLs
+        
+        Anchors inside nested matches (e.g. a .menu within a nav) are only handled once.
+        """
+        internal_links = set()
+        seen_anchors = set()
+        for element in elements:
+            for link in element.find_all('a', href=True):
+                if id(link) in seen_anchors:
+                    continue
+                seen_anchors.add(id(link))
+                
+                href = link.get('href')
+                if href and isinstance(href, str):
+                    full_url = urljoin(self.base_url, href)
+                    if self._is_internal_url(full_url):
+                        internal_links.add(full_url)
+                        self._categorize_url(full_url, self._link_text(link))
+        return internal_links
+    
+    @staticmethod
+    def _link_text(link) -> str:
+        """Stripped text of an anchor, read directly when it holds a single text node"""
+        string = link.string
+        if type(string) is NavigableString:
+            return string.strip()
+        return link.get_text(strip=True) if hasattr(link, 'get_text') else ""
+    
     def _categorize_url(self, url: str, link_text: str = "") -> None:
         """Categorize URL based on patterns and link text"""
         if url in self.processed_urls:
@@ -265,56 +519,109 @@ class URLDiscovery:
         
         self.processed_urls.add(url)
         
-        # Clean URL for pattern matching
-        clean_url = url.lower()
-        clean_text = link_text.lower() if link_text else ""
-        
         # Check against patterns
-        for page_type, patterns in self.page_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, clean_url) or re.search(pattern, clean_text):
-                    self.discovered_urls[page_type].append(url)
-                    self.logger.debug(f"Categorized {url} as {page_type}")
-                    return
+        page_type = self._match_page_type(url, link_text)
+        if page_type:
+            self.discovered_urls[page_type].add(url)
+            self.logger.debug(f"Categorized {url} as {page_type}")
+            return
         
         # If no category found, add to 'other'
-        self.discovered_urls['other'].append(url)
+        self.discovered_urls['other'].add(url)
+    
+    def _categorize_urls_bulk(self, urls: List[str]) -> None:
+        """Categorize many URLs at once, e.g. every <loc> of a sitemap
+        
+        Equivalent to calling _categorize_url on each URL in turn, without the
+        per-URL debug logging.
+        """
+        categorized = 0
+        for url in urls:
+            if url in self.processed_urls:
+                continue
+            self.processed_urls.add(url)
+            self.discovered_urls[self._match_page_type(url) or 'other'].add(url)
+            categorized += 1
+        self.logger.debug(f"Categorized {categorized} sitemap URLs")
+    
+    def _match_page_type(self, url: str, link_text: str = "") -> Optional[str]:
+        """First page type, in page_patterns order, whose patterns match the URL or link text"""
+        # ASCII text can only match case-insensitively through ASCII case pairs,
+        # so lowercase substring tests give the same answer as the regexes
+        if url.isascii() and link_text.isascii():
+            url_lower = url.lower()
+            text_lower = link_text.lower()
+            for page_type, keywords in self._page_keywords.items():
+                for keyword in keywords:
+                    if keyword in url_lower or keyword in text_lower:
+                        return page_type
+                pattern = self._regex_only_patterns.get(page_type)
+                if pattern and (pattern.search(url) or (link_text and pattern.search(link_text))):
+                    return page_type
+            return None
+        
+        for page_type, pattern in self._compiled_patterns.items():
+            if pattern.search(url) or (link_text and pattern.search(link_text)):
+                return page_type
+        return None
     
     def _is_internal_url(self, url: str) -> bool:
         """Check if URL is internal to the domain"""
+        # Fast paths for root-relative links and the site's own host
+        if url.startswith('/') and not url.startswith('//'):
+            return True
+        for prefix in self._internal_prefixes:
+            if url.startswith(prefix) and url[len(prefix):len(prefix) + 1] in ('', '/', '?', '#'):
+                return True
+        
         parsed = urlparse(url)
         return (parsed.netloc == self.domain or 
                 parsed.netloc == '' or 
                 parsed.netloc.endswith(f'.{self.domain}'))
     
     def _check_url_exists(self, url: str) -> bool:
-        """Check if URL exists and is accessible"""
+        """Check if URL exists and is accessible, reusing probes made within cache_duration"""
+        cache_key = normalize_url(url)
+        cache_duration = getattr(self.config, 'cache_duration', 3600)
+        with _URL_EXISTS_LOCK:
+            cached = _URL_EXISTS_CACHE.get(cache_key)
+            if cached is not None and time.time() - cached[1] < cache_duration:
+                _URL_EXISTS_CACHE.move_to_end(cache_key)
+                return cached[0]
+        
         try:
             response = self.session.head(url, timeout=10, allow_redirects=True)
-            return response.status_code == 200
+            exists = response.status_code == 200
         except:
             return False
+        
+        with _URL_EXISTS_LOCK:
+            _URL_EXISTS_CACHE[cache_key] = (exists, time.time())
+            _URL_EXISTS_CACHE.move_to_end(cache_key)
+            while len(_URL_EXISTS_CACHE) > _URL_EXISTS_CACHE_SIZE:
+                _URL_EXISTS_CACHE.popitem(last=False)
+        
+        return exists
     
     def _clean_and_validate_urls(self) -> None:
-        """Remove duplicates and validate URLs"""
-        for page_type in self.discovered_urls:
-            # Remove duplicates
-            unique_urls = list(set(self.discovered_urls[page_type]))
-            
-            # Validate URLs
-            validated_urls = []
-            for url in unique_urls:
-                if self._is_internal_url(url) and url.startswith(('http://', 'https://')):
-                    validated_urls.append(url)
-            
+        """Drop invalid URLs; duplicates are already collapsed by the per-type sets"""
+        for page_type, urls in self.discovered_urls.items():
+            validated_urls = {
+                url for url in urls
+                if url.startswith(('http://', 'https://')) and self._is_internal_url(url)
+            }
             self.discovered_urls[page_type] = validated_urls
             
             # Log results
             if validated_urls:
                 self.logger.info(f"Found {len(validated_urls)} {page_type} URLs")
-                for url in validated_urls:
+                for url in sorted(validated_urls):
                     self.logger.debug(f"  - {url}")
     
+    def _discovered_url_lists(self) -> Dict[str, List[str]]:
+        """Return the discovered URLs as sorted lists per page type"""
+        return {page_type: sorted(urls) for page_type, urls in self.discovered_urls.items()}
+    
     def get_page_content(self, url: str) -> Optional[str]:
         """
         Fetch content from a specific URL
@@ -390,7 +697,7 @@ class URLDiscovery:
             'domain': self.domain,
             'total_urls_found': sum(len(urls) for urls in self.discovered_urls.values()),
             'pages_by_type': {k: len(v) for k, v in self.discovered_urls.items()},
-            'discovered_urls': self.discovered_urls,
+            'discovered_urls': self._discovered_url_lists(),
             'processed_urls_count': len(self.processed_urls)
         }
         
@@ -9,22 +9,211 @@ This module provides comprehensive competitor vision and roadmap analysis includ
 - AI-powered vision insights and strategic predictions
 """
 
+import hashlib
 import json
+import os
 import re
+import sqlite3
+import sys
+import time
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, FrozenSet, List, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from functools import lru_cache
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from utils.ai_analysis_engine import AIAnalysisEngine
 from utils.master_prompt_designer import MasterPromptDesigner
 
+# Optional Aho-Corasick automaton for finding every signal pattern in one pass over a page
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional fast non-cryptographic hash for page cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional linear-time regex engine for the timeline patterns scanned over whole pages
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def _compile_linear(pattern: str) -> Any:
+    """Compile a pattern with RE2 when installed (no pathological backtracking), else with re"""
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Timeline mentions, scanned in this order; all but three need a year (20xx) in the page
+_TIMELINE_PATTERNS = [
+    r'(q[1-4]\s+20\d{2})', r'(quarter\s+[1-4]\s+20\d{2})', r'(20\d{2})',
+    r'(next\s+year)', r'(coming\s+months)', r'(this\s+year)',
+    r'(by\s+20\d{2})', r'(in\s+20\d{2})', r'(launch\s+in\s+20\d{2})',
+    r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+20\d{2}',
+    r'(early\s+20\d{2})', r'(mid\s+20\d{2})', r'(late\s+20\d{2})',
+    r'(h[1-2]\s+20\d{2})', r'(first\s+half\s+20\d{2})', r'(second\s+half\s+20\d{2})'
+]
+_TIMELINE_RES = tuple(
+    (_compile_linear('(?i)' + pattern), '20\\d{2}' in pattern) for pattern in _TIMELINE_PATTERNS
+)
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# Pages whose signal scans are kept, so repeated pages (shared boilerplate, re-runs) are scanned once
+_PAGE_SCAN_CACHE_SIZE = 1024
+
+# Shape of the cached AI vision insights; bump it when that shape changes so older entries are not reused
+_INSIGHTS_CACHE_VERSION = 2
+
+# Batches of at least this many unscanned pages are scanned in a process pool
+PARALLEL_SCAN_THRESHOLD = 8
+
+# Market expansion targets recognized in signal contexts, reported in this order
+_GEOGRAPHIC_KEYWORDS = (
+    'europe', 'asia', 'north america', 'south america', 'africa', 'oceania',
+    'uk', 'germany', 'france', 'japan', 'china', 'india', 'australia',
+    'canada', 'mexico', 'brazil', 'singapore', 'malaysia', 'thailand'
+)
+_INDUSTRY_KEYWORDS = (
+    'retail', 'restaurant', 'hospitality', 'healthcare', 'education',
+    'manufacturing', 'e-commerce', 'professional services', 'franchise',
+    'enterprise', 'small business', 'startup'
+)
+_SEGMENT_KEYWORDS = (
+    'small business', 'enterprise', 'startup', 'franchise', 'chain',
+    'independent', 'multi-location', 'single location', 'growing business',
+    'established business', 'high volume', 'boutique', 'specialty'
+)
+
+
+# Technology maturity and implementation stage by context keywords, checked in order
+# (single words, so scanning contexts one by one finds the same keywords as scanning them joined)
+_MATURITY_LEVELS = (
+    ('early_stage', ('beta', 'testing', 'preview', 'development')),
+    ('market_ready', ('launch', 'release', 'available', 'introducing')),
+    ('mature', ('established', 'proven', 'mature', 'stable'))
+)
+_IMPLEMENTATION_STAGES = (
+    ('planning', ('planning', 'roadmap', 'future')),
+    ('development', ('development', 'building', 'creating')),
+    ('production', ('deployed', 'live', 'production'))
+)
+
+# Timeline prediction types by context keywords, checked in order
+_PREDICTION_TYPES = (
+    ('product_launch', ('launch', 'release', 'introduce')),
+    ('market_expansion', ('expansion', 'market', 'enter')),
+    ('strategic_partnership', ('partnership', 'alliance', 'collaboration'))
+)
+
+# Hiring growth indicator by number of hiring signals (five or more is high growth)
+_GROWTH_INDICATORS = (
+    'no_growth', 'low_growth', 'low_growth', 'moderate_growth', 'moderate_growth', 'high_growth'
+)
+
+# Every keyword looked for in signal contexts, found together in one pass
+_CONTEXT_KEYWORDS = tuple(dict.fromkeys(
+    _GEOGRAPHIC_KEYWORDS + _INDUSTRY_KEYWORDS + _SEGMENT_KEYWORDS +
+    tuple(keyword for _, keywords in _MATURITY_LEVELS + _IMPLEMENTATION_STAGES + _PREDICTION_TYPES
+          for keyword in keywords)
+))
+
+
+def _build_keyword_automaton(keywords: Tuple[str, ...]) -> Optional['ahocorasick.Automaton']:
+    """Build an automaton over keywords (None without pyahocorasick)"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_CONTEXT_AUTOMATON = _build_keyword_automaton(_CONTEXT_KEYWORDS)
+
+
+def _context_keywords(context: str) -> Set[str]:
+    """Context keywords occurring in context, scanning it once when possible"""
+    if _CONTEXT_AUTOMATON is None:
+        return {keyword for keyword in _CONTEXT_KEYWORDS if keyword in context}
+    return {keyword for _, keyword in _CONTEXT_AUTOMATON.iter(context)}
+
+
+@lru_cache(maxsize=4096)
+def _scan_context(context: str) -> Tuple[str, FrozenSet[str]]:
+    """Lowercased signal context with its context keywords, scanned once per distinct context"""
+    lowered = context.lower()
+    return lowered, frozenset(_context_keywords(lowered))
+
+
+@lru_cache(maxsize=4096)
+def _context_confidence(context: str) -> float:
+    """Confidence score of a signal context, computed once per distinct context"""
+    # Base confidence based on pattern specificity
+    base_confidence = 0.5
+    
+    # Adjust based on context richness
+    if len(context) > 100:
+        base_confidence += 0.2
+    
+    # Adjust based on specific keywords
+    if any(keyword in context for keyword in ('announced', 'confirmed', 'official')):
+        base_confidence += 0.2
+    
+    # Adjust based on timeline specificity
+    if any(timeline in context for timeline in ('2024', '2025', 'q1', 'q2', 'q3', 'q4')):
+        base_confidence += 0.1
+    
+    return min(1.0, base_confidence)
+
+
+@lru_cache(maxsize=256)
+def _field_label(key: str) -> str:
+    """Report label for an insight or prediction field name"""
+    return key.replace('_', ' ').title()
+
+
+# Analyzer used by scan pool workers, set once per worker by the initializer
+_worker_analyzer: Optional['VisionAnalyzer'] = None
+
+
+def _init_scan_worker(pattern_tables: Tuple[Dict[str, List[str]], ...]) -> None:
+    """Process pool initializer: build one analyzer per worker with the parent's signal patterns."""
+    global _worker_analyzer
+    _worker_analyzer = VisionAnalyzer(api_key='')
+    (_worker_analyzer.strategic_signals, _worker_analyzer.technology_trends,
+     _worker_analyzer.market_signals, _worker_analyzer.job_patterns) = pattern_tables
+    _worker_analyzer._index_signal_patterns()
+
+
+def _scan_page(content: str) -> Dict[str, Any]:
+    """Process pool task: find the pattern and timeline hits of one page."""
+    return _worker_analyzer._scan_page(content)
+
+
 class VisionAnalyzer:
     """
     Advanced vision analysis engine that extracts strategic signals and predicts
     competitor future moves using AI-powered analysis of various content sources.
     """
     
-    def __init__(self, api_key: str, model_name: str = "gpt-4", logger: Optional[logging.Logger] = None):
+    def __init__(self, api_key: str, model_name: str = "gpt-4", logger: Optional[logging.Logger] = None,
+                 cache_path: Optional[str] = None, cache_duration: float = 3600):
         """
         Initialize the vision analyzer with AI capabilities.
         
@@ -32,11 +221,18 @@ class VisionAnalyzer:
             api_key: OpenAI API key
             model_name: AI model to use for analysis
             logger: Logger instance for tracking operations
+            cache_path: SQLite database for reusing AI vision insights across runs (None disables it)
+            cache_duration: Seconds a cached AI vision insight stays valid
         """
         self.api_key = api_key
         self.model_name = model_name
         self.logger = logger or logging.getLogger(__name__)
         
+        # Persistent cache of AI vision insights by analysis digest, opened on first use
+        self.cache_path = cache_path
+        self.cache_duration = cache_duration
+        self._cache_db: Optional[sqlite3.Connection] = None
+        
         # Initialize AI components
         self.ai_engine = AIAnalysisEngine(api_key, model_name, logger)
         self.prompt_designer = MasterPromptDesigner()
@@ -171,6 +367,89 @@ class VisionAnalyzer:
                 'regional manager', 'senior director', 'executive'
             ]
         }
+        
+        # Content source bucket by page category
+        self._category_to_source = {
+            'blog': 'blog_posts',
+            'news': 'blog_posts',
+            'careers': 'career_pages',
+            'about': 'about_pages'
+        }
+        
+        # Roadmap and partnership patterns that mark upcoming features, launches and alliances
+        self._upcoming_feature_indicators = frozenset({'upcoming features', 'coming soon', 'next release'})
+        self._launch_indicators = frozenset({'launching', 'product launch', 'introducing'})
+        self._strategic_alliance_indicators = frozenset({'strategic alliance', 'joint venture', 'collaboration'})
+        
+        # Roadmap feature categories by context keywords, checked in order
+        self._feature_category_keywords = (
+            ('ai_features', ('ai', 'machine learning', 'intelligent', 'smart')),
+            ('mobile_features', ('mobile', 'app', 'ios', 'android')),
+            ('integration_features', ('api', 'integration', 'connect')),
+            ('analytics_features', ('analytics', 'reporting', 'dashboard'))
+        )
+        
+        # Strategic importance of each role type before adjusting for hiring volume (anything else is low)
+        self._role_importance = {
+            'leadership_roles': 'high',
+            'product_roles': 'high',
+            'data_roles': 'high',
+            'engineering_roles': 'medium',
+            'sales_marketing': 'medium'
+        }
+        
+        # Partnership type of each partnership pattern (anything else is a general partnership)
+        self._partnership_type_map = {
+            'integration': 'technical_integration',
+            'third party': 'technical_integration',
+            'api': 'technical_integration',
+            'reseller': 'distribution_partnership',
+            'distributor': 'distribution_partnership',
+            'channel partner': 'distribution_partnership',
+            'strategic alliance': 'strategic_alliance',
+            'joint venture': 'strategic_alliance',
+            'collaboration': 'strategic_alliance'
+        }
+        
+        self._index_signal_patterns()
+        
+        # Page content hash -> page-independent scan results, least recently used first
+        self._page_scan_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        
+        # Process pool for scanning large batches of pages, started on first use
+        self._scan_pool: Optional[ProcessPoolExecutor] = None
+    
+    def _index_signal_patterns(self) -> None:
+        """Group the signal pattern tables by bucket and build their automaton"""
+        # Interned, so every signal entry of a pattern shares one string
+        self.strategic_signals, self.technology_trends, self.market_signals, self.job_patterns = (
+            {sys.intern(signal_type): [sys.intern(pattern) for pattern in patterns]
+             for signal_type, patterns in pattern_groups.items()}
+            for pattern_groups in (self.strategic_signals, self.technology_trends,
+                                   self.market_signals, self.job_patterns)
+        )
+        
+        # Pattern groups by the signals bucket they fill, in extraction order
+        self._pattern_groups = (
+            ('signal_categories', self.strategic_signals),
+            ('technology_trends', self.technology_trends),
+            ('market_signals', self.market_signals),
+            ('job_postings', self.job_patterns)
+        )
+        self._pattern_automaton = self._build_pattern_automaton()
+    
+    def _build_pattern_automaton(self) -> Optional['ahocorasick.Automaton']:
+        """Build one automaton over every signal pattern (None without pyahocorasick)"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for _, pattern_groups in self._pattern_groups:
+            for patterns in pattern_groups.values():
+                for pattern in patterns:
+                    automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return automaton
     
     def analyze_competitor_vision(
         self, 
@@ -210,12 +489,24 @@ class VisionAnalyzer:
             # Analyze strategic partnerships
             partnership_analysis = self._analyze_strategic_partnerships(strategic_signals)
             
-            # Generate AI-powered vision insights
-            ai_insights = self._generate_vision_insights(
-                competitor_name, strategic_signals, roadmap_analysis,
-                technology_analysis, market_analysis, hiring_analysis,
-                partnership_analysis, country_context
-            )
+            # Generate AI-powered vision insights in the background (nothing to ask about without
+            # any signals) while the timeline predictions and confidence scores, which the prompt
+            # does not use, are computed
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                ai_future = None
+                if self._count_pattern_signals(strategic_signals):
+                    ai_future = executor.submit(
+                        self._generate_vision_insights,
+                        competitor_name, strategic_signals, roadmap_analysis,
+                        technology_analysis, market_analysis, hiring_analysis,
+                        partnership_analysis, country_context
+                    )
+                else:
+                    self.logger.info(f"No strategic signals found for {competitor_name}, skipping AI vision insights")
+                
+                timeline_predictions = self._generate_timeline_predictions(strategic_signals)
+                confidence_scores = self._calculate_confidence_scores(strategic_signals)
+                ai_insights = ai_future.result() if ai_future is not None else {}
             
             # Compile comprehensive analysis
             analysis_result = {
@@ -231,8 +522,8 @@ class VisionAnalyzer:
                 'strategic_predictions': ai_insights.get('strategic_predictions', {}),
                 'competitive_threats': ai_insights.get('competitive_threats', []),
                 'recommendations': ai_insights.get('recommendations', []),
-                'timeline_predictions': self._generate_timeline_predictions(strategic_signals),
-                'confidence_scores': self._calculate_confidence_scores(strategic_signals)
+                'timeline_predictions': timeline_predictions,
+                'confidence_scores': confidence_scores
             }
             
             self.logger.info(f"Vision analysis completed for {competitor_name}")
@@ -260,134 +551,207 @@ class VisionAnalyzer:
             'keyword_frequency': defaultdict(int)
         }
         
-        for page in scraped_content:
-            if not page.get('content'):
-                continue
-                
-            content = page['content'].lower()
+        # One extraction time shared by every signal of this run
+        extracted_at = datetime.now().isoformat()
+        
+        pages = [page for page in scraped_content if page.get('content')]
+        
+        # Scan once per distinct page (in a process pool for large batches)
+        scans = self._get_page_scans([page['content'] for page in pages])
+        
+        for page, scan in zip(pages, scans):
             page_category = page.get('category', 'unknown')
             
-            # Categorize content sources
-            if page_category in ['blog', 'news']:
-                signals['content_sources']['blog_posts'].append(page)
-            elif 'press' in content or 'announcement' in content:
-                signals['content_sources']['press_releases'].append(page)
-            elif page_category == 'careers':
-                signals['content_sources']['career_pages'].append(page)
-            elif page_category == 'about':
-                signals['content_sources']['about_pages'].append(page)
-            
-            # Extract strategic signals
-            self._extract_signal_patterns(content, signals, page)
-            
-            # Extract technology trends
-            self._extract_technology_trends(content, signals, page)
+            # Categorize content sources; blog and news pages take precedence over press mentions
+            source = self._category_to_source.get(page_category)
+            if source != 'blog_posts' and scan['mentions_press']:
+                source = 'press_releases'
+            if source:
+                signals['content_sources'][source].append(page)
             
-            # Extract market signals
-            self._extract_market_signals(content, signals, page)
-            
-            # Extract job posting signals
-            self._extract_job_signals(content, signals, page)
+            # Extract strategic signals, technology trends, market signals and job posting signals
+            self._add_pattern_signals(scan['patterns'], signals, page, extracted_at)
             
             # Extract timeline information
-            self._extract_timeline_signals(content, signals, page)
+            self._add_timeline_signals(scan['timeline'], signals, page, extracted_at)
         
         return signals
     
-    def _extract_signal_patterns(self, content: str, signals: Dict[str, Any], page: Dict[str, Any]) -> None:
-        """Extract strategic signal patterns from content."""
-        for signal_type, patterns in self.strategic_signals.items():
-            for pattern in patterns:
-                if pattern in content:
-                    context = self._extract_context(content, pattern)
-                    signals['signal_categories'][signal_type].append({
-                        'pattern': pattern,
-                        'context': context,
-                        'page_url': page.get('url', ''),
-                        'page_title': page.get('title', ''),
-                        'page_category': page.get('category', 'unknown'),
-                        'extracted_at': datetime.now().isoformat()
-                    })
-                    signals['keyword_frequency'][pattern] += 1
-    
-    def _extract_technology_trends(self, content: str, signals: Dict[str, Any], page: Dict[str, Any]) -> None:
-        """Extract technology trend indicators from content."""
-        for trend_type, patterns in self.technology_trends.items():
-            for pattern in patterns:
-                if pattern in content:
-                    context = self._extract_context(content, pattern)
-                    signals['technology_trends'][trend_type].append({
-                        'pattern': pattern,
-                        'context': context,
-                        'page_url': page.get('url', ''),
-                        'page_title': page.get('title', ''),
-                        'page_category': page.get('category', 'unknown'),
-                        'extracted_at': datetime.now().isoformat()
-                    })
+    def _find_patterns(self, content: str) -> Dict[str, int]:
+        """Index of the first occurrence of every signal pattern found in content"""
+        found = {}
+        if self._pattern_automaton is not None:
+            for end_index, pattern in self._pattern_automaton.iter(content):
+                if pattern not in found:
+                    found[pattern] = end_index - len(pattern) + 1
+            return found
+        
+        for _, pattern_groups in self._pattern_groups:
+            for patterns in pattern_groups.values():
+                for pattern in patterns:
+                    if pattern not in found:
+                        index = content.find(pattern)
+                        if index != -1:
+                            found[pattern] = index
+        return found
     
-    def _extract_market_signals(self, content: str, signals: Dict[str, Any], page: Dict[str, Any]) -> None:
-        """Extract market expansion signals from content."""
-        for signal_type, patterns in self.market_signals.items():
-            for pattern in patterns:
-                if pattern in content:
-                    context = self._extract_context(content, pattern)
-                    signals['market_signals'][signal_type].append({
-                        'pattern': pattern,
-                        'context': context,
-                        'page_url': page.get('url', ''),
-                        'page_title': page.get('title', ''),
-                        'page_category': page.get('category', 'unknown'),
-                        'extracted_at': datetime.now().isoformat()
-                    })
+    def _get_page_scans(self, contents: List[str]) -> List[Dict[str, Any]]:
+        """Pattern and timeline hits for each page, cached by content hash"""
+        keys = [self._content_key(content) for content in contents]
+        
+        scans = []
+        missing = {}
+        for key, content in zip(keys, contents):
+            scan = self._page_scan_cache.get(key)
+            if scan is not None:
+                self._page_scan_cache.move_to_end(key)
+            else:
+                missing.setdefault(key, content)
+            scans.append(scan)
+        
+        if missing:
+            scanned = dict(zip(missing, self._scan_pages(list(missing.values()))))
+            for key, scan in scanned.items():
+                self._page_scan_cache[key] = scan
+            while len(self._page_scan_cache) > _PAGE_SCAN_CACHE_SIZE:
+                self._page_scan_cache.popitem(last=False)
+            scans = [scan if scan is not None else scanned[key] for key, scan in zip(keys, scans)]
+        
+        return scans
     
-    def _extract_job_signals(self, content: str, signals: Dict[str, Any], page: Dict[str, Any]) -> None:
-        """Extract job posting signals from content."""
-        for role_type, patterns in self.job_patterns.items():
-            for pattern in patterns:
-                if pattern in content:
-                    context = self._extract_context(content, pattern)
-                    signals['job_postings'][role_type].append({
-                        'pattern': pattern,
-                        'context': context,
-                        'page_url': page.get('url', ''),
-                        'page_title': page.get('title', ''),
-                        'page_category': page.get('category', 'unknown'),
-                        'extracted_at': datetime.now().isoformat()
-                    })
+    @staticmethod
+    def _content_key(content: str) -> str:
+        """Cache key for page content or an analysis digest (a 128-bit hash either way)"""
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(content)
+        return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
     
-    def _extract_timeline_signals(self, content: str, signals: Dict[str, Any], page: Dict[str, Any]) -> None:
-        """Extract timeline-related signals from content."""
-        timeline_patterns = [
-            r'(q[1-4]\s+20\d{2})', r'(quarter\s+[1-4]\s+20\d{2})', r'(20\d{2})',
-            r'(next\s+year)', r'(coming\s+months)', r'(this\s+year)',
-            r'(by\s+20\d{2})', r'(in\s+20\d{2})', r'(launch\s+in\s+20\d{2})',
-            r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+20\d{2}',
-            r'(early\s+20\d{2})', r'(mid\s+20\d{2})', r'(late\s+20\d{2})',
-            r'(h[1-2]\s+20\d{2})', r'(first\s+half\s+20\d{2})', r'(second\s+half\s+20\d{2})'
-        ]
-        
-        for pattern in timeline_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                timeline_info = {
-                    'timeline': match.group(1),
-                    'context': self._extract_context(content, match.group(1)),
-                    'page_url': page.get('url', ''),
-                    'page_title': page.get('title', ''),
-                    'page_category': page.get('category', 'unknown'),
-                    'extracted_at': datetime.now().isoformat()
-                }
-                signals['signal_timeline'].append(timeline_info)
+    def _scan_pages(self, contents: List[str]) -> List[Dict[str, Any]]:
+        """Scan pages, in the process pool when there are enough of them"""
+        scan_pool = self._get_scan_pool() if len(contents) >= PARALLEL_SCAN_THRESHOLD else None
+        if scan_pool is not None:
+            try:
+                chunksize = max(1, len(contents) // (4 * (os.cpu_count() or 1)))
+                scans = list(scan_pool.map(_scan_page, contents, chunksize=chunksize))
+                # Unpickled hits carry fresh copies of the pattern strings; swap in the interned ones
+                for scan in scans:
+                    scan['patterns'] = [
+                        (sys.intern(bucket), sys.intern(signal_type), sys.intern(pattern), context)
+                        for bucket, signal_type, pattern, context in scan['patterns']
+                    ]
+                return scans
+            except BrokenProcessPool as e:
+                self.logger.warning(f"Scan pool unavailable, scanning pages in process: {str(e)}")
+                self._discard_scan_pool(scan_pool)
+        
+        return [self._scan_page(content) for content in contents]
+    
+    def _scan_page(self, content: str) -> Dict[str, Any]:
+        """Pattern and timeline hits of one page, and whether it mentions press"""
+        # Lowercased here, one page at a time; every extractor and context slice works on this copy
+        content = content.lower()
+        return {
+            'patterns': self._extract_pattern_signals(content),
+            'timeline': self._extract_timeline_signals(content),
+            'mentions_press': 'press' in content or 'announcement' in content
+        }
+    
+    def _get_scan_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the scan pool, starting it on first use (None if processes are unavailable)"""
+        if self._scan_pool is None:
+            try:
+                self._scan_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    initializer=_init_scan_worker,
+                    initargs=((self.strategic_signals, self.technology_trends,
+                               self.market_signals, self.job_patterns),)
+                )
+            except OSError as e:
+                self.logger.warning(f"Scan pool unavailable, scanning pages in process: {str(e)}")
+        return self._scan_pool
+    
+    def _discard_scan_pool(self, scan_pool: ProcessPoolExecutor) -> None:
+        """Drop a broken scan pool so the next batch starts a fresh one"""
+        if self._scan_pool is scan_pool:
+            self._scan_pool = None
+            scan_pool.shutdown(wait=False)
     
-    def _extract_context(self, content: str, keyword: str) -> str:
-        """Extract context around a keyword mention."""
-        keyword_index = content.lower().find(keyword.lower())
+    def close(self) -> None:
+        """Shut down the scan pool and close the insights cache"""
+        if self._scan_pool is not None:
+            self._scan_pool.shutdown()
+            self._scan_pool = None
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+    
+    def _extract_pattern_signals(self, content: str) -> List[Tuple[str, str, str, str]]:
+        """Extract strategic, technology, market and job signal patterns from content.
+        
+        Returns (bucket, signal type, pattern, context) tuples in configured order.
+        """
+        found = self._find_patterns(content)
+        if not found:
+            return []
+        
+        hits = []
+        for bucket, pattern_groups in self._pattern_groups:
+            for signal_type, patterns in pattern_groups.items():
+                for pattern in patterns:
+                    if pattern in found:
+                        context = self._extract_context(content, found[pattern], len(pattern))
+                        hits.append((bucket, signal_type, pattern, context))
+        return hits
+    
+    def _extract_timeline_signals(self, content: str) -> List[Tuple[str, str]]:
+        """Extract timeline-related signals from content as (timeline, context) tuples."""
+        has_year = _YEAR_RE.search(content) is not None
+        
+        hits = []
+        for pattern, needs_year in _TIMELINE_RES:
+            if needs_year and not has_year:
+                continue
+            for match in pattern.finditer(content):
+                timeline = match.group(1)
+                hits.append((timeline, self._extract_context(content, match.start(1), len(timeline))))
+        return hits
+    
+    def _add_pattern_signals(self, hits: List[Tuple[str, str, str, str]], signals: Dict[str, Any],
+                             page: Dict[str, Any], extracted_at: str) -> None:
+        """Record a page's signal pattern hits."""
+        for bucket, signal_type, pattern, context in hits:
+            signals[bucket][signal_type].append({
+                'pattern': pattern,
+                'context': context,
+                'page_url': page.get('url', ''),
+                'page_title': page.get('title', ''),
+                'page_category': page.get('category', 'unknown'),
+                'extracted_at': extracted_at
+            })
+            if bucket == 'signal_categories':
+                signals['keyword_frequency'][pattern] += 1
+    
+    def _add_timeline_signals(self, hits: List[Tuple[str, str]], signals: Dict[str, Any],
+                              page: Dict[str, Any], extracted_at: str) -> None:
+        """Record a page's timeline hits."""
+        for timeline, context in hits:
+            signals['signal_timeline'].append({
+                'timeline': timeline,
+                'context': context,
+                'page_url': page.get('url', ''),
+                'page_title': page.get('title', ''),
+                'page_category': page.get('category', 'unknown'),
+                'extracted_at': extracted_at
+            })
+    
+    def _extract_context(self, content: str, keyword_index: int, keyword_length: int) -> str:
+        """Extract context around a keyword mention at keyword_index (-1 when not found)."""
         if keyword_index == -1:
             return ""
         
         # Get surrounding context (150 characters before and after)
         start = max(0, keyword_index - 150)
-        end = min(len(content), keyword_index + len(keyword) + 150)
+        end = min(len(content), keyword_index + keyword_length + 150)
         
         return content[start:end].strip()
     
@@ -409,19 +773,15 @@ class VisionAnalyzer:
             context = signal['context']
             
             # Categorize by feature type
-            if any(tech in context for tech in ['ai', 'machine learning', 'intelligent', 'smart']):
-                roadmap_analysis['feature_categories']['ai_features'] += 1
-            elif any(mobile in context for mobile in ['mobile', 'app', 'ios', 'android']):
-                roadmap_analysis['feature_categories']['mobile_features'] += 1
-            elif any(integration in context for integration in ['api', 'integration', 'connect']):
-                roadmap_analysis['feature_categories']['integration_features'] += 1
-            elif any(analytics in context for analytics in ['analytics', 'reporting', 'dashboard']):
-                roadmap_analysis['feature_categories']['analytics_features'] += 1
-            else:
-                roadmap_analysis['feature_categories']['general_features'] += 1
+            feature_category = next(
+                (category for category, keywords in self._feature_category_keywords
+                 if any(keyword in context for keyword in keywords)),
+                'general_features'
+            )
+            roadmap_analysis['feature_categories'][feature_category] += 1
             
             # Extract specific features
-            if pattern in ['upcoming features', 'coming soon', 'next release']:
+            if pattern in self._upcoming_feature_indicators:
                 roadmap_analysis['upcoming_features'].append({
                     'feature_indicator': pattern,
                     'context': context,
@@ -430,7 +790,7 @@ class VisionAnalyzer:
                 })
             
             # Extract product launches
-            if pattern in ['launching', 'product launch', 'introducing']:
+            if pattern in self._launch_indicators:
                 roadmap_analysis['product_launches'].append({
                     'launch_indicator': pattern,
                     'context': context,
@@ -565,7 +925,7 @@ class VisionAnalyzer:
     def _analyze_strategic_partnerships(self, strategic_signals: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze strategic partnership signals from strategic signals."""
         partnership_analysis = {
-            'partnership_types': defaultdict(int),
+            'partnership_types': Counter(),
             'partnership_focus': [],
             'strategic_alliances': [],
             'ecosystem_strategy': {},
@@ -575,22 +935,18 @@ class VisionAnalyzer:
         # Analyze partnership signals
         partnership_signals = strategic_signals['signal_categories'].get('strategic_partnerships', [])
         
+        # Categorize partnership types
+        partnership_analysis['partnership_types'].update(
+            self._partnership_type_map.get(signal['pattern'], 'general_partnership')
+            for signal in partnership_signals
+        )
+        
         for signal in partnership_signals:
             pattern = signal['pattern']
             context = signal['context']
             
-            # Categorize partnership types
-            if pattern in ['integration', 'third party', 'api']:
-                partnership_analysis['partnership_types']['technical_integration'] += 1
-            elif pattern in ['reseller', 'distributor', 'channel partner']:
-                partnership_analysis['partnership_types']['distribution_partnership'] += 1
-            elif pattern in ['strategic alliance', 'joint venture', 'collaboration']:
-                partnership_analysis['partnership_types']['strategic_alliance'] += 1
-            else:
-                partnership_analysis['partnership_types']['general_partnership'] += 1
-            
             # Extract strategic alliances
-            if pattern in ['strategic alliance', 'joint venture', 'collaboration']:
+            if pattern in self._strategic_alliance_indicators:
                 partnership_analysis['strategic_alliances'].append({
                     'alliance_type': pattern,
                     'context': context,
@@ -615,25 +971,27 @@ class VisionAnalyzer:
         if not signals:
             return maturity_indicators
         
-        # Analyze context for maturity indicators
-        contexts = [signal['context'] for signal in signals]
-        combined_context = ' '.join(contexts).lower()
-        
-        # Assess maturity level
-        if any(indicator in combined_context for indicator in ['beta', 'testing', 'preview', 'development']):
-            maturity_indicators['maturity_level'] = 'early_stage'
-        elif any(indicator in combined_context for indicator in ['launch', 'release', 'available', 'introducing']):
-            maturity_indicators['maturity_level'] = 'market_ready'
-        elif any(indicator in combined_context for indicator in ['established', 'proven', 'mature', 'stable']):
-            maturity_indicators['maturity_level'] = 'mature'
-        
-        # Assess implementation stage
-        if any(indicator in combined_context for indicator in ['planning', 'roadmap', 'future']):
-            maturity_indicators['implementation_stage'] = 'planning'
-        elif any(indicator in combined_context for indicator in ['development', 'building', 'creating']):
-            maturity_indicators['implementation_stage'] = 'development'
-        elif any(indicator in combined_context for indicator in ['deployed', 'live', 'production']):
-            maturity_indicators['implementation_stage'] = 'production'
+        # Analyze context for maturity indicators, one scan per context; stop early once
+        # the first-ranked maturity level and implementation stage have both turned up
+        found = set()
+        for signal in signals:
+            found |= _scan_context(signal['context'])[1]
+            if not found.isdisjoint(_MATURITY_LEVELS[0][1]) and not found.isdisjoint(_IMPLEMENTATION_STAGES[0][1]):
+                break
+        
+        maturity_level = next(
+            (level for level, keywords in _MATURITY_LEVELS if any(keyword in found for keyword in keywords)),
+            None
+        )
+        if maturity_level:
+            maturity_indicators['maturity_level'] = maturity_level
+        
+        implementation_stage = next(
+            (stage for stage, keywords in _IMPLEMENTATION_STAGES if any(keyword in found for keyword in keywords)),
+            None
+        )
+        if implementation_stage:
+            maturity_indicators['implementation_stage'] = implementation_stage
         
         return maturity_indicators
     
@@ -642,17 +1000,10 @@ class VisionAnalyzer:
         geographic_targets = []
         
         for signal in signals:
-            context = signal['context'].lower()
+            context, found = _scan_context(signal['context'])
             
-            # Common geographic indicators
-            geographic_keywords = [
-                'europe', 'asia', 'north america', 'south america', 'africa', 'oceania',
-                'uk', 'germany', 'france', 'japan', 'china', 'india', 'australia',
-                'canada', 'mexico', 'brazil', 'singapore', 'malaysia', 'thailand'
-            ]
-            
-            for keyword in geographic_keywords:
-                if keyword in context:
+            for keyword in _GEOGRAPHIC_KEYWORDS:
+                if keyword in found:
                     geographic_targets.append({
                         'region': keyword,
                         'context': context,
@@ -666,17 +1017,10 @@ class VisionAnalyzer:
         industry_verticals = []
         
         for signal in signals:
-            context = signal['context'].lower()
+            context, found = _scan_context(signal['context'])
             
-            # Common industry indicators
-            industry_keywords = [
-                'retail', 'restaurant', 'hospitality', 'healthcare', 'education',
-                'manufacturing', 'e-commerce', 'professional services', 'franchise',
-                'enterprise', 'small business', 'startup'
-            ]
-            
-            for keyword in industry_keywords:
-                if keyword in context:
+            for keyword in _INDUSTRY_KEYWORDS:
+                if keyword in found:
                     industry_verticals.append({
                         'industry': keyword,
                         'context': context,
@@ -690,17 +1034,10 @@ class VisionAnalyzer:
         customer_segments = []
         
         for signal in signals:
-            context = signal['context'].lower()
-            
-            # Common customer segment indicators
-            segment_keywords = [
-                'small business', 'enterprise', 'startup', 'franchise', 'chain',
-                'independent', 'multi-location', 'single location', 'growing business',
-                'established business', 'high volume', 'boutique', 'specialty'
-            ]
+            context, found = _scan_context(signal['context'])
             
-            for keyword in segment_keywords:
-                if keyword in context:
+            for keyword in _SEGMENT_KEYWORDS:
+                if keyword in found:
                     customer_segments.append({
                         'segment': keyword,
                         'context': context,
@@ -713,72 +1050,44 @@ class VisionAnalyzer:
         """Extract partnership opportunities from signals."""
         partnership_opportunities = []
         
+        # Lowercased context and opportunity score of each distinct context, which the score depends on alone
+        scored = {}
         for signal in signals:
-            context = signal['context'].lower()
+            scored_context = scored.get(signal['context'])
+            if scored_context is None:
+                context = signal['context'].lower()
+                scored_context = scored[signal['context']] = (context, _context_confidence(context))
+            context, opportunity_score = scored_context
             
             # Extract specific partnership types
-            partnership_info = {
+            partnership_opportunities.append({
                 'type': signal['pattern'],
                 'context': context,
                 'source': signal['page_title'],
-                'opportunity_score': self._calculate_signal_confidence(signal['pattern'], context)
-            }
-            
-            partnership_opportunities.append(partnership_info)
+                'opportunity_score': opportunity_score
+            })
         
         return partnership_opportunities
     
     def _calculate_growth_indicator(self, signals: List[Dict[str, Any]]) -> str:
         """Calculate growth indicator based on hiring signals."""
-        signal_count = len(signals)
-        
-        if signal_count >= 5:
-            return 'high_growth'
-        elif signal_count >= 3:
-            return 'moderate_growth'
-        elif signal_count >= 1:
-            return 'low_growth'
-        else:
-            return 'no_growth'
+        return _GROWTH_INDICATORS[min(len(signals), len(_GROWTH_INDICATORS) - 1)]
     
     def _assess_strategic_importance(self, role_type: str, signals: List[Dict[str, Any]]) -> str:
         """Assess strategic importance of role type."""
-        importance_mapping = {
-            'leadership_roles': 'high',
-            'product_roles': 'high',
-            'data_roles': 'high',
-            'engineering_roles': 'medium',
-            'sales_marketing': 'medium'
-        }
-        
-        base_importance = importance_mapping.get(role_type, 'low')
-        
         # Adjust based on signal count
-        if len(signals) >= 5:
+        signal_count = len(signals)
+        if signal_count >= 5:
             return 'high'
-        elif len(signals) >= 3:
-            return 'medium' if base_importance == 'low' else base_importance
-        else:
-            return base_importance
+        
+        base_importance = self._role_importance.get(role_type, 'low')
+        if signal_count >= 3 and base_importance == 'low':
+            return 'medium'
+        return base_importance
     
     def _calculate_signal_confidence(self, pattern: str, context: str) -> float:
-        """Calculate confidence score for a signal."""
-        # Base confidence based on pattern specificity
-        base_confidence = 0.5
-        
-        # Adjust based on context richness
-        if len(context) > 100:
-            base_confidence += 0.2
-        
-        # Adjust based on specific keywords
-        if any(keyword in context for keyword in ['announced', 'confirmed', 'official']):
-            base_confidence += 0.2
-        
-        # Adjust based on timeline specificity
-        if any(timeline in context for timeline in ['2024', '2025', 'q1', 'q2', 'q3', 'q4']):
-            base_confidence += 0.1
-        
-        return min(1.0, base_confidence)
+        """Calculate confidence score for a signal (it depends on the context alone)."""
+        return _context_confidence(context)
     
     def _generate_timeline_predictions(self, strategic_signals: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate timeline predictions based on strategic signals."""
@@ -791,15 +1100,13 @@ class VisionAnalyzer:
             timeline = signal['timeline']
             context = signal['context']
             
-            # Predict timeline category
-            if any(keyword in context for keyword in ['launch', 'release', 'introduce']):
-                prediction_type = 'product_launch'
-            elif any(keyword in context for keyword in ['expansion', 'market', 'enter']):
-                prediction_type = 'market_expansion'
-            elif any(keyword in context for keyword in ['partnership', 'alliance', 'collaboration']):
-                prediction_type = 'strategic_partnership'
-            else:
-                prediction_type = 'general_development'
+            # Predict timeline category from one scan of the context
+            found = _context_keywords(context)
+            prediction_type = next(
+                (prediction for prediction, keywords in _PREDICTION_TYPES
+                 if any(keyword in found for keyword in keywords)),
+                'general_development'
+            )
             
             timeline_predictions.append({
                 'timeline': timeline,
@@ -835,19 +1142,42 @@ class VisionAnalyzer:
                 'country_context': country_context or {}
             }
             
-            # Get vision analysis prompt
-            vision_prompt = self.prompt_designer.get_vision_analysis_prompt(
+            # Reuse the insights of an earlier run over the same analysis
+            cache_key = self._insights_cache_key(analysis_context)
+            cached = self._lookup_insights(cache_key)
+            if cached is not None:
+                self.logger.info(f"Using cached vision insights for {competitor_name}")
+                return cached
+            
+            # Get vision analysis prompt split into the shared prefix and the
+            # per-competitor payload, with every analysis section in one request
+            prompt_prefix, prompt_payload = self.prompt_designer.get_vision_analysis_prompt_parts(
                 competitor_name, analysis_context
             )
             
             # Generate AI insights
             ai_response = self.ai_engine.analyze_with_prompt(
-                prompt=vision_prompt,
+                prompt=prompt_payload,
                 context=analysis_context,
-                analysis_type="vision_strategy"
+                analysis_type="vision_strategy",
+                system_prompt=prompt_prefix
             )
             
-            return ai_response
+            content = ai_response.get('content', '')
+            predictive_timeline = self._extract_section_items(content, 'predictive timeline')
+            
+            insights = {
+                'vision_insights': {
+                    'summary': content,
+                    'key_insights': ai_response.get('key_insights', [])
+                },
+                'strategic_predictions': {'predictive_timeline': predictive_timeline} if predictive_timeline else {},
+                'competitive_threats': self._extract_section_items(content, 'threat'),
+                'recommendations': ai_response.get('recommendations', [])
+            }
+            
+            self._store_insights(cache_key, insights)
+            return insights
             
         except Exception as e:
             self.logger.error(f"Error generating AI vision insights: {str(e)}")
@@ -858,6 +1188,101 @@ class VisionAnalyzer:
                 'recommendations': ['Unable to generate AI insights due to error']
             }
     
+    def _extract_section_items(self, content: str, heading: str) -> List[str]:
+        """Bulleted items under the first section of an AI response whose heading mentions heading."""
+        items = []
+        in_section = False
+        
+        for line in content.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            
+            is_item = line[:2] in ('- ', '• ', '* ')
+            if not in_section:
+                # Enter the section at its heading
+                in_section = not is_item and heading in line.lower()
+            elif is_item:
+                items.append(line[2:].strip())
+            else:
+                # Stop at the next section heading
+                break
+        
+        return items[:10]
+    
+    def _insights_cache_key(self, analysis_context: Dict[str, Any]) -> str:
+        """Digest of everything the AI vision insights depend on, ignoring extraction times"""
+        def stable(value: Any) -> Any:
+            if isinstance(value, dict):
+                return {key: stable(item) for key, item in value.items() if key != 'extracted_at'}
+            if isinstance(value, (list, tuple)):
+                return [stable(item) for item in value]
+            return value
+        
+        canonical = json.dumps([_INSIGHTS_CACHE_VERSION, self.model_name, stable(analysis_context)],
+                               sort_keys=True, default=str)
+        return self._content_key(canonical)
+    
+    def _get_cache_db(self) -> Optional[sqlite3.Connection]:
+        """Open the insights cache database on first use"""
+        if not self.cache_path:
+            return None
+        
+        if self._cache_db is None:
+            try:
+                directory = os.path.dirname(self.cache_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                
+                # Used from the thread generating insights, one analysis at a time
+                db = sqlite3.connect(self.cache_path, check_same_thread=False)
+                db.execute(
+                    'CREATE TABLE IF NOT EXISTS vision_insights ('
+                    'key TEXT PRIMARY KEY, data TEXT NOT NULL, timestamp REAL NOT NULL)'
+                )
+                db.commit()
+                self._cache_db = db
+            except (sqlite3.Error, OSError) as e:
+                self.logger.warning(f"Disabling vision insights cache: {str(e)}")
+                self.cache_path = None
+                return None
+        
+        return self._cache_db
+    
+    def _lookup_insights(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return AI vision insights cached within cache_duration, or None"""
+        db = self._get_cache_db()
+        if db is None:
+            return None
+        
+        try:
+            row = db.execute(
+                'SELECT data, timestamp FROM vision_insights WHERE key = ?', (cache_key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to read vision insights cache entry: {str(e)}")
+            return None
+        
+        if row is None or time.time() - row[1] >= self.cache_duration:
+            return None
+        
+        return json.loads(row[0])
+    
+    def _store_insights(self, cache_key: str, insights: Dict[str, Any]) -> None:
+        """Persist AI vision insights under their analysis digest"""
+        db = self._get_cache_db()
+        if db is None:
+            return
+        
+        try:
+            db.execute(
+                'INSERT OR REPLACE INTO vision_insights (key, data, timestamp) VALUES (?, ?, ?)',
+                (cache_key, json.dumps(insights, default=str), time.time())
+            )
+            db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to persist vision insights cache entry: {str(e)}")
+    
     def _calculate_confidence_scores(self, strategic_signals: Dict[str, Any]) -> Dict[str, float]:
         """Calculate confidence scores for different aspects of the analysis."""
         scores = {
@@ -876,25 +1301,23 @@ class VisionAnalyzer:
         market_signals = strategic_signals.get('market_signals', {})
         job_postings = strategic_signals.get('job_postings', {})
         
+        # Signal counts per bucket, each counted once
+        category_total = sum(len(signals) for signals in signal_categories.values())
+        technology_total = sum(len(signals) for signals in technology_trends.values())
+        market_total = sum(len(signals) for signals in market_signals.values())
+        hiring_total = sum(len(signals) for signals in job_postings.values())
+        
         # Individual confidence scores
         scores['roadmap_confidence'] = min(1.0, 
             len(signal_categories.get('product_roadmap', [])) * 0.2)
-        scores['technology_confidence'] = min(1.0, 
-            sum(len(signals) for signals in technology_trends.values()) * 0.1)
-        scores['market_confidence'] = min(1.0, 
-            sum(len(signals) for signals in market_signals.values()) * 0.15)
-        scores['hiring_confidence'] = min(1.0, 
-            sum(len(signals) for signals in job_postings.values()) * 0.1)
+        scores['technology_confidence'] = min(1.0, technology_total * 0.1)
+        scores['market_confidence'] = min(1.0, market_total * 0.15)
+        scores['hiring_confidence'] = min(1.0, hiring_total * 0.1)
         scores['partnership_confidence'] = min(1.0, 
             len(signal_categories.get('strategic_partnerships', [])) * 0.2)
         
         # Data quality score
-        total_signals = (
-            sum(len(signals) for signals in signal_categories.values()) +
-            sum(len(signals) for signals in technology_trends.values()) +
-            sum(len(signals) for signals in market_signals.values()) +
-            sum(len(signals) for signals in job_postings.values())
-        )
+        total_signals = category_total + technology_total + market_total + hiring_total
         
         scores['data_quality'] = min(1.0, total_signals * 0.02)
         
@@ -903,6 +1326,14 @@ class VisionAnalyzer:
         
         return scores
     
+    def _count_pattern_signals(self, strategic_signals: Dict[str, Any]) -> int:
+        """Count strategic, technology, market and job signals"""
+        return sum(
+            len(signals)
+            for bucket, _ in self._pattern_groups
+            for signals in strategic_signals.get(bucket, {}).values()
+        )
+    
     def _generate_error_response(self, competitor_name: str, error_message: str) -> Dict[str, Any]:
         """Generate error response for failed analysis."""
         return {
@@ -929,19 +1360,24 @@ class VisionAnalyzer:
             return f"Vision analysis failed: {analysis_result['error']}"
         
         competitor = analysis_result.get('competitor', 'Unknown')
+        confidence_scores = analysis_result.get('confidence_scores') or {}
+        roadmap = analysis_result.get('product_roadmap') or {}
+        technology = analysis_result.get('technology_investments') or {}
+        market = analysis_result.get('market_expansion') or {}
+        hiring = analysis_result.get('hiring_patterns') or {}
         
         report = f"""
 # Vision Analysis Report: {competitor}
 
 ## Executive Summary
 - **Analysis Date**: {analysis_result.get('analysis_date', 'Unknown')}
-- **Overall Confidence**: {analysis_result.get('confidence_scores', {}).get('overall_confidence', 0):.2f}
+- **Overall Confidence**: {confidence_scores.get('overall_confidence', 0):.2f}
 
 ## Strategic Signals Summary
-- **Product Roadmap Signals**: {len(analysis_result.get('product_roadmap', {}).get('upcoming_features', []))}
-- **Technology Investment Areas**: {len(analysis_result.get('technology_investments', {}).get('investment_areas', []))}
-- **Market Expansion Signals**: {len(analysis_result.get('market_expansion', {}).get('geographic_targets', []))}
-- **Hiring Growth Areas**: {len(analysis_result.get('hiring_patterns', {}).get('growth_areas', []))}
+- **Product Roadmap Signals**: {len(roadmap.get('upcoming_features', ()))}
+- **Technology Investment Areas**: {len(technology.get('investment_areas', ()))}
+- **Market Expansion Signals**: {len(market.get('geographic_targets', ()))}
+- **Hiring Growth Areas**: {len(hiring.get('growth_areas', ()))}
 
 ## AI-Generated Vision Insights
 {self._format_vision_insights(analysis_result.get('vision_insights', {}))}
@@ -963,47 +1399,33 @@ class VisionAnalyzer:
         if insights.get('error'):
             return f"Vision insights unavailable: {insights['error']}"
         
-        formatted = ""
-        for key, value in insights.items():
-            if isinstance(value, str):
-                formatted += f"- **{key.replace('_', ' ').title()}**: {value}\n"
-            elif isinstance(value, list):
-                formatted += f"- **{key.replace('_', ' ').title()}**: {', '.join(value)}\n"
-        
-        return formatted
+        return self._format_fields(insights)
     
     def _format_strategic_predictions(self, predictions: Dict[str, Any]) -> str:
         """Format strategic predictions for the report."""
         if predictions.get('error'):
             return f"Strategic predictions unavailable: {predictions['error']}"
         
-        formatted = ""
-        for key, value in predictions.items():
-            if isinstance(value, str):
-                formatted += f"- **{key.replace('_', ' ').title()}**: {value}\n"
-            elif isinstance(value, list):
-                formatted += f"- **{key.replace('_', ' ').title()}**: {', '.join(value)}\n"
-        
-        return formatted
+        return self._format_fields(predictions)
+    
+    def _format_fields(self, fields: Dict[str, Any]) -> str:
+        """Format text and list fields as a bulleted list, skipping anything else."""
+        return ''.join(
+            f"- **{_field_label(key)}**: {value if isinstance(value, str) else ', '.join(value)}\n"
+            for key, value in fields.items()
+            if isinstance(value, (str, list))
+        )
     
     def _format_competitive_threats(self, threats: List[str]) -> str:
         """Format competitive threats for the report."""
         if not threats:
             return "No competitive threats identified."
         
-        formatted = ""
-        for i, threat in enumerate(threats, 1):
-            formatted += f"{i}. {threat}\n"
-        
-        return formatted
+        return ''.join(f"{i}. {threat}\n" for i, threat in enumerate(threats, 1))
     
     def _format_recommendations(self, recommendations: List[str]) -> str:
         """Format recommendations for the report."""
         if not recommendations:
             return "No recommendations available."
         
-        formatted = ""
-        for i, rec in enumerate(recommendations, 1):
-            formatted += f"{i}. {rec}\n"
-        
-        return formatted 
\ No newline at end of file
+        return ''.join(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1)) 
\ No newline at end of file